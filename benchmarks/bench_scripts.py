@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the Python scripts against synthetic company workloads.
+
+Generates fixtures (mixed-language repos, proposal streams, multi-MB
+handoffs, a task store with thousands of tasks) under a work directory,
+then times each script entry point as a separate process:
+
+- cold: script caches under .company/cache removed and a fresh bytecode
+  cache, so every run pays for compiling, parsing and rebuilding caches
+- warm: one untimed priming run, then repeated runs with caches in place
+
+TaskUpdate hooks are also timed in-process over thousands of updates, to
+separate per-update cost from interpreter start. Results are written as
+JSON; --compare flags entries whose median regressed against an earlier
+results file and exits 1.
+
+Fixtures are kept between runs and only regenerated when their parameters
+change. The 100k and 1M file repos are opt-in, as they take a while to
+create:
+
+Usage:
+    python benchmarks/bench_scripts.py [--repeat N] [--repo-files 1000 100000 1000000]
+        [--only NAME ...] [--workdir DIR] [--output FILE]
+        [--compare BASELINE] [--tolerance 0.2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / 'scripts'
+TEMPLATES_DIR = REPO_ROOT / 'templates'
+
+FIXTURE_MARKER = '.bench-fixture.json'
+
+# Script caches a cold run starts without
+CACHE_PATHS = ['.company/cache', '.company/sync-state.json', '.company/sync-state.db',
+               '.company/proposals/queue.json', '.company/inboxes']
+
+ROLES = ['tech-lead', 'senior-dev', 'developer', 'qa', 'orchestrator', 'architect']
+
+SOURCE_SNIPPETS = {
+    'py': ["import django\nfrom django.db import models\n",
+           "from fastapi import FastAPI\napp = FastAPI()\n",
+           "import pandas as pd\nimport numpy as np\n",
+           "import torch\nfrom sklearn.model_selection import train_test_split\n",
+           "import boto3\nclient = boto3.client('s3')\n"],
+    'js': ["const express = require('express');\n",
+           "import React from 'react';\n",
+           "const { MongoClient } = require('mongodb');\n"],
+    'jsx': ["import React, { useState } from 'react';\n"],
+    'ts': ["import { Injectable } from '@nestjs/common';\n",
+           "import { PrismaClient } from '@prisma/client';\n",
+           "import Redis from 'ioredis';\n"],
+    'tsx': ["import { useQuery } from '@tanstack/react-query';\n",
+            "import Link from 'next/link';\n"],
+    'go': ["package main\n\nimport \"github.com/gin-gonic/gin\"\n",
+           "package store\n\nimport \"database/sql\"\n\nimport _ \"github.com/lib/pq\"\n"],
+    'rs': ["use tokio::runtime::Runtime;\n", "use actix_web::{web, App};\n"],
+    'md': ["# Notes\n\nNothing to see here.\n"],
+}
+
+FILLER = "    # filler line to give the file a realistic size\n"
+
+# --- Fixtures ---
+
+def _fixture_ready(path, params):
+    """True if `path` already holds a fixture built with `params`."""
+    try:
+        return json.loads((path / FIXTURE_MARKER).read_text()) == params
+    except (OSError, ValueError):
+        return False
+
+def _mark_fixture(path, params):
+    (path / FIXTURE_MARKER).write_text(json.dumps(params))
+
+def _install_company(path):
+    """Create a .company directory with the template governance and config."""
+    company = path / '.company'
+    company.mkdir(parents=True, exist_ok=True)
+    for name in ('governance-matrix.json', 'config.json', 'roster.json'):
+        shutil.copy(TEMPLATES_DIR / name, company / name)
+
+def build_repo(path, file_count, seed=1):
+    """A mixed-language repo with `file_count` source files, plus ignored dirs."""
+    params = {'kind': 'repo', 'files': file_count, 'seed': seed}
+    if _fixture_ready(path, params):
+        return path
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True)
+    _install_company(path)
+
+    rng = random.Random(seed)
+    extensions = list(SOURCE_SNIPPETS)
+    for n in range(file_count):
+        directory = path / 'src' / f'pkg{n // 1000:04d}'
+        if n % 1000 == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+        ext = rng.choice(extensions)
+        body = rng.choice(SOURCE_SNIPPETS[ext]) + FILLER * rng.randint(5, 200)
+        (directory / f'mod{n}.{ext}').write_text(body)
+
+    # Dependencies and build output the walker should skip
+    for ignored in ('node_modules/left-pad', 'dist'):
+        directory = path / ignored
+        directory.mkdir(parents=True, exist_ok=True)
+        for n in range(min(file_count // 10, 1000)):
+            (directory / f'index{n}.js').write_text("module.exports = require('react');\n")
+
+    (path / 'package.json').write_text(json.dumps({
+        'name': 'bench-fixture',
+        'dependencies': {'react': '^18.0.0', 'express': '^4.0.0', 'pg': '^8.0.0'},
+        'devDependencies': {'jest': '^29.0.0', 'typescript': '^5.0.0'},
+    }, indent=2))
+    _mark_fixture(path, params)
+    return path
+
+def _proposal(rng, n):
+    proposal_type = rng.choice(['create_task', 'create_task', 'escalate', 'request_expertise',
+                                'reject_handoff', 'scope_change', 'architecture_change'])
+    return {
+        'id': f'prop-{n}',
+        'proposal_type': proposal_type,
+        'from_role': rng.choice(ROLES),
+        'target_role': rng.choice(ROLES),
+        'timestamp': f'2026-01-01T00:{n // 60 % 60:02d}:{n % 60:02d}',
+        'payload': {'description': f'Synthetic proposal {n}'},
+    }
+
+def build_proposals(path, count, seed=2):
+    """A pending-proposal directory with `count` files, and the same as JSONL."""
+    params = {'kind': 'proposals', 'count': count, 'seed': seed}
+    if _fixture_ready(path, params):
+        return path
+    shutil.rmtree(path, ignore_errors=True)
+    _install_company(path)
+    pending = path / '.company/proposals/pending'
+    pending.mkdir(parents=True)
+
+    rng = random.Random(seed)
+    with open(path / 'proposals.jsonl', 'w') as stream:
+        for n in range(count):
+            proposal = _proposal(rng, n)
+            (pending / f'prop-{n:06d}.json').write_text(json.dumps(proposal, indent=2))
+            stream.write(json.dumps(proposal) + '\n')
+    _mark_fixture(path, params)
+    return path
+
+def build_handoff(path, megabytes, seed=3):
+    """A handoff document of about `megabytes` MB, mostly pasted logs."""
+    params = {'kind': 'handoff', 'megabytes': megabytes, 'seed': seed}
+    if _fixture_ready(path, params):
+        return path
+    shutil.rmtree(path, ignore_errors=True)
+    _install_company(path)
+
+    rng = random.Random(seed)
+    log_line = "2026-01-01T00:00:00Z INFO request id={} path=/api/items status=200 ms={}\n"
+    target = megabytes * 1024 * 1024
+    with open(path / 'handoff.md', 'w') as f:
+        f.write("# Handoff: developer -> qa\n\n## Context\n\nSynthetic handoff.\n\n")
+        f.write("## Deliverables\n\n- Items API\n\n## Test Logs\n\n```\n")
+        written = 0
+        while written < target:
+            line = log_line.format(rng.randint(0, 10**9), rng.randint(1, 500))
+            f.write(line)
+            written += len(line)
+        f.write("```\n\n## Acceptance Criteria\n\n- [ ] Items list\n- [x] Items create\n")
+        f.write("\n## Verification\n\n```bash\nnpm test\n```\n")
+    _mark_fixture(path, params)
+    return path
+
+def build_task_store(path, task_count, seed=4):
+    """A task store in the MCP task server's layout with chained dependencies."""
+    params = {'kind': 'tasks', 'count': task_count, 'seed': seed}
+    if _fixture_ready(path, params):
+        return path
+    shutil.rmtree(path, ignore_errors=True)
+    _install_company(path)
+    tasks_dir = path / '.company/tasks'
+    tasks_dir.mkdir(parents=True)
+
+    rng = random.Random(seed)
+    index = {'nextId': task_count + 1, 'tasks': []}
+    for n in range(1, task_count + 1):
+        blocked_by = [str(rng.randint(1, n - 1)) for _ in range(rng.randint(0, 2))] if n > 1 else []
+        task = {
+            'id': str(n),
+            'subject': f'Task {n}',
+            'description': '',
+            'status': rng.choice(['pending', 'pending', 'in_progress', 'completed']),
+            'owner': rng.choice(ROLES + [None]),
+            'blocks': [],
+            'blockedBy': sorted(set(blocked_by)),
+            'metadata': {},
+            'createdAt': '2026-01-01T00:00:00.000Z',
+            'updatedAt': '2026-01-01T00:00:00.000Z',
+        }
+        (tasks_dir / f'task-{n}.json').write_text(json.dumps(task, indent=2))
+        index['tasks'].append({'id': task['id'], 'subject': task['subject'],
+                               'status': task['status']})
+    (tasks_dir / 'index.json').write_text(json.dumps(index, indent=2))
+    _mark_fixture(path, params)
+    return path
+
+def task_updates(task_count, count, seed=5):
+    """Yield `count` synthetic (tool_input, role) TaskUpdate calls."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        tool_input = {'taskId': str(rng.randint(1, task_count))}
+        kind = rng.random()
+        if kind < 0.4:
+            tool_input['status'] = 'in_progress'
+        elif kind < 0.8:
+            tool_input['status'] = 'completed'
+        elif kind < 0.9:
+            tool_input['owner'] = rng.choice(ROLES)
+        else:
+            tool_input['subject'] = 'Renamed'
+        yield tool_input, rng.choice(ROLES)
+
+# --- Timing ---
+
+def summarize(name, mode, samples, **extra):
+    """Build a result entry from timings in seconds."""
+    ms = sorted(s * 1000 for s in samples)
+    result = {
+        'name': name,
+        'mode': mode,
+        'runs': len(ms),
+        'min_ms': round(ms[0], 3),
+        'median_ms': round(statistics.median(ms), 3),
+        'mean_ms': round(statistics.fmean(ms), 3),
+        'p95_ms': round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+        'max_ms': round(ms[-1], 3),
+    }
+    result.update(extra)
+    return result
+
+def _clear_caches(cwd):
+    for rel in CACHE_PATHS:
+        target = Path(cwd) / rel
+        if target.is_dir():
+            shutil.rmtree(target)
+        elif target.exists():
+            target.unlink()
+
+def _run_once(argv, cwd, env):
+    start = time.perf_counter()
+    proc = subprocess.run(argv, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE)
+    elapsed = time.perf_counter() - start
+    return elapsed, proc.returncode, proc.stderr.decode(errors='replace')
+
+def time_process(name, argv, cwd, repeat, cold_repeat, env=None, reset=None):
+    """
+    Time a script as a separate process, cold and warm.
+
+    `reset` runs before every run (e.g. to restore consumed input), in
+    addition to the cache clearing done before cold runs.
+    """
+    # Bytecode caching is part of what cold and warm runs compare
+    base_env = {k: v for k, v in os.environ.items()
+                if not k.startswith('COMPANY_') and k != 'PYTHONDONTWRITEBYTECODE'}
+    base_env.update(env or {})
+    results = []
+
+    samples, exit_codes = [], set()
+    for _ in range(cold_repeat):
+        _clear_caches(cwd)
+        if reset:
+            reset()
+        with tempfile.TemporaryDirectory() as pycache:
+            elapsed, code, stderr = _run_once(argv, cwd, {**base_env, 'PYTHONPYCACHEPREFIX': pycache})
+        samples.append(elapsed)
+        exit_codes.add(code)
+    if samples:
+        results.append(summarize(name, 'cold', samples, exit_codes=sorted(exit_codes)))
+
+    with tempfile.TemporaryDirectory() as pycache:
+        warm_env = {**base_env, 'PYTHONPYCACHEPREFIX': pycache}
+        if reset:
+            reset()
+        _, _, stderr = _run_once(argv, cwd, warm_env)
+        if stderr.strip():
+            print(f"  {name}: {stderr.strip().splitlines()[-1]}", file=sys.stderr)
+        samples, exit_codes = [], set()
+        for _ in range(repeat):
+            if reset:
+                reset()
+            elapsed, code, _ = _run_once(argv, cwd, warm_env)
+            samples.append(elapsed)
+            exit_codes.add(code)
+        results.append(summarize(name, 'warm', samples, exit_codes=sorted(exit_codes)))
+    return results
+
+@contextmanager
+def in_directory(path, env=None):
+    """Run in-process benchmarks from `path`, with extra environment variables."""
+    previous, saved_env = os.getcwd(), dict(os.environ)
+    os.chdir(path)
+    os.environ.update(env or {})
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+def _fresh_import(name):
+    """Import a script module from scripts/, discarding any earlier import."""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    for module in ('governance', 'task_index', 'sync_state', 'inbox', name):
+        sys.modules.pop(module, None)
+    return __import__(name)
+
+# --- Benchmarks ---
+
+def bench_startup(args):
+    """Bare interpreter start, to compare the script timings against."""
+    return time_process('python-startup', [sys.executable, '-c', 'pass'],
+                        args.workdir, args.repeat, 0)
+
+def bench_evaluate_expertise(args):
+    results = []
+    goal = 'Build a React dashboard with a Postgres backend, Redis caching and Stripe billing'
+    for file_count in args.repo_files:
+        repo = build_repo(args.workdir / f'repo-{file_count}', file_count)
+        repeat = args.repeat if file_count <= 10000 else min(args.repeat, 3)
+        results += time_process(f'evaluate_expertise[{file_count} files]',
+                                [sys.executable, str(SCRIPTS_DIR / 'evaluate_expertise.py'), goal],
+                                repo, repeat, min(args.cold_repeat, repeat))
+    return results
+
+def bench_generate_specialist(args):
+    path = args.workdir / 'specialist'
+    path.mkdir(parents=True, exist_ok=True)
+    _install_company(path)
+    return time_process('generate_specialist',
+                        [sys.executable, str(SCRIPTS_DIR / 'generate_specialist.py'), 'react-frontend'],
+                        path, args.repeat, args.cold_repeat)
+
+def bench_validate_proposal(args):
+    path = build_proposals(args.workdir / f'proposals-{args.proposals}', args.proposals)
+    script = str(SCRIPTS_DIR / 'validate_proposal.py')
+    results = time_process('validate_proposal[single]',
+                           [sys.executable, script, '.company/proposals/pending/prop-000000.json'],
+                           path, args.repeat, args.cold_repeat)
+    # Cold batches decide every proposal; warm ones find them all seen
+    results += time_process(f'validate_proposal[batch dir, {args.proposals}]',
+                            [sys.executable, script, '--batch', '.company/proposals/pending'],
+                            path, args.repeat, args.cold_repeat)
+
+    def forget_seen():
+        _clear_caches(path)
+
+    results += time_process(f'validate_proposal[batch jsonl, {args.proposals}, unseen]',
+                            [sys.executable, script, '--batch', 'proposals.jsonl'],
+                            path, args.repeat, args.cold_repeat, reset=forget_seen)
+    return results
+
+def bench_validate_handoff(args):
+    path = build_handoff(args.workdir / f'handoff-{args.handoff_mb}mb', args.handoff_mb)
+    return time_process(f'validate_handoff[{args.handoff_mb} MB]',
+                        [sys.executable, str(SCRIPTS_DIR / 'validate_handoff.py'),
+                         'handoff.md', 'developer', 'qa'],
+                        path, args.repeat, args.cold_repeat)
+
+def bench_validate_task_update(args):
+    path = build_task_store(args.workdir / f'tasks-{args.tasks}', args.tasks)
+    tool_input, role = next(task_updates(args.tasks, 1))
+    results = time_process('validate_task_update',
+                           [sys.executable, str(SCRIPTS_DIR / 'validate_task_update.py')],
+                           path, args.repeat, args.cold_repeat,
+                           env={'TOOL_INPUT': json.dumps(tool_input), 'CURRENT_ROLE': role})
+
+    _clear_caches(path)
+    with in_directory(path):
+        module = _fresh_import('validate_task_update')
+        samples = []
+        for tool_input, role in task_updates(args.tasks, args.updates):
+            tool_input_str = json.dumps(tool_input)
+            start = time.perf_counter()
+            module.run(tool_input_str, role)
+            samples.append(time.perf_counter() - start)
+    results.append(summarize(f'validate_task_update[{args.updates} updates, {args.tasks} tasks]',
+                             'in-process', samples))
+    return results
+
+def bench_sync_notify(args):
+    path = build_task_store(args.workdir / f'tasks-{args.tasks}', args.tasks)
+    results = []
+    for backend in ('json', 'sqlite'):
+        env = {'COMPANY_SYNC_BACKEND': backend, 'TASK_ID': '1', 'NEW_STATUS': 'completed',
+               'CURRENT_ROLE': 'developer'}
+        results += time_process(f'sync_notify[{backend}]',
+                                [sys.executable, str(SCRIPTS_DIR / 'sync_notify.py')],
+                                path, args.repeat, args.cold_repeat, env=env)
+
+        _clear_caches(path)
+        with in_directory(path, {'COMPANY_SYNC_BACKEND': backend}):
+            module = _fresh_import('sync_notify')
+            samples = []
+            for tool_input, role in task_updates(args.tasks, args.updates):
+                start = time.perf_counter()
+                module.run(tool_input['taskId'], tool_input.get('status'), role)
+                samples.append(time.perf_counter() - start)
+        results.append(summarize(f'sync_notify[{backend}, {args.updates} updates, {args.tasks} tasks]',
+                                 'in-process', samples))
+    _clear_caches(path)
+    return results
+
+BENCHMARKS = {
+    'startup': bench_startup,
+    'evaluate_expertise': bench_evaluate_expertise,
+    'generate_specialist': bench_generate_specialist,
+    'validate_proposal': bench_validate_proposal,
+    'validate_handoff': bench_validate_handoff,
+    'validate_task_update': bench_validate_task_update,
+    'sync_notify': bench_sync_notify,
+}
+
+# --- Reporting ---
+
+def compare(results, baseline_path, tolerance):
+    """Return descriptions of results whose median regressed past `tolerance`."""
+    baseline = {(r['name'], r['mode']): r
+                for r in json.loads(Path(baseline_path).read_text())['results']}
+    regressions = []
+    for result in results:
+        before = baseline.get((result['name'], result['mode']))
+        if before and result['median_ms'] > before['median_ms'] * (1 + tolerance):
+            regressions.append(f"{result['name']} ({result['mode']}): "
+                               f"{before['median_ms']:.1f} ms -> {result['median_ms']:.1f} ms")
+    return regressions
+
+def parse_args(argv):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark the scripts in scripts/.')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), metavar='NAME',
+                        help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument('--repeat', type=int, default=10, help='warm runs per benchmark')
+    parser.add_argument('--cold-repeat', type=int, default=3, help='cold runs per benchmark')
+    parser.add_argument('--repo-files', type=int, nargs='+', default=[1000], metavar='N',
+                        help='repo sizes for evaluate_expertise (e.g. 1000 100000 1000000)')
+    parser.add_argument('--proposals', type=int, default=2000, help='proposals in the stream')
+    parser.add_argument('--handoff-mb', type=int, default=8, help='handoff document size')
+    parser.add_argument('--tasks', type=int, default=5000, help='tasks in the task store')
+    parser.add_argument('--updates', type=int, default=2000, help='in-process task updates')
+    parser.add_argument('--workdir', type=Path,
+                        default=Path(tempfile.gettempdir()) / 'cvc-bench',
+                        help='where fixtures are generated and kept')
+    parser.add_argument('--output', type=Path, default=Path('bench-results.json'),
+                        help='results file (default: bench-results.json)')
+    parser.add_argument('--compare', type=Path, metavar='BASELINE',
+                        help='earlier results file to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed median slowdown for --compare (default: 0.2 = 20%%)')
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv[1:])
+    args.workdir = args.workdir.resolve()
+    args.workdir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for name in args.only or BENCHMARKS:
+        print(f"Running {name}...", file=sys.stderr)
+        for result in BENCHMARKS[name](args):
+            results.append(result)
+            print(f"  {result['name']:<60} {result['mode']:<10} "
+                  f"median {result['median_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms",
+                  file=sys.stderr)
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'parameters': {
+            'repeat': args.repeat,
+            'cold_repeat': args.cold_repeat,
+            'repo_files': args.repo_files,
+            'proposals': args.proposals,
+            'handoff_mb': args.handoff_mb,
+            'tasks': args.tasks,
+            'updates': args.updates,
+        },
+        'results': results,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to: {args.output}", file=sys.stderr)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
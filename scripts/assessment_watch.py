@@ -0,0 +1,139 @@
+"""
+evaluate_expertise.py --watch: keeps assessment.json current as the tree
+changes.
+
+IncrementalScan holds the per-file hits of the last scan and rescans only
+files whose mtime or size changed; watch_assessment() polls it, waits for
+bursts of edits to settle, and rewrites the assessment only when the
+ranked gaps change.
+"""
+
+import os
+
+import atomic_write
+import dependency_manifests
+import evaluate_expertise
+from roster_store import RosterStore
+from source_walk import (FILES_PER_EXTENSION, MAX_SOURCE_BYTES, MAX_STREAM_BYTES,
+                         iter_source_files, list_source_files)
+
+def _gaps_key(assessment):
+    """The part of an assessment that --watch rewrites it for: the ranked gaps."""
+    return (assessment['gaps'], assessment['recommendations'])
+
+class IncrementalScan:
+    """
+    A codebase scan kept up to date by rescanning only what changed.
+
+    snapshot() stats the sampled source files, the dependency manifests and
+    the config files; update() rescans the source files whose mtime or size
+    changed, re-reads the manifests only if one of them changed, and
+    recomputes the domain scores from the per-file hits it keeps in memory.
+    """
+
+    def __init__(self, jobs=1, use_cache=True, verify_hash=False, full=False, all_files=False):
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.verify_hash = verify_hash
+        self.full = full
+        self.all_files = all_files
+        self.state = None
+        self.file_hits = {}
+        self.deps = {}
+        self.detected = None
+
+    def snapshot(self):
+        """Return the tree's current state, comparable with ==."""
+        def stamps(paths):
+            result = {}
+            for path in paths:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                result[path] = (stat.st_mtime_ns, stat.st_size)
+            return result
+
+        sources = list_source_files(max_bytes=MAX_STREAM_BYTES if self.full else MAX_SOURCE_BYTES,
+                                    per_extension=None if self.all_files else FILES_PER_EXTENSION)
+        manifests = iter_source_files(max_bytes=MAX_STREAM_BYTES, match=dependency_manifests.is_manifest)
+        return {
+            'sources': stamps(sources),
+            'manifests': stamps(manifests),
+            'config': tuple(os.path.exists(name) for name, _ in evaluate_expertise.CONFIG_CHECKS),
+        }
+
+    def update(self, state):
+        """Bring the scores up to date with `state`, a snapshot() result."""
+        previous = self.state or {'sources': {}, 'manifests': None}
+        sources = state['sources']
+        changed = [path for path, stamp in sources.items() if previous['sources'].get(path) != stamp]
+        scanned = evaluate_expertise.scan_source_files(changed, jobs=self.jobs, use_cache=self.use_cache,
+                                    verify_hash=self.verify_hash, full=self.full) if changed else {}
+        self.file_hits = {path: scanned[path] if path in scanned else self.file_hits.get(path, {})
+                          for path in sources}
+
+        if state['manifests'] != previous['manifests']:
+            self.deps = dependency_manifests.read_dependencies(state['manifests'])
+
+        self.state = state
+        self.detected = evaluate_expertise.codebase_scores(os.path.exists, self.deps, self.file_hits, self.all_files)
+        return changed
+
+async def watch_assessment(goal_text, output_path=evaluate_expertise.ASSESSMENT_PATH, interval=2.0, debounce=1.0,
+                           **scan_options):
+    """
+    Keep the assessment for `goal_text` at `output_path` up to date.
+
+    Every `interval` seconds the tree is stat'ed. Once it has changed and
+    then stayed unchanged for `debounce` seconds, the changed files are
+    rescanned and the assessment is rebuilt; it is rewritten only when the
+    ranked gaps differ from the last ones written. Hires show up too, since
+    the roster is re-read whenever roster.json changes; one that can't be
+    read yet (say, mid-write) is retried on the next tick. Runs until
+    cancelled.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    scan = IncrementalScan(**scan_options)
+    roster = RosterStore()
+    text_detected = evaluate_expertise.analyze_text(goal_text)
+    written = None
+    roster_error = None
+
+    while True:
+        state = await loop.run_in_executor(None, scan.snapshot)
+        if state != scan.state:
+            # Wait for a burst of edits (a checkout, a formatter run) to settle
+            while scan.state is not None:
+                await asyncio.sleep(debounce)
+                settled = await loop.run_in_executor(None, scan.snapshot)
+                if settled == state:
+                    break
+                state = settled
+            changed = await loop.run_in_executor(None, scan.update, state)
+            if written is not None:
+                print(f"Rescanned {len(changed)} changed file(s)", flush=True)
+
+        try:
+            roster.refresh()
+            roster_error = None
+        except (OSError, ValueError) as e:
+            # Likely caught mid-write: keep the last good roster and retry next tick
+            if str(e) != roster_error:
+                print(f"WARNING: Could not read {roster.path}: {e}", flush=True)
+            roster_error = str(e)
+            if roster.roster is None:
+                await asyncio.sleep(interval)
+                continue
+        assessment = evaluate_expertise.build_assessment(text_detected, scan.detected, roster)
+        if _gaps_key(assessment) != written:
+            atomic_write.write_json(output_path, assessment, indent=2)
+            written = _gaps_key(assessment)
+            hires = assessment['recommendations']
+            print(f"Assessment written to: {output_path} "
+                  f"({len(hires['immediate_hires'])} immediate, {len(hires['suggested_hires'])} suggested hires)",
+                  flush=True)
+
+        await asyncio.sleep(interval)
@@ -0,0 +1,64 @@
+"""
+Atomic, skip-if-unchanged file writes shared by the scripts.
+
+Every write goes to a temporary file in the target's directory and is
+renamed over the target, so readers (the dashboard watcher, other hooks)
+never see a half-written file. If the target already holds exactly the
+same bytes, nothing is written at all, so regenerating an unchanged file
+doesn't wake up file watchers.
+"""
+
+import itertools
+import os
+
+_tmp_counter = itertools.count()
+
+def _unchanged(path, data):
+    """True if `path` already contains exactly `data`."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+def write_bytes(path, data):
+    """
+    Atomically replace `path` with `data`, unless it already holds `data`.
+
+    Returns True if the file was written, False if it was left untouched.
+    """
+    path = os.fspath(path)
+    if _unchanged(path, data):
+        return False
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Unique per process and call, so parallel writers never share a temp file
+    tmp_path = f'{path}.{os.getpid()}.{next(_tmp_counter)}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+def write_text(path, text, encoding='utf-8'):
+    """Text version of write_bytes(). Returns True if the file was written."""
+    return write_bytes(path, text.encode(encoding))
+
+def write_json(path, data, **dumps_options):
+    """
+    Serialize `data` with json.dumps(**dumps_options) and write it atomically.
+
+    Returns True if the file was written.
+    """
+    import json
+    return write_text(path, json.dumps(data, **dumps_options))
@@ -0,0 +1,58 @@
+"""
+Helpers for .company/ state shared by the scripts: reading a setting that
+an environment variable can override, locking a file between processes,
+and telling whether a file changed since it was last read.
+"""
+
+import json
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+CONFIG_PATH = '.company/config.json'
+
+def config_setting(env_name, *keys, config_path=CONFIG_PATH):
+    """
+    Return the `env_name` environment variable if set, else the value at
+    `keys` under "company" in config.json, or None if neither is set.
+    """
+    value = os.environ.get(env_name)
+    if value:
+        return value
+    try:
+        with open(config_path) as f:
+            value = json.load(f).get('company', {})
+        for key in keys:
+            value = value.get(key, {})
+    except (OSError, ValueError, AttributeError):
+        return None
+    return value if isinstance(value, str) else None
+
+def stat_key(path):
+    """Return 'mtime_ns:size' for a file, or None if it can't be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f'{stat.st_mtime_ns}:{stat.st_size}'
+
+class FileLock:
+    """Exclusive advisory lock on a file, a no-op where fcntl is unavailable."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.file = open(self.path, 'a')
+        if fcntl:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.file.close()
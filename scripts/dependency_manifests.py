@@ -0,0 +1,290 @@
+"""
+Dependency manifest analysis for evaluate_expertise.py.
+
+Parses the dependency manifests and lockfiles of every ecosystem the
+assessment knows (npm, Python, Go, Rust) and classifies each dependency
+by looking its normalized name up in DEPENDENCY_DOMAINS, then its
+'/'- and '-'-delimited prefixes in DEPENDENCY_PREFIXES. Only direct
+dependencies missing from both tables fall back to the TECH_PATTERNS
+regexes, and each name is matched at most once per process.
+
+Dependencies are de-duplicated across manifests, so a monorepo with a
+hundred package.json files that all use React counts React once. A direct
+dependency scores DIRECT_WEIGHT per domain. Packages that only appear in
+lockfiles (usually transitive dependencies) are classified from the
+tables alone, since matching regexes against thousands of transitive
+package names mostly finds noise, and add LOCKED_WEIGHT once per domain
+they touch however many of them there are: a tool like jest pulls in
+dozens of @jest/* and jest-* packages, which would otherwise outrank
+everything the project depends on directly.
+"""
+
+import json
+import re
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: pyproject.toml and Cargo.toml are skipped
+    tomllib = None
+
+DIRECT_WEIGHT = 3
+LOCKED_WEIGHT = 1
+
+def normalize(ecosystem, name):
+    """Normalize a package name the way its ecosystem compares names."""
+    name = name.strip().lower()
+    if ecosystem == 'python':
+        return re.sub(r'[-_.]+', '-', name)
+    if ecosystem == 'rust':
+        return name.replace('_', '-')
+    return name
+
+# --- Parsers: each takes the file text and returns an iterable of
+# (name, direct) pairs; `direct` is False for indirect Go requirements
+
+def _parse_package_json(text):
+    pkg = json.loads(text)
+    for section in ('dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies'):
+        deps = pkg.get(section)
+        if isinstance(deps, dict):
+            for name in deps:
+                yield name, True
+
+def _parse_package_lock(text):
+    lock = json.loads(text)
+    packages = lock.get('packages')
+    if isinstance(packages, dict):  # lockfileVersion 2 and 3
+        for path in packages:
+            if 'node_modules/' in path:
+                yield path.rsplit('node_modules/', 1)[1], False
+        return
+
+    def walk(deps):  # lockfileVersion 1 nests transitive dependencies
+        for name, info in deps.items():
+            yield name, False
+            if isinstance(info, dict) and isinstance(info.get('dependencies'), dict):
+                yield from walk(info['dependencies'])
+
+    yield from walk(lock.get('dependencies') or {})
+
+_YARN_ENTRY = re.compile(r'^"?(@?[^@"\s,]+)@', re.MULTILINE)
+
+def _parse_yarn_lock(text):
+    for match in _YARN_ENTRY.finditer(text):
+        yield match.group(1), False
+
+_PNPM_ENTRY = re.compile(r"^ {2}'?/?((?:@[^/\s']+/)?[^@/\s':]+)[@/]\d", re.MULTILINE)
+
+def _parse_pnpm_lock(text):
+    for match in _PNPM_ENTRY.finditer(text):
+        yield match.group(1), False
+
+_REQUIREMENT_NAME = re.compile(r'[A-Za-z0-9][A-Za-z0-9._-]*')
+
+def _requirement_name(spec):
+    """Return the project name of a PEP 508 requirement string."""
+    match = _REQUIREMENT_NAME.match(spec.strip())
+    return match.group(0) if match else None
+
+def _parse_requirements(text):
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line or line.startswith('-'):
+            continue
+        name = _requirement_name(line)
+        if name:
+            yield name, True
+
+def _parse_pyproject(text):
+    if tomllib is None:
+        return
+    data = tomllib.loads(text)
+    project = data.get('project', {})
+    specs = list(project.get('dependencies', []))
+    for extra in project.get('optional-dependencies', {}).values():
+        specs.extend(extra)
+    for group in data.get('dependency-groups', {}).values():
+        specs.extend(spec for spec in group if isinstance(spec, str))
+    for spec in specs:
+        name = _requirement_name(spec)
+        if name:
+            yield name, True
+
+    poetry = data.get('tool', {}).get('poetry', {})
+    tables = [poetry.get('dependencies', {}), poetry.get('dev-dependencies', {})]
+    tables.extend(group.get('dependencies', {}) for group in poetry.get('group', {}).values())
+    for table in tables:
+        for name in table:
+            if name != 'python':
+                yield name, True
+
+def _parse_pipfile_lock(text):
+    lock = json.loads(text)
+    for section in ('default', 'develop'):
+        for name in lock.get(section) or {}:
+            yield name, False
+
+_TOML_LOCK_NAME = re.compile(r'^name = "([^"]+)"', re.MULTILINE)
+
+def _parse_toml_lock(text):
+    """Package names from Cargo.lock, poetry.lock and uv.lock [[package]] tables."""
+    for match in _TOML_LOCK_NAME.finditer(text):
+        yield match.group(1), False
+
+def _parse_go_mod(text):
+    in_block = False
+    for line in text.splitlines():
+        line = line.strip()
+        if in_block:
+            if line.startswith(')'):
+                in_block = False
+                continue
+            fields = line.split()
+        elif line.startswith('require'):
+            rest = line[len('require'):].strip()
+            if rest.startswith('('):
+                in_block = True
+                continue
+            fields = rest.split()
+        else:
+            continue
+        if fields and not fields[0].startswith('//'):
+            yield fields[0], '// indirect' not in line
+
+def _parse_go_sum(text):
+    for line in text.splitlines():
+        fields = line.split(None, 1)
+        if fields:
+            yield fields[0], False
+
+def _parse_cargo_toml(text):
+    if tomllib is None:
+        return
+    data = tomllib.loads(text)
+    tables = [data, data.get('workspace', {})]
+    tables.extend(data.get('target', {}).values())
+    for table in tables:
+        for section in ('dependencies', 'dev-dependencies', 'build-dependencies'):
+            deps = table.get(section)
+            if isinstance(deps, dict):
+                for name, spec in deps.items():
+                    # `alias = { package = "real-name" }` renames a crate
+                    if isinstance(spec, dict) and isinstance(spec.get('package'), str):
+                        name = spec['package']
+                    yield name, True
+
+# Manifest file name -> (ecosystem, parser, direct?)
+MANIFESTS = {
+    'package.json': ('npm', _parse_package_json, True),
+    'package-lock.json': ('npm', _parse_package_lock, False),
+    'npm-shrinkwrap.json': ('npm', _parse_package_lock, False),
+    'yarn.lock': ('npm', _parse_yarn_lock, False),
+    'pnpm-lock.yaml': ('npm', _parse_pnpm_lock, False),
+    'requirements.txt': ('python', _parse_requirements, True),
+    'pyproject.toml': ('python', _parse_pyproject, True),
+    'Pipfile.lock': ('python', _parse_pipfile_lock, False),
+    'poetry.lock': ('python', _parse_toml_lock, False),
+    'uv.lock': ('python', _parse_toml_lock, False),
+    'go.mod': ('go', _parse_go_mod, True),
+    'go.sum': ('go', _parse_go_sum, False),
+    'Cargo.toml': ('rust', _parse_cargo_toml, True),
+    'Cargo.lock': ('rust', _parse_toml_lock, False),
+}
+
+def manifest_kind(name):
+    """Return the MANIFESTS entry for a file name, or None if it isn't a manifest."""
+    kind = MANIFESTS.get(name)
+    if kind is None and name.startswith('requirements') and name.endswith('.txt'):
+        kind = MANIFESTS['requirements.txt']
+    return kind
+
+def is_manifest(name):
+    return manifest_kind(name) is not None
+
+def parse_manifests(manifests):
+    """
+    Parse (path, text) pairs into {(ecosystem, normalized name): direct}.
+
+    A package is direct if any manifest lists it directly. Malformed
+    manifests are skipped.
+    """
+    deps = {}
+    for path, text in manifests:
+        kind = manifest_kind(path.rsplit('/', 1)[-1])
+        if kind is None:
+            continue
+        ecosystem, parser, direct_file = kind
+        try:
+            entries = list(parser(text))
+        except (ValueError, AttributeError, TypeError):
+            continue
+        for name, direct in entries:
+            key = (ecosystem, normalize(ecosystem, name))
+            deps[key] = deps.get(key, False) or (direct_file and direct)
+    return deps
+
+def read_dependencies(paths):
+    """parse_manifests() for manifest files on disk; unreadable files are skipped."""
+    def read(paths):
+        for path in paths:
+            try:
+                with open(path, encoding='utf-8', errors='replace') as f:
+                    yield path, f.read()
+            except OSError:
+                continue
+
+    return parse_manifests(read(paths))
+
+class DependencyClassifier:
+    """Maps dependency names to domains through the exact-name and prefix indexes."""
+
+    def __init__(self, exact, prefixes, matcher=None):
+        self.exact = exact
+        self.prefixes = prefixes
+        self.matcher = matcher
+        self._fallback = {}
+
+    def lookup(self, name):
+        """Return the domains the tables give `name`, or None if it's unknown."""
+        domains = self.exact.get(name)
+        if domains is not None:
+            return domains
+        for i in range(len(name) - 1, 0, -1):
+            if name[i] in '/-':
+                domains = self.prefixes.get(name[:i + 1])
+                if domains is not None:
+                    return domains
+        return None
+
+    def classify(self, name, fallback=True):
+        """
+        Return {domain: hits} for a dependency name. Unknown names are matched
+        against TECH_PATTERNS when `fallback` is set (and a matcher was given).
+        """
+        domains = self.lookup(name)
+        if domains is not None:
+            return {domain: 1 for domain in domains}
+        if not fallback or self.matcher is None:
+            return {}
+        hits = self._fallback.get(name)
+        if hits is None:
+            hits = self._fallback[name] = dict(self.matcher.domain_counts(name))
+        return hits
+
+    def score(self, deps):
+        """
+        Score {(ecosystem, name): direct} into {domain: points}. Lockfile-only
+        packages count once per domain; see the module docstring.
+        """
+        scores = {}
+        locked = set()
+        for (_, name), direct in deps.items():
+            if direct:
+                for domain, hits in self.classify(name).items():
+                    scores[domain] = scores.get(domain, 0) + DIRECT_WEIGHT * hits
+                continue
+            for domain in self.classify(name, fallback=False):
+                if domain not in locked:
+                    locked.add(domain)
+                    scores[domain] = scores.get(domain, 0) + LOCKED_WEIGHT
+        return scores
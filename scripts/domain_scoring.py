@@ -0,0 +1,194 @@
+"""
+Per-domain scoring for evaluate_expertise.py.
+
+Per-file scan results are packed into a files x domains matrix of hit
+counts (a flat row-major array.array), and every domain's score is
+computed in one pass over that matrix instead of merging a dict per file.
+Matrices of at least NUMPY_MIN_CELLS cells are viewed through NumPy when
+it is installed; it is only imported then, so the default sampled scan
+never pays for the import.
+
+Two weightings:
+
+- count: the plain sum of hits, as a sampled scan has always scored.
+- sublinear: each file contributes 1 + ln(hits) to a domain, and when more
+  than `reference_files` files are scored the totals are scaled down to
+  that many files. A domain is then judged by how much of the codebase
+  uses it rather than by its raw hit count, so scanning every file of a
+  huge repository doesn't push every domain it touches past the
+  "critical" threshold.
+
+Usage:
+    domain_scoring.py check   Confirm the NumPy and pure-Python scoring agree
+"""
+
+import heapq
+import math
+import random
+import sys
+from array import array
+
+WEIGHTINGS = ('count', 'sublinear')
+
+# Smallest matrix (rows x domains) scored with NumPy; below this the import
+# costs more than the vectorized pass saves
+NUMPY_MIN_CELLS = 100_000
+
+_numpy = None
+_numpy_imported = False
+
+def _import_numpy():
+    """Import NumPy on first use. Returns None if it isn't installed."""
+    global _numpy, _numpy_imported
+    if not _numpy_imported:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy, _numpy_imported = numpy, True
+    return _numpy
+
+class HitMatrix:
+    """Hit counts for a list of files (rows) across a fixed list of domains (columns)."""
+
+    def __init__(self, domains):
+        self.domains = list(domains)
+        self.columns = {domain: i for i, domain in enumerate(self.domains)}
+        self.rows = 0
+        self._data = array('d')
+        # None picks by size (NUMPY_MIN_CELLS); True or False forces a branch
+        self.use_numpy = None
+
+    @classmethod
+    def from_hits(cls, domains, file_hits):
+        """Build a matrix from an iterable of {domain: hits} dicts, one per file."""
+        matrix = cls(domains)
+        for hits in file_hits:
+            matrix.add_row(hits)
+        return matrix
+
+    def add_row(self, hits):
+        """Append one file's {domain: hits}; domains outside the columns are ignored."""
+        row = [0.0] * len(self.domains)
+        for domain, count in hits.items():
+            column = self.columns.get(domain)
+            if column is not None:
+                row[column] = count
+        self._data.extend(row)
+        self.rows += 1
+
+    def _column(self, column):
+        return self._data[column::len(self.domains)]
+
+    def _as_numpy(self):
+        """The matrix as a rows x domains NumPy array, or None to use pure Python."""
+        use_numpy = self.use_numpy
+        if use_numpy is None:
+            use_numpy = self.rows * len(self.domains) >= NUMPY_MIN_CELLS
+        numpy = _import_numpy() if use_numpy and self.rows else None
+        if numpy is None:
+            return None
+        return numpy.frombuffer(self._data, dtype=numpy.float64).reshape(self.rows, len(self.domains))
+
+    def scores(self, weighting='count', reference_files=None):
+        """
+        Return one score per domain, in column order.
+
+        See the module docstring for the weightings; `reference_files` only
+        applies to sublinear weighting.
+        """
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"Unknown weighting: {weighting}")
+        if not self.rows or not self.domains:
+            return [0] * len(self.domains)
+
+        matrix = self._as_numpy()
+        if matrix is not None:
+            if weighting == 'count':
+                return [int(total) for total in matrix.sum(axis=0)]
+            present = matrix > 0
+            weights = matrix.copy()
+            weights[present] = 1.0 + _numpy.log(matrix[present])
+            totals = weights.sum(axis=0).tolist()
+        elif weighting == 'count':
+            return [int(sum(self._column(c))) for c in range(len(self.domains))]
+        else:
+            totals = [sum(1.0 + math.log(hits) for hits in self._column(c) if hits)
+                      for c in range(len(self.domains))]
+
+        scale = 1.0
+        if reference_files and self.rows > reference_files:
+            scale = reference_files / self.rows
+        return [round(total * scale, 3) for total in totals]
+
+    def first_seen(self):
+        """
+        Column indexes of the domains with any hits, ordered by the first
+        file that hits them (ties in column order).
+        """
+        width = len(self.domains)
+        matrix = self._as_numpy()
+        if matrix is not None:
+            present = matrix > 0
+            columns = _numpy.flatnonzero(present.any(axis=0))
+            first_rows = present.argmax(axis=0)
+            return sorted(columns.tolist(), key=lambda c: (first_rows[c], c))
+        first = {}
+        for offset, hits in enumerate(self._data):
+            if hits and offset % width not in first:
+                first[offset % width] = offset
+                if len(first) == width:
+                    break
+        return sorted(first, key=first.get)
+
+    def domain_scores(self, weighting='count', reference_files=None):
+        """Return {domain: score} for domains with hits, in first_seen() order."""
+        scores = self.scores(weighting, reference_files)
+        return {self.domains[c]: scores[c] for c in self.first_seen()}
+
+def top_k(scores, k):
+    """
+    Return the `k` highest-scoring (domain, score) pairs of a {domain: score}
+    dict, best first; equal scores keep the dict's order.
+    """
+    order = {domain: i for i, domain in enumerate(scores)}
+    return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], order[item[0]]))
+
+def check(trials=50, seed=0):
+    """
+    Score random matrices with NumPy and in pure Python. Returns a list of
+    (trial, weighting) pairs whose domain_scores() differ.
+    """
+    rng = random.Random(seed)
+    mismatches = []
+    for trial in range(trials):
+        domains = [f'domain-{i}' for i in range(rng.randint(1, 40))]
+        rows = [{domain: rng.choice((1, 1, 2, 3, 7, 40)) for domain in domains if rng.random() < 0.1}
+                for _ in range(rng.randint(0, 2000))]
+        for weighting in WEIGHTINGS:
+            results = []
+            for use_numpy in (True, False):
+                matrix = HitMatrix.from_hits(domains, rows)
+                matrix.use_numpy = use_numpy
+                result = matrix.domain_scores(weighting, 350)
+                results.append(list(result.items()))
+            if results[0] != results[1]:
+                mismatches.append((trial, weighting))
+    return mismatches
+
+def main():
+    if sys.argv[1:] != ['check']:
+        print("Usage: domain_scoring.py check")
+        sys.exit(1)
+    if _import_numpy() is None:
+        print("NumPy is not installed; only the pure-Python scoring is used")
+        return
+    mismatches = check()
+    for trial, weighting in mismatches:
+        print(f"MISMATCH: trial {trial}, {weighting} weighting")
+    if mismatches:
+        sys.exit(1)
+    print("OK: NumPy and pure-Python scoring agree")
+
+if __name__ == '__main__':
+    main()
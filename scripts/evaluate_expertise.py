@@ -4,165 +4,596 @@ Evaluates project/task requirements to identify needed expertise.
 Used by the hiring manager to determine what specialists to create.
 """
 
+import argparse
+import codecs
+import hashlib
 import json
+import mmap
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from collections import defaultdict
 
-# Technology detection patterns
-TECH_PATTERNS = {
-    # Frontend frameworks
-    'frontend-react': [
-        r'react', r'\.jsx', r'\.tsx', r'next\.js', r'next\.config',
-        r'react-dom', r'useState', r'useEffect', r'redux', r'zustand'
-    ],
-    'frontend-vue': [
-        r'vue', r'\.vue', r'vuex', r'pinia', r'nuxt', r'composition api'
-    ],
-    'frontend-angular': [
-        r'angular', r'@angular', r'\.component\.ts', r'rxjs', r'ngrx'
-    ],
-    'frontend-svelte': [
-        r'svelte', r'\.svelte', r'sveltekit'
-    ],
-
-    # Backend frameworks
-    'backend-node': [
-        r'express', r'fastify', r'nestjs', r'koa', r'node\.js',
-        r'package\.json.*server', r'npm.*start'
-    ],
-    'backend-python': [
-        r'python', r'\.py', r'fastapi', r'django', r'flask',
-        r'requirements\.txt', r'pyproject\.toml'
-    ],
-    'backend-go': [
-        r'golang', r'go\.mod', r'\.go', r'gin', r'echo', r'chi'
-    ],
-    'backend-rust': [
-        r'rust', r'cargo\.toml', r'\.rs', r'actix', r'axum', r'rocket'
-    ],
-
-    # Databases
-    'database-postgresql': [
-        r'postgres', r'postgresql', r'pg_', r'psycopg'
-    ],
-    'database-mongodb': [
-        r'mongo', r'mongodb', r'mongoose'
-    ],
-    'database-redis': [
-        r'redis', r'ioredis', r'redis-py'
-    ],
-
-    # Infrastructure
-    'infra-docker': [
-        r'docker', r'dockerfile', r'docker-compose', r'container'
-    ],
-    'infra-kubernetes': [
-        r'kubernetes', r'k8s', r'kubectl', r'helm', r'\.yaml.*kind:'
-    ],
-    'cloud-aws': [
-        r'aws', r'lambda', r's3', r'ec2', r'ecs', r'cloudformation', r'cdk'
-    ],
-    'cloud-gcp': [
-        r'gcp', r'google cloud', r'cloud run', r'firebase', r'gke'
-    ],
-
-    # Testing
-    'testing-e2e': [
-        r'playwright', r'cypress', r'puppeteer', r'e2e', r'end.to.end'
-    ],
-    'testing-unit': [
-        r'jest', r'vitest', r'mocha', r'pytest', r'junit', r'\.test\.'
-    ],
-
-    # Other
-    'ui-css': [
-        r'tailwind', r'css', r'sass', r'styled-components', r'emotion'
-    ],
-    'security': [
-        r'security', r'oauth', r'jwt', r'authentication', r'encryption'
-    ]
-}
-
-# Keyword to domain mapping
-KEYWORDS = {
-    'authentication': ['security', 'backend-node'],
-    'login': ['security', 'frontend-react'],
-    'dashboard': ['frontend-react', 'ui-css'],
-    'api': ['backend-node'],
-    'database': ['database-postgresql'],
-    'real-time': ['backend-node'],
-    'machine learning': ['backend-python'],
-    'ml': ['backend-python'],
-    'ai': ['backend-python'],
-    'mobile': ['frontend-react'],
-    'responsive': ['ui-css'],
-    'testing': ['testing-unit', 'testing-e2e'],
-    'deployment': ['infra-docker', 'cicd-github'],
-    'ci/cd': ['cicd-github'],
-}
-
-def scan_codebase():
-    """Scan the codebase for technology indicators."""
+import atomic_write
+import dependency_manifests
+import domain_scoring
+import git_objects
+import scan_cache
+import scan_sampling
+from goal_batch import goal_filename, read_goals
+from roster_store import RosterStore
+from source_walk import (FILES_PER_EXTENSION, MAX_SOURCE_BYTES, MAX_STREAM_BYTES, SNIFF_BYTES,
+                         SOURCE_EXTENSIONS, is_source_blob, is_source_file, iter_source_files,
+                         iter_tree_files, list_source_files, sample_source_files)
+
+def __getattr__(name):
+    """Expose TECH_PATTERNS and KEYWORDS, loaded from expertise_patterns on first use."""
+    if name in ('TECH_PATTERNS', 'KEYWORDS'):
+        import expertise_patterns
+        return getattr(expertise_patterns, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Regex metacharacters that end a run of literal text in a pattern
+_REGEX_META = set('.^$*+?{}[]|()')
+
+# Characters that re.IGNORECASE treats as equal to an ASCII letter but that
+# str.lower() leaves alone
+_ASCII_FOLD = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
+def _required_literal(pattern):
+    """
+    Return the longest literal substring every match of `pattern` contains.
+
+    Returns None when no such literal can be derived safely (alternation,
+    groups, classes, counted repeats), in which case the pattern is always
+    checked.
+    """
+    runs = []
+    current = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            if i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                current.append(pattern[i + 1])
+                i += 2
+                continue
+            return None
+        if char in '|([{':
+            return None
+        if char in _REGEX_META:
+            if char in '*?' and current:
+                current.pop()
+            runs.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    runs.append(''.join(current))
+
+    literal = max(runs, key=len)
+    if not literal or not literal.isascii():
+        return None
+    return literal.lower()
+
+def _trie_regex(words):
+    """Build a regex alternation from `words` sharing common prefixes."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            body = f'(?:{body})?'
+        return body
+
+    return emit(trie)
+
+class TechMatcher:
+    """
+    Compiled matcher for every TECH_PATTERNS entry.
+
+    A single lookahead regex built from the required literal of each pattern
+    finds all candidate patterns in one pass over the lowercased text. Only
+    candidates are then confirmed with their original compiled regex, so
+    results are identical to running re.search for every pattern.
+    """
+
+    def __init__(self, tech_patterns):
+        self.entries = [(domain, pattern)
+                        for domain, patterns in tech_patterns.items()
+                        for pattern in patterns]
+        self._compiled = {
+            True: [re.compile(p, re.IGNORECASE) for _, p in self.entries],
+            False: [re.compile(p) for _, p in self.entries],
+        }
+
+        by_literal = defaultdict(list)
+        self._always = []
+        for index, (_, pattern) in enumerate(self.entries):
+            literal = _required_literal(pattern)
+            if literal is None:
+                self._always.append(index)
+            else:
+                by_literal[literal].append(index)
+
+        # A hit on a literal implies a hit on every literal it starts with,
+        # since the lookahead only reports the longest one at each offset
+        self._candidates = {
+            literal: [index for other, indexes in by_literal.items()
+                      if literal.startswith(other) for index in indexes]
+            for literal in by_literal
+        }
+        self._prefilter = re.compile(f'(?=({_trie_regex(by_literal)}))')
+
+    def match_entries(self, text, ignore_case=True, exclude=()):
+        """
+        Return the set of entry indexes whose pattern matches `text`.
+
+        Entries in `exclude` (already found elsewhere) are not confirmed.
+        """
+        folded = text.lower().translate(_ASCII_FOLD)
+        candidates = set(self._always)
+        for literal in set(m.group(1) for m in self._prefilter.finditer(folded)):
+            candidates.update(self._candidates[literal])
+        candidates.difference_update(exclude)
+
+        compiled = self._compiled[ignore_case]
+        return {index for index in candidates if compiled[index].search(text)}
+
+    def domain_counts(self, text, ignore_case=True):
+        """Return {domain: number of its patterns matching `text`}, in TECH_PATTERNS order."""
+        counts = defaultdict(int)
+        for index in sorted(self.match_entries(text, ignore_case)):
+            counts[self.entries[index][0]] += 1
+        return counts
+
+_matcher = None
+
+def get_matcher():
+    """Return the process-wide TechMatcher, building it on first use."""
+    global _matcher
+    if _matcher is None:
+        from expertise_patterns import TECH_PATTERNS
+        _matcher = TechMatcher(TECH_PATTERNS)
+    return _matcher
+
+_dependency_classifier = None
+
+def get_dependency_classifier():
+    """Return the process-wide DependencyClassifier, building it on first use."""
+    global _dependency_classifier
+    if _dependency_classifier is None:
+        from expertise_patterns import DEPENDENCY_DOMAINS, DEPENDENCY_PREFIXES
+        _dependency_classifier = dependency_manifests.DependencyClassifier(
+            DEPENDENCY_DOMAINS, DEPENDENCY_PREFIXES, get_matcher())
+    return _dependency_classifier
+
+# Characters read from the start of each source file
+SCAN_CHARS = 5000
+
+# Bytes decoded and matched at a time when streaming whole files
+STREAM_CHUNK_BYTES = 256 * 1024
+
+# Longest unterminated line carried between chunks; beyond this only the
+# last STREAM_OVERLAP_CHARS are kept, enough for every literal pattern
+STREAM_MAX_CARRY_CHARS = 64 * 1024
+STREAM_OVERLAP_CHARS = 256
+
+def _iter_file_chunks(f, size):
+    """Yield a file's bytes in STREAM_CHUNK_BYTES pieces, via mmap where possible."""
+    try:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        while True:
+            chunk = f.read(STREAM_CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+    with buf:
+        for offset in range(0, size, STREAM_CHUNK_BYTES):
+            yield buf[offset:offset + STREAM_CHUNK_BYTES]
+
+def scan_file_streaming(path, deadline=None):
+    """
+    Return {domain: hits} for a whole file with bounded memory, or None if
+    time.monotonic() reaches `deadline` before it is done.
+
+    The file is decoded and matched chunk by chunk. No pattern can match
+    across a newline, so each chunk is cut at its last newline and the
+    partial line is carried into the next one, which keeps matches that
+    straddle chunk boundaries. Scanning stops as soon as every pattern has
+    been found, since later chunks can't change the counts.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _scan_chunks(_iter_file_chunks(f, os.fstat(f.fileno()).st_size), deadline)
+    except OSError:
+        return {}
+
+def _scan_chunks(chunks, deadline=None):
+    """Return {domain: hits} for bytes arriving in `chunks`; see scan_file_streaming()."""
+    matcher = get_matcher()
+    found = set()
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    carry = ''
+    for chunk in chunks:
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        text = carry + decoder.decode(chunk)
+        cut = text.rfind('\n') + 1
+        if len(text) - cut > STREAM_MAX_CARRY_CHARS:
+            cut = len(text) - STREAM_OVERLAP_CHARS
+        found |= matcher.match_entries(text[:cut], exclude=found)
+        if len(found) == len(matcher.entries):
+            break
+        carry = text[cut:]
+    else:
+        text = carry + decoder.decode(b'', final=True)
+        found |= matcher.match_entries(text, exclude=found)
+
+    counts = defaultdict(int)
+    for index in sorted(found):
+        counts[matcher.entries[index][0]] += 1
+    return dict(counts)
+
+def scan_file(path, full=False, deadline=None):
+    """
+    Return {domain: hits} for one source file, or {} if it can't be read.
+
+    Only the first SCAN_CHARS characters are matched unless `full` is set,
+    in which case the whole file is streamed, and abandoned (returning
+    None) if time.monotonic() reaches `deadline` first.
+    """
+    if full:
+        return scan_file_streaming(path, deadline)
+    try:
+        content = Path(path).read_text()[:SCAN_CHARS]  # First 5k chars
+    except:
+        return {}
+    return dict(get_matcher().domain_counts(content))
+
+def scan_blob(data, full=False):
+    """
+    scan_file() for a blob's contents; returns {} for missing and binary
+    blobs and, unless `full` is set, for blobs that aren't valid UTF-8.
+    """
+    if data is None or b'\0' in data[:SNIFF_BYTES]:
+        return {}
+    if full:
+        return _scan_chunks(data[offset:offset + STREAM_CHUNK_BYTES]
+                            for offset in range(0, len(data), STREAM_CHUNK_BYTES))
+    # Decode only what can hold SCAN_CHARS characters; a character cut in
+    # half at the end stays in the incremental decoder
+    try:
+        content = codecs.getincrementaldecoder('utf-8')().decode(data[:SCAN_CHARS * 4])
+    except UnicodeDecodeError:
+        return {}
+    return dict(get_matcher().domain_counts(content[:SCAN_CHARS]))
+
+def scan_files(paths, full=False):
+    """
+    Scan each of `paths`, returning {path: {domain: hits}} in path order.
+
+    Runs in the parent for serial scans and in pool workers for parallel
+    ones, so it only takes and returns picklable values.
+    """
+    return {str(path): scan_file(path, full) for path in paths}
+
+def scan_files_parallel(paths, jobs, full=False):
+    """
+    Scan `paths` across a pool of `jobs` worker processes.
+
+    Each worker scans a contiguous slice and returns its partial results.
+    Slices are merged in order, so results (including domain order) match a
+    serial scan. Falls back to a serial scan if a pool can't be started.
+    """
+    paths = [str(p) for p in paths]
+    chunk_count = min(len(paths), jobs * 4)
+    chunk_size = -(-len(paths) // chunk_count)
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            partials = list(pool.map(partial(scan_files, full=full), chunks))
+    except (OSError, NotImplementedError):
+        return scan_files(paths, full)
+
+    results = {}
+    for chunk_results in partials:
+        results.update(chunk_results)
+    return results
+
+def _scan_fingerprint(full=False):
+    """Identify the patterns and limits that cached hits were computed with."""
+    from expertise_patterns import TECH_PATTERNS
+    spec = json.dumps([TECH_PATTERNS, 'full' if full else SCAN_CHARS], sort_keys=True)
+    return hashlib.sha1(spec.encode()).hexdigest()
+
+def _file_cache(use_cache, verify_hash, full, deadline=None):
+    """Open the working-tree scan cache, which full-file scans keep separately."""
+    cache_path = scan_cache.FULL_PATH if full else scan_cache.PATH
+    return scan_cache.FileCache(cache_path, _scan_fingerprint(full), verify_hash, use_cache, deadline)
+
+def scan_source_files(files, jobs=1, use_cache=True, verify_hash=False, full=False):
+    """
+    Return {path: {domain: hits}} for `files`, in file order.
+
+    With use_cache, only files changed since the last scan are read; the
+    cache is updated with the new results and loses entries for deleted
+    files. Full-file scans keep a cache of their own.
+    """
+    cache = _file_cache(use_cache, verify_hash, full)
+    results = {}
+    for path in map(str, files):
+        try:
+            results[path] = cache.lookup(path)
+        except OSError:
+            continue
+
+    stale = [path for path, hits in results.items() if hits is None]
+    if jobs > 1 and len(stale) > 1:
+        scanned = scan_files_parallel(stale, jobs, full)
+    else:
+        scanned = scan_files(stale, full)
+    for path, hits in scanned.items():
+        results[path] = hits
+        cache.store(path, hits)
+    cache.save()
+    return results
+
+def scan_tree_files(tree, paths, reader, use_cache=True, full=False):
+    """
+    Return {path: {domain: hits}} for `paths` of a git tree, in path order.
+
+    Results are cached by blob SHA, so a blob already scanned for any
+    revision is never read again. The others are streamed through
+    `reader` in one batch.
+    """
+    cache_path = scan_cache.FULL_BLOB_PATH if full else scan_cache.BLOB_PATH
+    cached = scan_cache.load(cache_path, _scan_fingerprint(full)) if use_cache else {}
+    shas = {path: tree[path][0] for path in paths}
+
+    stale = [sha for sha in dict.fromkeys(shas.values()) if sha not in cached]
+    scanned = {sha: scan_blob(data, full) for sha, data in reader.blobs(stale)}
+
+    if use_cache and scanned:
+        cached.update(scanned)
+        if len(cached) > scan_cache.BLOB_MAX_ENTRIES:
+            cached = {sha: cached[sha] for sha in shas.values()}
+        try:
+            scan_cache.save(cached, cache_path, _scan_fingerprint(full))
+        except OSError:
+            pass
+
+    return {path: scanned[sha] if sha in scanned else cached[sha] for path, sha in shas.items()}
+
+ASSESSMENT_PATH = Path('.company/artifacts/hiring-manager/assessment.json')
+
+# Where --batch writes one assessment per goal, as <goal id>.json
+BATCH_ASSESSMENT_DIR = Path('.company/artifacts/hiring-manager/assessments')
+
+# Files whose presence at the top of the tree marks a domain
+CONFIG_CHECKS = [
+    ('package.json', ['frontend-react', 'backend-node']),
+    ('requirements.txt', ['backend-python']),
+    ('go.mod', ['backend-go']),
+    ('Cargo.toml', ['backend-rust']),
+    ('Dockerfile', ['infra-docker']),
+    ('docker-compose.yml', ['infra-docker']),
+]
+
+def codebase_scores(has_file, deps, file_hits, all_files=False):
+    """
+    Combine config files (`has_file` tests for one), manifest dependencies
+    and per-file hits into {domain: score}.
+    """
     detected = defaultdict(int)
 
     # Check for config files
-    config_checks = [
-        ('package.json', ['frontend-react', 'backend-node']),
-        ('requirements.txt', ['backend-python']),
-        ('go.mod', ['backend-go']),
-        ('Cargo.toml', ['backend-rust']),
-        ('Dockerfile', ['infra-docker']),
-        ('docker-compose.yml', ['infra-docker']),
-    ]
-
-    for config_file, domains in config_checks:
-        if Path(config_file).exists():
+    for config_file, domains in CONFIG_CHECKS:
+        if has_file(config_file):
             for domain in domains:
                 detected[domain] += 5  # High confidence for config files
 
-    # Read package.json if exists
-    pkg_path = Path('package.json')
-    if pkg_path.exists():
-        try:
-            pkg = json.loads(pkg_path.read_text())
-            deps = {**pkg.get('dependencies', {}), **pkg.get('devDependencies', {})}
-
-            for dep in deps:
-                for domain, patterns in TECH_PATTERNS.items():
-                    for pattern in patterns:
-                        if re.search(pattern, dep, re.IGNORECASE):
-                            detected[domain] += 3
-        except:
-            pass
+    if deps:
+        for domain, score in get_dependency_classifier().score(deps).items():
+            detected[domain] += score
 
-    # Scan source files (limited)
-    for ext in ['ts', 'tsx', 'js', 'jsx', 'py', 'go', 'rs']:
-        for file in list(Path('.').rglob(f'*.{ext}'))[:50]:  # Limit scanning
-            try:
-                content = file.read_text()[:5000]  # First 5k chars
-                for domain, patterns in TECH_PATTERNS.items():
-                    for pattern in patterns:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            detected[domain] += 1
-            except:
-                pass
+    from expertise_patterns import TECH_PATTERNS
+    matrix = domain_scoring.HitMatrix.from_hits(TECH_PATTERNS, file_hits.values())
+    if all_files:
+        scores = matrix.domain_scores('sublinear', FILES_PER_EXTENSION * len(SOURCE_EXTENSIONS))
+    else:
+        scores = matrix.domain_scores('count')
+    for domain, score in scores.items():
+        detected[domain] += score
 
     return dict(detected)
 
+def scan_revision(rev, use_cache=True, full=False, all_files=False):
+    """
+    scan_codebase() for a git revision, without checking it out.
+
+    The tree is listed with one `git ls-tree` and every blob is read
+    through one `git cat-file --batch` process. Binary blobs are sniffed
+    and skipped before they take a sample slot, as in the working tree.
+    Raises git_objects.GitError if git fails or `rev` doesn't exist.
+    """
+    tree = git_objects.list_tree(rev)
+    with git_objects.BlobReader() as reader:
+        manifests = list(iter_tree_files(tree, reader, max_bytes=MAX_STREAM_BYTES,
+                                         match=dependency_manifests.is_manifest))
+        blobs = reader.blobs(tree[path][0] for path in manifests)
+        deps = dependency_manifests.parse_manifests(
+            (path, (data or b'').decode('utf-8', errors='replace'))
+            for path, (_, data) in zip(manifests, blobs))
+
+        def accept(path):
+            return is_source_blob(tree[path][0], reader)
+
+        files = sample_source_files(
+            iter_tree_files(tree, reader, max_bytes=MAX_STREAM_BYTES if full else MAX_SOURCE_BYTES),
+            per_extension=None if all_files else FILES_PER_EXTENSION, accept=accept)
+        file_hits = scan_tree_files(tree, files, reader, use_cache=use_cache, full=full)
+
+    return codebase_scores(tree.__contains__, deps, file_hits, all_files)
+
+# Files kept per (top-level directory, extension) stratum by --budget-ms
+BUDGET_FILES_PER_STRATUM = 25
+
+# Share of a scan budget the walk may use before scanning starts
+BUDGET_WALK_SHARE = 0.5
+
+def _stratum(path):
+    """A file's sampling stratum: its top-level directory and extension."""
+    top = path.split('/', 1)[0] if '/' in path else ''
+    return top, path.rsplit('.', 1)[1]
+
+def scan_within_budget(budget_ms, use_cache=True, verify_hash=False, full=False):
+    """
+    Time-budgeted scan_codebase(): returns (detected, sampling) within
+    about `budget_ms` milliseconds, however large the tree.
+
+    A breadth-first walk, cut off after BUDGET_WALK_SHARE of the budget,
+    feeds source files into per-stratum reservoirs (see scan_sampling) and
+    collects the manifests; only files that take a reservoir slot are
+    checked for size and binary content. Cached results for sampled files
+    are used as they are; the rest are scanned round-robin across strata
+    until the deadline, less the time saving the cache should take. A
+    cache too big to load in time is skipped, and a --full stream still
+    running at the deadline is abandoned. File scores are the stratified per-file averages scaled to
+    the usual FILES_PER_EXTENSION sample, so they line up with the
+    "required" thresholds. `sampling` reports the coverage and a
+    per-domain confidence.
+    """
+    started = time.monotonic()
+    deadline = started + budget_ms / 1000
+    walk_deadline = started + budget_ms * BUDGET_WALK_SHARE / 1000
+
+    def wanted(name):
+        return name.endswith(tuple(f'.{ext}' for ext in SOURCE_EXTENSIONS)) or dependency_manifests.is_manifest(name)
+
+    max_bytes = MAX_STREAM_BYTES if full else MAX_SOURCE_BYTES
+
+    def accept(path):
+        return is_source_file(path, max_bytes)
+
+    sample = scan_sampling.StratifiedSample(BUDGET_FILES_PER_STRATUM)
+    manifests = []
+    for path in iter_source_files(max_bytes=max_bytes, match=wanted, breadth_first=True,
+                                  deadline=walk_deadline, check_files=False):
+        if dependency_manifests.is_manifest(path.rsplit('/', 1)[-1]):
+            if accept(path):
+                manifests.append(path)
+        else:
+            sample.add(_stratum(path), path, accept)
+    complete = time.monotonic() < walk_deadline
+
+    def manifests_in_time():
+        for path in manifests:
+            if time.monotonic() >= deadline:
+                return
+            yield path
+
+    deps = dependency_manifests.read_dependencies(manifests_in_time())
+
+    cache = _file_cache(use_cache, verify_hash, full, deadline)
+    file_hits = {}
+    stale = []
+    for path in sample.interleaved():
+        if time.monotonic() >= deadline:
+            break
+        try:
+            hits = cache.lookup(path)
+        except OSError:
+            continue
+        if hits is None:
+            stale.append(path)
+        else:
+            file_hits[path] = hits
+
+    scan_deadline = deadline - cache.io_seconds()
+    for path in stale:
+        if time.monotonic() >= scan_deadline:
+            break
+        hits = scan_file(path, full, scan_deadline)
+        if hits is None:
+            break
+        file_hits[path] = hits
+        cache.store(path, hits)
+    cache.save()
+
+    means, confidence = scan_sampling.estimate(sample, file_hits, complete)
+    detected = codebase_scores(os.path.exists, deps, {})
+    files_found = sum(sample.seen.values())
+    scale = min(files_found, FILES_PER_EXTENSION * len(SOURCE_EXTENSIONS))
+    for domain, mean in means.items():
+        detected[domain] = detected.get(domain, 0) + round(mean * scale, 2)
+
+    sampling = {
+        'budget_ms': budget_ms,
+        'elapsed_ms': round((time.monotonic() - started) * 1000),
+        'walk_complete': complete,
+        'files_found': files_found,
+        'files_sampled': sum(len(r) for r in sample.reservoirs.values()),
+        'files_scanned': len(file_hits),
+        'strata': len(sample.reservoirs),
+        'domain_confidence': confidence
+    }
+    return detected, sampling
+
+def scan_codebase(jobs=1, use_cache=True, verify_hash=False, full=False, all_files=False, rev=None):
+    """
+    Scan the codebase for technology indicators.
+
+    With jobs > 1, source files are read and matched in a process pool.
+    With use_cache, files unchanged since the last scan are not re-read.
+    With full, whole files are streamed instead of reading the first 5k
+    characters. With all_files, every source file is scored instead of the
+    first FILES_PER_EXTENSION of each extension, using sublinear weighting
+    normalized to the size of the usual sample (see domain_scoring). With
+    rev, the files of that git revision are scanned instead of the working
+    tree (see scan_revision; jobs and verify_hash don't apply).
+    """
+    if rev is not None:
+        return scan_revision(rev, use_cache=use_cache, full=full, all_files=all_files)
+
+    # Classify the dependencies of every manifest and lockfile in the tree
+    manifests = iter_source_files(max_bytes=MAX_STREAM_BYTES, match=dependency_manifests.is_manifest)
+    deps = dependency_manifests.read_dependencies(manifests)
+
+    # Scan source files (limited unless all_files)
+    files = list_source_files(max_bytes=MAX_STREAM_BYTES if full else MAX_SOURCE_BYTES,
+                              per_extension=None if all_files else FILES_PER_EXTENSION)
+    file_hits = scan_source_files(files, jobs=jobs, use_cache=use_cache,
+                                  verify_hash=verify_hash, full=full)
+
+    return codebase_scores(os.path.exists, deps, file_hits, all_files)
+
 def analyze_text(text):
     """Analyze text (goal/description) for technology mentions."""
     detected = defaultdict(int)
     text_lower = text.lower()
 
-    # Check patterns
-    for domain, patterns in TECH_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower):
-                detected[domain] += 2
+    # Check patterns (case-sensitive against the lowercased text)
+    for domain, count in get_matcher().domain_counts(text_lower, ignore_case=False).items():
+        detected[domain] += 2 * count
 
     # Check keywords
+    from expertise_patterns import KEYWORDS
     for keyword, domains in KEYWORDS.items():
         if keyword in text_lower:
             for domain in domains:
@@ -172,23 +603,54 @@ def analyze_text(text):
 
 def get_current_roster():
     """Get list of currently available specialists."""
-    roster_path = Path('.company/roster.json')
-    if roster_path.exists():
-        roster = json.loads(roster_path.read_text())
-        return [s['id'] for s in roster.get('specialists', [])]
-    return []
+    return RosterStore().ids()
+
+def _scan(budget_ms=None, **scan_options):
+    """Return (detected, sampling) from scan_codebase, or scan_within_budget given a budget."""
+    if budget_ms is None:
+        return scan_codebase(**scan_options), None
+    return scan_within_budget(budget_ms, use_cache=scan_options.get('use_cache', True),
+                              verify_hash=scan_options.get('verify_hash', False),
+                              full=scan_options.get('full', False))
 
-def evaluate(goal_text):
+def evaluate(goal_text, **scan_options):
     """
     Evaluate expertise needs for a goal.
 
+    `scan_options` are passed through to scan_codebase, or to
+    scan_within_budget when they include budget_ms.
     Returns assessment dict.
     """
     # Analyze the goal text
     text_detected = analyze_text(goal_text)
 
     # Scan codebase
-    code_detected = scan_codebase()
+    code_detected, sampling = _scan(**scan_options)
+
+    return build_assessment(text_detected, code_detected, sampling=sampling)
+
+def evaluate_many(goal_texts, **scan_options):
+    """
+    Evaluate several goals against one codebase scan.
+
+    The scan and the roster don't depend on the goal, so they are done
+    once; only analyze_text runs per goal. Returns one assessment per goal,
+    in order.
+    """
+    code_detected, sampling = _scan(**scan_options)
+    roster = RosterStore()
+    return [build_assessment(analyze_text(goal_text), code_detected, roster, sampling)
+            for goal_text in goal_texts]
+
+def build_assessment(text_detected, code_detected, roster=None, sampling=None):
+    """
+    Rank a goal's and a codebase's domain scores into an assessment dict.
+
+    `roster` is a RosterStore; the current roster is loaded if it's None.
+    `sampling` comes from scan_within_budget: each domain's confidence is
+    scaled by how well the sample covered it, and the report is included.
+    """
+    sample_confidence = sampling['domain_confidence'] if sampling else {}
 
     # Combine scores
     combined = defaultdict(int)
@@ -197,65 +659,168 @@ def evaluate(goal_text):
     for domain, score in code_detected.items():
         combined[domain] += score
 
-    # Sort by score
-    sorted_domains = sorted(combined.items(), key=lambda x: x[1], reverse=True)
+    # Rank the domains over the "required" threshold, best first
+    candidates = {domain: score for domain, score in combined.items() if score >= 2}
+    ranked = domain_scoring.top_k(candidates, len(candidates))
 
     # Get current roster
-    current_roster = get_current_roster()
+    if roster is None:
+        roster = RosterStore()
 
     # Build assessment
     required = []
     gaps = []
 
-    for domain, score in sorted_domains:
-        if score >= 2:  # Threshold for "required"
-            priority = 'critical' if score >= 5 else 'high' if score >= 3 else 'medium'
-            required.append({
+    for domain, score in ranked:
+        priority = 'critical' if score >= 5 else 'high' if score >= 3 else 'medium'
+        required.append({
+            'domain': domain,
+            'priority': priority,
+            'confidence': round(min(score, 10) / 10 * sample_confidence.get(domain, 1.0), 2)
+        })
+
+        if domain not in roster:
+            gaps.append({
                 'domain': domain,
                 'priority': priority,
-                'confidence': min(score, 10) / 10
+                'action': 'hire'
             })
 
-            if domain not in current_roster:
-                gaps.append({
-                    'domain': domain,
-                    'priority': priority,
-                    'action': 'hire'
-                })
-
     assessment = {
         'detected_stack': {
             'from_text': list(text_detected.keys()),
             'from_codebase': list(code_detected.keys())
         },
         'required_expertise': required[:10],  # Top 10
-        'current_roster': current_roster,
+        'current_roster': roster.ids(),
         'gaps': gaps[:5],  # Top 5 gaps
         'recommendations': {
             'immediate_hires': [g['domain'] for g in gaps if g['priority'] == 'critical'],
             'suggested_hires': [g['domain'] for g in gaps if g['priority'] != 'critical']
         }
     }
+    if sampling:
+        assessment['sampling'] = sampling
 
     return assessment
 
+def run_batch(source, output_dir=BATCH_ASSESSMENT_DIR, **scan_options):
+    """
+    Evaluate every goal in `source` against one scan and write
+    output_dir/<goal id>.json for each, printing one JSON line per goal.
+    """
+    goals = read_goals(source)
+    assessments = iter(evaluate_many([goal_text for _, goal_text, error in goals if not error],
+                                     **scan_options))
+
+    for goal_id, goal_text, error in goals:
+        if error:
+            print(json.dumps({'id': goal_id, 'error': error}), flush=True)
+            continue
+        assessment = next(assessments)
+        path = Path(output_dir) / f'{goal_filename(goal_id)}.json'
+        atomic_write.write_json(path, assessment, indent=2)
+        print(json.dumps({
+            'id': goal_id,
+            'goal': goal_text,
+            'assessment': str(path),
+            'gaps': [gap['domain'] for gap in assessment['gaps']],
+            'recommendations': assessment['recommendations']
+        }), flush=True)
+
+def parse_args(argv):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        usage="evaluate_expertise.py [options] '<goal text>' | --batch <goals.txt|goals.jsonl|->",
+        description='Evaluate the expertise a goal needs against the current roster.')
+    parser.add_argument('goal', nargs='*', help='goal text')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='scan source files with N worker processes (0 = one per CPU)')
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help='rescan every file instead of using .company/cache/scan-cache.json')
+    parser.add_argument('--hash', dest='verify_hash', action='store_true',
+                        help='compare content hashes for files whose mtime changed')
+    parser.add_argument('--full', action='store_true',
+                        help='stream whole source files instead of their first 5k characters')
+    parser.add_argument('--all-files', action='store_true',
+                        help=f'score every source file, not the first {FILES_PER_EXTENSION} per extension')
+    parser.add_argument('--rev', metavar='REF',
+                        help='scan a git branch, tag or commit instead of the working tree')
+    parser.add_argument('--budget-ms', type=int, metavar='MS',
+                        help='return the best assessment a stratified sample allows within MS milliseconds')
+    parser.add_argument('--batch', metavar='SOURCE',
+                        help='evaluate every goal in a file (plain lines or JSONL), or - for stdin, '
+                             f'writing one assessment each to {BATCH_ASSESSMENT_DIR}')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep the assessment file up to date as the tree changes')
+    parser.add_argument('--interval', type=float, default=2.0, metavar='SECONDS',
+                        help='polling interval for --watch')
+    parser.add_argument('--debounce', type=float, default=1.0, metavar='SECONDS',
+                        help='with --watch, how long the tree must stay unchanged before a rescan')
+    return parser.parse_args(argv)
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: evaluate_expertise.py '<goal text>'")
+    args = parse_args(sys.argv[1:])
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if args.budget_ms is not None and (args.rev or args.watch or args.all_files):
+        print("ERROR: --budget-ms samples the working tree and can't be combined with --rev, --watch or --all-files")
+        sys.exit(1)
+    if args.budget_ms is not None and args.jobs != 1:
+        print("ERROR: --budget-ms scans in one process and can't be combined with --jobs")
         sys.exit(1)
 
-    goal_text = ' '.join(sys.argv[1:])
+    if args.batch:
+        if args.watch or args.goal:
+            print("ERROR: --batch reads its goals from SOURCE; don't pass goal text or --watch with it")
+            sys.exit(1)
+        try:
+            run_batch(args.batch, jobs=jobs, use_cache=args.use_cache, verify_hash=args.verify_hash,
+                      full=args.full, all_files=args.all_files, rev=args.rev, budget_ms=args.budget_ms)
+        except git_objects.GitError as e:
+            print(f"ERROR: Could not read revision {args.rev}: {e}")
+            sys.exit(1)
+        except OSError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    if not args.goal:
+        print("Usage: evaluate_expertise.py [options] '<goal text>'")
+        print("       evaluate_expertise.py [options] --batch <goals.txt|goals.jsonl|->")
+        sys.exit(1)
+
+    goal_text = ' '.join(args.goal)
 
-    assessment = evaluate(goal_text)
+    if args.watch:
+        if args.rev:
+            print("ERROR: --watch follows the working tree and can't be combined with --rev")
+            sys.exit(1)
+        import asyncio
+        import assessment_watch
+        try:
+            asyncio.run(assessment_watch.watch_assessment(
+                goal_text, interval=args.interval, debounce=args.debounce, jobs=jobs,
+                use_cache=args.use_cache, verify_hash=args.verify_hash, full=args.full,
+                all_files=args.all_files))
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    try:
+        assessment = evaluate(goal_text, jobs=jobs, use_cache=args.use_cache,
+                              verify_hash=args.verify_hash, full=args.full,
+                              all_files=args.all_files, rev=args.rev, budget_ms=args.budget_ms)
+    except git_objects.GitError as e:
+        print(f"ERROR: Could not read revision {args.rev}: {e}")
+        sys.exit(1)
 
     print(json.dumps(assessment, indent=2))
 
     # Also write to file
-    output_path = Path('.company/artifacts/hiring-manager/assessment.json')
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(assessment, indent=2))
+    atomic_write.write_json(ASSESSMENT_PATH, assessment, indent=2)
 
-    print(f"\nAssessment written to: {output_path}")
+    print(f"\nAssessment written to: {ASSESSMENT_PATH}")
 
 if __name__ == '__main__':
     main()
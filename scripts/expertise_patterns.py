@@ -0,0 +1,179 @@
+"""
+Technology detection patterns, goal keywords and known dependency names
+for evaluate_expertise.py.
+
+Kept in their own module so they are only loaded (from cached bytecode)
+when an assessment actually needs them.
+"""
+
+# Technology detection patterns
+TECH_PATTERNS = {
+    # Frontend frameworks
+    'frontend-react': [
+        r'react', r'\.jsx', r'\.tsx', r'next\.js', r'next\.config',
+        r'react-dom', r'useState', r'useEffect', r'redux', r'zustand'
+    ],
+    'frontend-vue': [
+        r'vue', r'\.vue', r'vuex', r'pinia', r'nuxt', r'composition api'
+    ],
+    'frontend-angular': [
+        r'angular', r'@angular', r'\.component\.ts', r'rxjs', r'ngrx'
+    ],
+    'frontend-svelte': [
+        r'svelte', r'\.svelte', r'sveltekit'
+    ],
+
+    # Backend frameworks
+    'backend-node': [
+        r'express', r'fastify', r'nestjs', r'koa', r'node\.js',
+        r'package\.json.*server', r'npm.*start'
+    ],
+    'backend-python': [
+        r'python', r'\.py', r'fastapi', r'django', r'flask',
+        r'requirements\.txt', r'pyproject\.toml'
+    ],
+    'backend-go': [
+        r'golang', r'go\.mod', r'\.go', r'gin', r'echo', r'chi'
+    ],
+    'backend-rust': [
+        r'rust', r'cargo\.toml', r'\.rs', r'actix', r'axum', r'rocket'
+    ],
+
+    # Databases
+    'database-postgresql': [
+        r'postgres', r'postgresql', r'pg_', r'psycopg'
+    ],
+    'database-mongodb': [
+        r'mongo', r'mongodb', r'mongoose'
+    ],
+    'database-redis': [
+        r'redis', r'ioredis', r'redis-py'
+    ],
+
+    # Infrastructure
+    'infra-docker': [
+        r'docker', r'dockerfile', r'docker-compose', r'container'
+    ],
+    'infra-kubernetes': [
+        r'kubernetes', r'k8s', r'kubectl', r'helm', r'\.yaml.*kind:'
+    ],
+    'cloud-aws': [
+        r'aws', r'lambda', r's3', r'ec2', r'ecs', r'cloudformation', r'cdk'
+    ],
+    'cloud-gcp': [
+        r'gcp', r'google cloud', r'cloud run', r'firebase', r'gke'
+    ],
+
+    # Testing
+    'testing-e2e': [
+        r'playwright', r'cypress', r'puppeteer', r'e2e', r'end.to.end'
+    ],
+    'testing-unit': [
+        r'jest', r'vitest', r'mocha', r'pytest', r'junit', r'\.test\.'
+    ],
+
+    # Other
+    'ui-css': [
+        r'tailwind', r'css', r'sass', r'styled-components', r'emotion'
+    ],
+    'security': [
+        r'security', r'oauth', r'jwt', r'authentication', r'encryption'
+    ]
+}
+
+# Keyword to domain mapping
+KEYWORDS = {
+    'authentication': ['security', 'backend-node'],
+    'login': ['security', 'frontend-react'],
+    'dashboard': ['frontend-react', 'ui-css'],
+    'api': ['backend-node'],
+    'database': ['database-postgresql'],
+    'real-time': ['backend-node'],
+    'machine learning': ['backend-python'],
+    'ml': ['backend-python'],
+    'ai': ['backend-python'],
+    'mobile': ['frontend-react'],
+    'responsive': ['ui-css'],
+    'testing': ['testing-unit', 'testing-e2e'],
+    'deployment': ['infra-docker', 'cicd-github'],
+    'ci/cd': ['cicd-github'],
+}
+
+# Dependencies classified by exact (normalized) package name. Python names
+# use their PEP 503 form, Go modules their full module path.
+DEPENDENCY_DOMAINS = {
+    # Frontend frameworks
+    'react': ['frontend-react'], 'react-dom': ['frontend-react'], 'next': ['frontend-react'],
+    'redux': ['frontend-react'], '@reduxjs/toolkit': ['frontend-react'], 'zustand': ['frontend-react'],
+    'vue': ['frontend-vue'], 'vuex': ['frontend-vue'], 'pinia': ['frontend-vue'], 'nuxt': ['frontend-vue'],
+    'rxjs': ['frontend-angular'],
+    'svelte': ['frontend-svelte'],
+
+    # Backend frameworks
+    'express': ['backend-node'], 'fastify': ['backend-node'], 'koa': ['backend-node'],
+    'django': ['backend-python'], 'djangorestframework': ['backend-python'], 'fastapi': ['backend-python'],
+    'flask': ['backend-python'], 'starlette': ['backend-python'], 'uvicorn': ['backend-python'],
+    'gunicorn': ['backend-python'],
+    'github.com/go-chi/chi': ['backend-go'],
+    'actix-web': ['backend-rust'], 'axum': ['backend-rust'], 'rocket': ['backend-rust'],
+    'warp': ['backend-rust'], 'tokio': ['backend-rust'],
+
+    # Databases
+    'pg': ['database-postgresql'], 'postgres': ['database-postgresql'], 'psycopg': ['database-postgresql'],
+    'psycopg2': ['database-postgresql'], 'psycopg2-binary': ['database-postgresql'],
+    'asyncpg': ['database-postgresql'], 'tokio-postgres': ['database-postgresql'],
+    'github.com/lib/pq': ['database-postgresql'],
+    'mongodb': ['database-mongodb'], 'mongoose': ['database-mongodb'], 'pymongo': ['database-mongodb'],
+    'motor': ['database-mongodb'], 'mongoengine': ['database-mongodb'],
+    'redis': ['database-redis'], 'ioredis': ['database-redis'], 'aioredis': ['database-redis'],
+
+    # Infrastructure
+    'dockerode': ['infra-docker'], 'docker': ['infra-docker'],
+    'kubernetes': ['infra-kubernetes'], '@kubernetes/client-node': ['infra-kubernetes'],
+    'kube': ['infra-kubernetes'],
+    'aws-sdk': ['cloud-aws'], 'aws-cdk-lib': ['cloud-aws'], 'boto3': ['cloud-aws'], 'botocore': ['cloud-aws'],
+    'firebase': ['cloud-gcp'], 'firebase-admin': ['cloud-gcp'],
+
+    # Testing
+    'playwright': ['testing-e2e'], 'cypress': ['testing-e2e'], 'puppeteer': ['testing-e2e'],
+    'selenium': ['testing-e2e'], 'webdriverio': ['testing-e2e'], 'pytest-playwright': ['testing-e2e'],
+    'jest': ['testing-unit'], 'vitest': ['testing-unit'], 'mocha': ['testing-unit'], 'chai': ['testing-unit'],
+    'ts-jest': ['testing-unit'], 'pytest': ['testing-unit'],
+    'github.com/stretchr/testify': ['testing-unit'],
+
+    # Other
+    'tailwindcss': ['ui-css'], 'sass': ['ui-css'], 'postcss': ['ui-css'], 'less': ['ui-css'],
+    'styled-components': ['ui-css'],
+    'jsonwebtoken': ['security'], 'passport': ['security'], 'bcrypt': ['security'], 'bcryptjs': ['security'],
+    'helmet': ['security'], 'jose': ['security'], 'pyjwt': ['security'], 'cryptography': ['security'],
+    'authlib': ['security'], 'oauthlib': ['security'], 'argon2': ['security'],
+}
+
+# Dependencies classified by name prefix, ending at a '/' or '-' boundary;
+# the longest matching prefix wins and exact names take precedence
+DEPENDENCY_PREFIXES = {
+    'react-': ['frontend-react'], '@next/': ['frontend-react'],
+    'vue-': ['frontend-vue'], '@vue/': ['frontend-vue'], '@nuxt/': ['frontend-vue'],
+    '@angular/': ['frontend-angular'], '@ngrx/': ['frontend-angular'],
+    'svelte-': ['frontend-svelte'], '@sveltejs/': ['frontend-svelte'],
+    '@nestjs/': ['backend-node'], '@fastify/': ['backend-node'], 'koa-': ['backend-node'],
+    '@hapi/': ['backend-node'],
+    'django-': ['backend-python'], 'flask-': ['backend-python'],
+    'github.com/gin-gonic/': ['backend-go'], 'github.com/labstack/': ['backend-go'],
+    'github.com/gofiber/': ['backend-go'], 'github.com/gorilla/': ['backend-go'],
+    'actix-': ['backend-rust'],
+    'pg-': ['database-postgresql'], 'github.com/jackc/': ['database-postgresql'],
+    'go.mongodb.org/': ['database-mongodb'],
+    '@redis/': ['database-redis'], 'github.com/redis/': ['database-redis'],
+    'github.com/go-redis/': ['database-redis'],
+    'k8s.io/': ['infra-kubernetes'], 'sigs.k8s.io/': ['infra-kubernetes'],
+    '@aws-sdk/': ['cloud-aws'], '@aws-cdk/': ['cloud-aws'], 'aws-cdk-': ['cloud-aws'],
+    'aws-sdk-': ['cloud-aws'], 'github.com/aws/': ['cloud-aws'],
+    '@google-cloud/': ['cloud-gcp'], 'google-cloud-': ['cloud-gcp'], '@firebase/': ['cloud-gcp'],
+    'cloud.google.com/': ['cloud-gcp'],
+    '@playwright/': ['testing-e2e'], 'cypress-': ['testing-e2e'],
+    'jest-': ['testing-unit'], '@jest/': ['testing-unit'], 'pytest-': ['testing-unit'],
+    '@testing-library/': ['testing-unit'], '@vitest/': ['testing-unit'],
+    '@tailwindcss/': ['ui-css'], '@emotion/': ['ui-css'],
+    'passport-': ['security'], 'github.com/golang-jwt/': ['security'],
+}
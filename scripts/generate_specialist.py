@@ -2,131 +2,34 @@
 """
 Generates specialist skill files based on domain expertise.
 Called by the hiring manager to create new specialists.
+
+Pipeline mode (--from-assessment) hires every gap in an expertise
+assessment in one run: SKILL.md files are rendered in parallel and the
+roster is updated with a single atomic write.
 """
 
+import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-# Domain definitions with expertise details
-DOMAINS = {
-    'frontend-react': {
-        'title': 'React Frontend',
-        'description': 'React specialist - components, hooks, state management, and Next.js',
-        'expertise': ['React', 'TypeScript', 'Hooks', 'Redux/Zustand', 'Next.js', 'React Testing Library'],
-        'file_patterns': 'src/**/*.tsx',
-        'lint_command': 'npm run lint --silent 2>/dev/null || true',
-        'best_practices': '''
-### Component Design
-- Use functional components with hooks
-- Keep components focused (single responsibility)
-- Extract custom hooks for reusable logic
-- Use TypeScript for type safety
-
-### State Management
-- Use local state for UI-only state
-- Use context for shared state
-- Use Zustand/Redux for complex app state
-- Avoid prop drilling
-
-### Performance
-- Use React.memo for expensive components
-- Use useMemo/useCallback appropriately
-- Lazy load routes and heavy components
-- Profile with React DevTools
-''',
-        'testing': '''
-### Unit Tests
-- Test component rendering
-- Test user interactions
-- Test hooks in isolation
-- Mock external dependencies
-
-### Integration Tests
-- Test component interactions
-- Test with React Testing Library
-- Test accessibility
-'''
-    },
-    'backend-node': {
-        'title': 'Node.js Backend',
-        'description': 'Node.js specialist - Express/Fastify, APIs, and server-side development',
-        'expertise': ['Node.js', 'Express', 'Fastify', 'TypeScript', 'REST APIs', 'Middleware'],
-        'file_patterns': 'src/**/*.ts',
-        'lint_command': 'npm run lint --silent 2>/dev/null || true',
-        'best_practices': '''
-### API Design
-- Use RESTful conventions
-- Validate all inputs
-- Return consistent error formats
-- Use proper HTTP status codes
-
-### Code Structure
-- Separate routes, controllers, services
-- Use dependency injection
-- Handle errors with middleware
-- Log appropriately
-
-### Security
-- Never trust user input
-- Use parameterized queries
-- Implement rate limiting
-- Secure headers with helmet
-''',
-        'testing': '''
-### Unit Tests
-- Test services in isolation
-- Mock database and external services
-- Test edge cases
-
-### Integration Tests
-- Test API endpoints with supertest
-- Test with real database (test instance)
-- Test authentication flows
-'''
-    },
-    'testing-e2e': {
-        'title': 'E2E Testing',
-        'description': 'E2E testing specialist - Playwright, Puppeteer, and browser automation',
-        'expertise': ['Playwright', 'Puppeteer', 'Cypress', 'Browser Automation', 'Visual Testing'],
-        'file_patterns': 'tests/**/*.spec.ts',
-        'lint_command': 'npm run lint --silent 2>/dev/null || true',
-        'best_practices': '''
-### Test Design
-- Use Page Object Model
-- Keep tests independent
-- Use stable selectors (data-testid)
-- Test user journeys, not implementation
-
-### Reliability
-- Wait for elements properly
-- Handle flaky tests
-- Use retry mechanisms
-- Run tests in CI
-
-### Maintenance
-- Keep page objects updated
-- Remove duplicate tests
-- Organize by feature
-''',
-        'testing': '''
-### E2E Test Patterns
-- Happy path tests for critical flows
-- Error case handling
-- Cross-browser testing
-- Mobile viewport testing
-
-### Visual Regression
-- Baseline screenshots
-- Comparison thresholds
-- Update baselines intentionally
-'''
-    }
-}
+import atomic_write
+from roster_store import ROSTER_PATH, RosterStore
+
+ASSESSMENT_PATH = '.company/artifacts/hiring-manager/assessment.json'
+
+def __getattr__(name):
+    """Expose DOMAINS, loaded from specialist_domains on first use."""
+    if name == 'DOMAINS':
+        from specialist_domains import DOMAINS
+        return DOMAINS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def generate_skill(domain_id):
     """Generate SKILL.md content for a domain."""
+    from specialist_domains import DOMAINS
 
     if domain_id in DOMAINS:
         domain = DOMAINS[domain_id]
@@ -188,7 +91,7 @@ user-invocable: false
 !`cat .company/state.json`
 
 ### Your Inbox
-!`find .company/inboxes/specialist-{domain_id} -name "*.json" -exec cat {{}} \\; 2>/dev/null || echo "No messages"`
+!`python .company/scripts/inbox.py read specialist-{domain_id} --ack 2>/dev/null || echo "No messages"`
 
 ### Your Assignment
 $ARGUMENTS
@@ -249,59 +152,146 @@ def create_specialist(domain_id, output_dir=None):
     else:
         base_path = Path('.claude/skills/company-specialists') / domain_id
 
-    base_path.mkdir(parents=True, exist_ok=True)
-
     # Generate and write SKILL.md
     skill_content = generate_skill(domain_id)
     skill_path = base_path / 'SKILL.md'
-    skill_path.write_text(skill_content)
-
-    print(f"Created specialist: {skill_path}")
-    return str(skill_path)
-
-def update_roster(domain_id, roster_path='.company/roster.json'):
-    """Add the new specialist to the roster."""
-    roster_file = Path(roster_path)
-
-    if roster_file.exists():
-        roster = json.loads(roster_file.read_text())
+    if atomic_write.write_text(skill_path, skill_content):
+        print(f"Created specialist: {skill_path}")
     else:
-        roster = {'specialists': [], 'roles': {}, 'stats': {}}
-
-    # Check if already exists
-    existing = [s for s in roster['specialists'] if s['id'] == domain_id]
-    if existing:
-        print(f"Specialist {domain_id} already in roster")
-        return
+        print(f"Specialist unchanged: {skill_path}")
+    return str(skill_path)
 
-    # Add new specialist
+def roster_entry(domain_id):
+    """Build the roster entry for a newly hired specialist."""
+    from specialist_domains import DOMAINS
     domain = DOMAINS.get(domain_id, {})
-    roster['specialists'].append({
+    return {
         'id': domain_id,
         'type': 'hired',
         'skill_path': f'company-specialists/{domain_id}',
         'created': datetime.now().isoformat(),
         'expertise': domain.get('expertise', [domain_id]),
         'description': domain.get('description', f'{domain_id} specialist')
-    })
-
-    # Update stats
-    roster['stats']['total_specialists_created'] = roster['stats'].get('total_specialists_created', 0) + 1
+    }
 
-    roster_file.write_text(json.dumps(roster, indent=2))
-    print(f"Added {domain_id} to roster")
+def update_roster_many(domain_ids, roster_path=ROSTER_PATH, store=None):
+    """
+    Add several specialists to the roster with one write.
+
+    `store` reuses a RosterStore the caller already opened. Returns the ids
+    that were added; ids already on the roster are skipped.
+    """
+    if store is None:
+        store = RosterStore(roster_path)
+
+    entries = []
+    for domain_id in dict.fromkeys(domain_ids):
+        if domain_id in store:
+            print(f"Specialist {domain_id} already in roster")
+        else:
+            entries.append(roster_entry(domain_id))
+
+    added = store.add(entries)
+    for domain_id in added:
+        print(f"Added {domain_id} to roster")
+    return added
+
+def update_roster(domain_id, roster_path=ROSTER_PATH):
+    """Add the new specialist to the roster."""
+    update_roster_many([domain_id], roster_path)
+
+def assessment_gaps(assessment_path=ASSESSMENT_PATH):
+    """
+    Return the domains an assessment says to hire, most urgent first.
+
+    Uses the recommendations, which list every gap; the `gaps` list itself
+    is cut to the top five.
+    """
+    assessment = json.loads(Path(assessment_path).read_text())
+    recommendations = assessment.get('recommendations', {})
+    domains = recommendations.get('immediate_hires', []) + recommendations.get('suggested_hires', [])
+    if not domains:
+        domains = [gap['domain'] for gap in assessment.get('gaps', [])]
+    # Drop duplicates, keeping order
+    return list(dict.fromkeys(domains))
+
+def hire_specialists(gaps, output_root=None, roster_path=ROSTER_PATH, jobs=None):
+    """
+    Create a specialist for every domain in `gaps` (see assessment_gaps()).
+
+    Domains already on the roster are skipped. SKILL.md files are rendered
+    and written in parallel; the roster is read once and written once at
+    the end. Returns {domain_id: skill_path}.
+    """
+    store = RosterStore(roster_path)
+    domain_ids = []
+    for domain_id in gaps:
+        if domain_id in store:
+            print(f"Specialist {domain_id} already in roster")
+        else:
+            domain_ids.append(domain_id)
+    if not domain_ids:
+        return {}
+
+    def create(domain_id):
+        output_dir = Path(output_root) / domain_id if output_root else None
+        return create_specialist(domain_id, output_dir)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        skill_paths = dict(zip(domain_ids, executor.map(create, domain_ids)))
+
+    update_roster_many(domain_ids, roster_path, store)
+    return skill_paths
+
+def parse_args(argv):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        usage='generate_specialist.py <domain-id> [output-dir] | --from-assessment [PATH]',
+        description='Create specialist skills and add them to the roster.')
+    parser.add_argument('domain_id', nargs='?', help='domain to create a specialist for')
+    parser.add_argument('output_dir', nargs='?', help='where to write SKILL.md')
+    parser.add_argument('--from-assessment', nargs='?', const=ASSESSMENT_PATH, metavar='PATH',
+                        help=f'hire every gap in an assessment (default: {ASSESSMENT_PATH})')
+    parser.add_argument('--output-root', metavar='DIR',
+                        help='with --from-assessment, write skills to DIR/<domain-id>')
+    parser.add_argument('--jobs', type=int, default=None, metavar='N',
+                        help='parallel SKILL.md writers (default: Python\'s thread pool default)')
+    return parser.parse_args(argv)
 
 def main():
-    if len(sys.argv) < 2:
+    args = parse_args(sys.argv[1:])
+
+    if args.from_assessment:
+        try:
+            gaps = assessment_gaps(args.from_assessment)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Could not read assessment {args.from_assessment}: {e}")
+            sys.exit(1)
+        try:
+            skill_paths = hire_specialists(gaps, args.output_root, jobs=args.jobs)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Could not create specialists or update the roster: {e}")
+            sys.exit(1)
+        if not skill_paths:
+            print("No new specialists to hire")
+            return
+        print(f"\n{len(skill_paths)} specialist(s) created from {args.from_assessment}")
+        for domain_id, skill_path in skill_paths.items():
+            print(f"  - {domain_id}: {skill_path}")
+        return
+
+    if not args.domain_id:
         print("Usage: generate_specialist.py <domain-id> [output-dir]")
+        print("       generate_specialist.py --from-assessment [assessment.json]")
         print("\nAvailable domains:")
+        from specialist_domains import DOMAINS
         for domain_id in DOMAINS:
             print(f"  - {domain_id}")
         print("\n(Other domain IDs will use a generic template)")
         sys.exit(1)
 
-    domain_id = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    domain_id = args.domain_id
+    output_dir = args.output_dir
 
     # Create specialist
     skill_path = create_specialist(domain_id, output_dir)
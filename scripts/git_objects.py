@@ -0,0 +1,106 @@
+"""
+Read files from a git revision without checking it out.
+
+list_tree() enumerates a revision's files with one `git ls-tree` call, and
+BlobReader streams their contents through a single long-lived
+`git cat-file --batch` process, so scanning a branch costs two
+subprocesses however many files it has.
+"""
+
+import subprocess
+import threading
+
+class GitError(Exception):
+    """A git command failed or git isn't available."""
+
+def list_tree(rev, cwd='.'):
+    """
+    Return {path: (blob_sha, size)} for every regular file in `rev`.
+
+    Like `git ls-tree`, only the part of the tree under `cwd` is listed and
+    paths are relative to it. Symlinks and submodules are left out.
+    """
+    try:
+        result = subprocess.run(['git', 'ls-tree', '-r', '-z', '--long', rev, '--'],
+                                cwd=cwd, capture_output=True)
+    except OSError as e:
+        raise GitError(f"Could not run git: {e}")
+    if result.returncode != 0:
+        raise GitError(result.stderr.decode(errors='replace').strip() or f"git ls-tree {rev} failed")
+
+    tree = {}
+    for record in result.stdout.split(b'\0'):
+        if not record:
+            continue
+        meta, path = record.split(b'\t', 1)
+        mode, kind, sha, size = meta.split()
+        if kind != b'blob' or mode == b'120000':
+            continue
+        tree[path.decode('utf-8', 'surrogateescape')] = (sha.decode(), int(size))
+    return tree
+
+class BlobReader:
+    """
+    A `git cat-file --batch` process serving every blob read of a scan.
+
+    Use as a context manager so the process is shut down afterwards.
+    """
+
+    def __init__(self, cwd='.'):
+        try:
+            self.process = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=cwd,
+                                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        except OSError as e:
+            raise GitError(f"Could not run git: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.stdout.close()
+        self.process.wait()
+
+    def read(self, sha):
+        """Return the contents of one object, or None if it doesn't exist."""
+        self.process.stdin.write(f'{sha}\n'.encode())
+        self.process.stdin.flush()
+        return self._read_object()
+
+    def blobs(self, shas):
+        """
+        Yield (sha, contents) for each of `shas`, in order.
+
+        Requests are written from a thread while this generator reads the
+        replies, so neither side blocks on a full pipe. The generator must
+        be consumed to the end before the reader is used again.
+        """
+        shas = list(shas)
+        writer = threading.Thread(target=self._write_requests, args=(shas,), daemon=True)
+        writer.start()
+        try:
+            for sha in shas:
+                yield sha, self._read_object()
+        finally:
+            writer.join()
+
+    def _write_requests(self, shas):
+        try:
+            self.process.stdin.write(''.join(f'{sha}\n' for sha in shas).encode())
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            pass  # The process died; the reader reports it
+
+    def _read_object(self):
+        header = self.process.stdout.readline()
+        if not header:
+            raise GitError("git cat-file exited unexpectedly")
+        fields = header.split()
+        if fields[-1] == b'missing':
+            return None
+        data = self.process.stdout.read(int(fields[2]))
+        self.process.stdout.read(1)  # Newline after the contents
+        return data
@@ -0,0 +1,64 @@
+"""
+Goal files for evaluate_expertise.py --batch.
+
+A goals file holds one goal per line, either plain text or a JSON object
+like {"id": "phase-2", "goal": "..."}; blank lines and # comments are
+skipped.
+"""
+
+import hashlib
+import json
+import re
+import sys
+
+def read_goals(source):
+    """
+    Return [(goal_id, goal_text, error)] for the goals in `source`.
+
+    `source` is a file or '-' for stdin, with one goal per line: either
+    plain text or a JSON object with a "goal" and an optional "id". Goals
+    without an id are numbered by line (goal-001, ...). Lines that fail to
+    parse, and goals reusing an earlier goal's id, come back with an error
+    and no text.
+    """
+    stream = sys.stdin if source == '-' else open(source)
+    goals = []
+    ids = set()
+    with stream:
+        for number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            goal_id = f'goal-{number:03d}'
+            if line.startswith('{'):
+                try:
+                    entry = json.loads(line)
+                    goal_text = entry['goal']
+                    if not isinstance(goal_text, str) or not goal_text.strip():
+                        raise ValueError('"goal" must be a non-empty string')
+                except (ValueError, KeyError, TypeError) as e:
+                    goals.append((goal_id, None, f'Invalid goal on line {number}: {e}'))
+                    continue
+                goal_id = str(entry.get('id') or goal_id)
+            else:
+                goal_text = line
+            if goal_id in ids:
+                goals.append((goal_id, None, f'Duplicate goal id {goal_id!r} on line {number}'))
+                continue
+            ids.add(goal_id)
+            goals.append((goal_id, goal_text, None))
+    return goals
+
+def goal_filename(goal_id):
+    """
+    A file name for a goal id, safe for any id a goals file might use.
+
+    Ids that are already safe are used as they are. Others are cleaned up
+    and suffixed with a hash of the raw id, so "a/b" and "a-b" don't end
+    up in the same file.
+    """
+    name = re.sub(r'[^A-Za-z0-9._-]+', '-', goal_id).strip('.-')
+    if name == goal_id:
+        return name
+    digest = hashlib.sha1(goal_id.encode()).hexdigest()[:8]
+    return f'{name}-{digest}' if name else f'goal-{digest}'
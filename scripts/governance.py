@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Compiled governance decision tables shared by the validators.
+
+Compiles .company/governance-matrix.json into frozenset lookup tables for
+handoff, task creation, completion, deletion and proposal rules, so every
+decision is a single set membership test. The compiled tables are cached
+in .company/cache/governance.marshal, keyed by the matrix file's mtime and
+size, so hook calls skip the JSON parse until the matrix changes.
+
+Usage: governance.py   Print the compiled tables
+"""
+
+import json
+import marshal
+import os
+
+import atomic_write
+
+# Plain string paths: hooks import this module, and pathlib is slow to import
+MATRIX_PATH = '.company/governance-matrix.json'
+CACHE_PATH = '.company/cache/governance.marshal'
+CACHE_VERSION = 1
+
+# Used when the matrix doesn't define these task permissions
+DEFAULT_COMPLETE_ROLES = ['owner', 'senior-dev', 'tech-lead']
+DEFAULT_DELETE_ROLES = ['tech-lead', 'architect', 'cto']
+
+def _enabled(flags):
+    """Return the names of the truthy entries in a {name: bool} section."""
+    return frozenset(name for name, value in flags.items() if value)
+
+def compile_matrix(matrix):
+    """Compile a parsed governance matrix into lookup tables."""
+    task_perms = matrix.get('task_permissions', {})
+    return {
+        'handoff': frozenset(
+            (from_role, to_role)
+            for from_role, targets in matrix.get('handoff_allowed', {}).items()
+            for to_role in targets),
+        'create_task': frozenset(
+            (from_role, target)
+            for from_role, targets in task_perms.get('create_task', {}).items()
+            for target in targets),
+        'complete_task': frozenset(task_perms.get('complete_task', DEFAULT_COMPLETE_ROLES)),
+        'delete_task': frozenset(task_perms.get('delete_task', DEFAULT_DELETE_ROLES)),
+        'auto_approve': _enabled(matrix.get('proposal_auto_approve', {})),
+        'needs_review': _enabled(matrix.get('proposal_needs_review', {})),
+        'needs_ceo': _enabled(matrix.get('proposal_needs_ceo', {})),
+    }
+
+class Governance:
+    """O(1) governance decisions over compiled tables."""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self._handoff = tables['handoff']
+        self._create_task = tables['create_task']
+        self.complete_roles = tables['complete_task']
+        self.delete_roles = tables['delete_task']
+        self._auto_approve = tables['auto_approve']
+        self._needs_review = tables['needs_review']
+        self._needs_ceo = tables['needs_ceo']
+
+    def can_handoff(self, from_role, to_role):
+        return (from_role, to_role) in self._handoff
+
+    def can_create_task(self, from_role, target_role):
+        return (from_role, target_role) in self._create_task
+
+    def can_complete(self, role):
+        return role in self.complete_roles
+
+    def can_delete(self, role):
+        return role in self.delete_roles
+
+    def auto_approves(self, rule):
+        return rule in self._auto_approve
+
+    def needs_review(self, proposal_type):
+        return proposal_type in self._needs_review
+
+    def needs_ceo(self, proposal_type):
+        return proposal_type in self._needs_ceo
+
+def _read_cache(cache_path, key):
+    """Return cached tables compiled for `key`, or None."""
+    try:
+        with open(cache_path, 'rb') as f:
+            version, cached_key, tables = marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if version != CACHE_VERSION or cached_key != key:
+        return None
+    return tables
+
+def _write_cache(cache_path, key, tables):
+    """Atomically write compiled tables to the on-disk cache."""
+    try:
+        atomic_write.write_bytes(cache_path, marshal.dumps((CACHE_VERSION, key, tables)))
+    except OSError:
+        pass
+
+_loaded = {}
+
+def load_governance(matrix_path=MATRIX_PATH, cache_path=CACHE_PATH):
+    """
+    Return a Governance for the matrix at `matrix_path`, or None if missing.
+
+    Checked in-process first, then in the on-disk cache; the matrix JSON is
+    only parsed when its mtime or size changed since it was last compiled.
+    """
+    try:
+        stat = os.stat(matrix_path)
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    memo = _loaded.get(str(matrix_path))
+    if memo and memo[0] == key:
+        return memo[1]
+
+    tables = _read_cache(cache_path, key)
+    if tables is None:
+        try:
+            with open(matrix_path) as f:
+                matrix = json.load(f)
+        except OSError:
+            return None
+        if not matrix:
+            return None
+        tables = compile_matrix(matrix)
+        _write_cache(cache_path, key, tables)
+
+    governance = Governance(tables)
+    _loaded[str(matrix_path)] = (key, governance)
+    return governance
+
+def main():
+    governance = load_governance()
+    if governance is None:
+        print(f"No governance matrix at {MATRIX_PATH}")
+        return
+    for name, table in governance.tables.items():
+        print(f"{name}: {sorted(table)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Thin entry point for the TaskUpdate hooks.
+
+Forwards the hook call to hook_daemon.py when one is listening, and
+otherwise runs the hook script in this process exactly as before. Only
+imports what the daemon round trip needs, so it starts quickly. The
+socket protocol lives here too; the daemon imports it.
+
+Usage: hook_client.py <validate_task_update|sync_notify>
+"""
+
+import os
+import sys
+
+SOCKET_PATH = '.company/run/hookd.sock'
+
+HOOKS = ('validate_task_update', 'sync_notify')
+
+# Storage settings the daemon must take from the caller, not its own environment
+OVERRIDE_ENV = ('COMPANY_SYNC_BACKEND', 'COMPANY_INBOX_STORAGE')
+
+# Environment variables the hook scripts read
+HOOK_ENV = ('TOOL_INPUT', 'CURRENT_ROLE', 'TASK_ID', 'NEW_STATUS', 'COMPANY_HOOK_TRACE') + OVERRIDE_ENV
+
+class DaemonUnavailable(OSError):
+    """No daemon accepted the connection, so the request never reached one."""
+
+def send_request(request, socket_path=SOCKET_PATH, timeout=5.0):
+    """
+    Send one newline-terminated JSON request to the daemon and return its reply.
+
+    Raises DaemonUnavailable if nothing accepted the connection, and
+    OSError or ValueError if a daemon got the request but didn't answer.
+    """
+    # Only needed when a daemon is listening, so not imported up front
+    import json
+    import socket
+    if not hasattr(socket, 'AF_UNIX'):
+        raise DaemonUnavailable("Unix sockets are not available on this platform")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            raise DaemonUnavailable(*e.args)
+        sock.sendall(json.dumps(request).encode() + b'\n')
+        return json.loads(sock.makefile('rb').readline())
+
+def call_daemon(hook, timeout=5.0):
+    """
+    Ask the hook daemon to run `hook`.
+
+    Returns the response dict, or None if no daemon is listening. Once the
+    request has been sent the hook may already have run (bumped a version,
+    written notifications), so a failure after that point is returned as
+    {'error': ...} rather than None, and must not be retried in-process.
+    """
+    if not os.path.exists(SOCKET_PATH):
+        return None
+
+    request = {
+        'hook': hook,
+        'env': {name: os.environ[name] for name in HOOK_ENV if name in os.environ}
+    }
+    try:
+        return send_request(request, timeout=timeout)
+    except DaemonUnavailable:
+        return None
+    except (OSError, ValueError) as e:
+        return {'error': f"no answer from hook daemon: {e}"}
+
+def run_in_process(hook):
+    """Run the hook script's main() here, as if it had been invoked directly."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    module = __import__(hook)
+    module.main()
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in HOOKS:
+        print(f"Usage: hook_client.py <{'|'.join(HOOKS)}>")
+        sys.exit(1)
+
+    hook = sys.argv[1]
+    trace = None
+    if os.environ.get('COMPANY_HOOK_TRACE'):
+        import hook_metrics
+        trace = hook_metrics.start(hook, os.environ.get('CURRENT_ROLE', 'unknown'), via='client')
+
+    response = call_daemon(hook)
+    if response is None:
+        run_in_process(hook)
+        return
+    if 'error' in response:
+        print(f"ERROR: Hook daemon failed to run {hook}: {response['error']}")
+        if trace:
+            trace.finish(1)
+        sys.exit(1)
+
+    if response.get('output'):
+        print(response['output'])
+    if trace:
+        # The daemon records its own phases; this covers start-up and the round trip
+        trace.mark('round_trip')
+        trace.finish(response.get('exit_code', 0))
+    sys.exit(response.get('exit_code', 0))
+
+if __name__ == '__main__':
+    main()
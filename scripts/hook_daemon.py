@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Optional long-running daemon for the TaskUpdate hooks.
+
+Keeps the compiled governance tables and sync state in memory and answers
+validate_task_update / sync_notify calls from hook_client.py over a Unix
+socket, so hooks don't pay for a fresh interpreter and JSON parse per call.
+Requests are handled one at a time; sync-state writes go through the
+configured backend (see sync_state.py), which is opened once.
+
+Usage:
+    hook_daemon.py [serve]   Run in the foreground (e.g. under nohup)
+    hook_daemon.py status    Check whether a daemon is answering
+    hook_daemon.py stop      Ask a running daemon to exit
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import hook_metrics
+import sync_notify
+import sync_state
+import validate_task_update
+from governance import load_governance
+from hook_client import OVERRIDE_ENV, SOCKET_PATH, send_request
+
+@contextmanager
+def caller_environment(env):
+    """
+    Apply the caller's OVERRIDE_ENV settings to os.environ for one request,
+    so storage choices follow the hook's environment rather than the
+    daemon's. Safe because requests are handled one at a time.
+    """
+    saved = {name: os.environ.get(name) for name in OVERRIDE_ENV}
+    for name in OVERRIDE_ENV:
+        if name in env:
+            os.environ[name] = env[name]
+        else:
+            os.environ.pop(name, None)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+class HookHandler(socketserver.StreamRequestHandler):
+    """Handles one newline-terminated JSON request per connection."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.dispatch(request)
+        except Exception as e:
+            # The hook may have partly run, so the client reports this
+            # instead of running the hook again itself
+            response = {'error': f'{type(e).__name__}: {e}'}
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+
+class HookServer(socketserver.UnixStreamServer):
+    """Unix-socket server holding governance and sync state between calls."""
+
+    def __init__(self, socket_path=SOCKET_PATH):
+        self.sync_backends = {}
+        super().__init__(socket_path, HookHandler)
+
+    def sync_backend(self):
+        """The configured sync state backend, opened once per backend kind."""
+        name = sync_state.backend_name()
+        if name not in self.sync_backends:
+            self.sync_backends[name] = sync_state.open_backend(export_interval=sync_state.EXPORT_INTERVAL)
+        return self.sync_backends[name]
+
+    def service_actions(self):
+        # Runs between requests in serve_forever: writes out sync-state.json
+        # for bumps whose export was held back by the export interval
+        for backend in self.sync_backends.values():
+            backend.flush()
+
+    def dispatch(self, request):
+        """Run the requested hook. Returns {'exit_code', 'output'}."""
+        env = request.get('env', {})
+        with caller_environment(env):
+            return self._run(request.get('hook'), env)
+
+    def _run(self, hook, env):
+        if hook == 'ping':
+            return {'exit_code': 0, 'output': f'hook daemon running (pid {os.getpid()})'}
+
+        if hook == 'shutdown':
+            # shutdown() waits for serve_forever to return, so it can't run
+            # on the thread that is serving this request
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'exit_code': 0, 'output': 'hook daemon stopping'}
+
+        role = env.get('CURRENT_ROLE', 'unknown')
+        trace = hook_metrics.start(hook, role, via='daemon',
+                                   enabled=bool(env.get(hook_metrics.TRACE_ENV) or
+                                                os.environ.get(hook_metrics.TRACE_ENV)))
+
+        if hook == 'validate_task_update':
+            exit_code, message = validate_task_update.run(
+                env.get('TOOL_INPUT', '{}'),
+                role,
+                load_governance,
+                trace)
+            trace.finish(exit_code)
+            return {'exit_code': exit_code, 'output': message}
+
+        if hook == 'sync_notify':
+            output = sync_notify.run(
+                env.get('TASK_ID'),
+                env.get('NEW_STATUS'),
+                role,
+                self.sync_backend(),
+                trace)
+            trace.finish()
+            return {'exit_code': 0, 'output': '\n'.join(output)}
+
+        return {'error': f'Unknown hook: {hook}'}
+
+def serve(socket_path=SOCKET_PATH):
+    """Run the daemon until stopped, replacing a stale socket if present."""
+    if os.path.exists(socket_path):
+        try:
+            send_request({'hook': 'ping'}, socket_path)
+            print(f"ERROR: A hook daemon is already listening on {socket_path}")
+            sys.exit(1)
+        except (OSError, ValueError):
+            os.unlink(socket_path)
+
+    Path(socket_path).parent.mkdir(parents=True, exist_ok=True)
+    server = HookServer(socket_path)
+    print(f"Hook daemon listening on {socket_path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for backend in server.sync_backends.values():
+            backend.flush(force=True)
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+def main():
+    if not hasattr(socket, 'AF_UNIX'):
+        print("ERROR: Unix sockets are not available on this platform")
+        sys.exit(1)
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'serve'
+
+    if command == 'serve':
+        serve()
+    elif command in ('status', 'stop'):
+        try:
+            response = send_request({'hook': 'ping' if command == 'status' else 'shutdown'})
+            print(response.get('output'))
+        except (OSError, ValueError):
+            print("Hook daemon not running")
+            sys.exit(1)
+    else:
+        print("Usage: hook_daemon.py [serve|status|stop]")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
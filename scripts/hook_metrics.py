@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Optional latency tracing for the hook scripts.
+
+Set COMPANY_HOOK_TRACE=1 and each hook call appends one line to
+.company/metrics/hooks.jsonl with its per-phase timings in milliseconds:
+startup (interpreter start and imports, as process CPU time), json_load,
+matrix_parse, decision and write, plus the total. When the variable is
+unset, start() returns a shared no-op trace and nothing is recorded.
+
+Usage:
+    hook_metrics.py summary [--by role] [--file PATH]   p50/p95/p99 per hook (or per hook and role)
+"""
+
+import os
+import time
+
+METRICS_PATH = '.company/metrics/hooks.jsonl'
+TRACE_ENV = 'COMPANY_HOOK_TRACE'
+
+PERCENTILES = (50, 95, 99)
+
+class _NoTrace:
+    """Stands in for Trace when tracing is off; every method does nothing."""
+
+    def mark(self, phase):
+        pass
+
+    def finish(self, exit_code=0, role=None):
+        pass
+
+NO_TRACE = _NoTrace()
+
+class Trace:
+    """Times consecutive phases of one hook call."""
+
+    def __init__(self, hook, role, via, path):
+        self.hook = hook
+        self.role = role
+        self.via = via
+        self.path = path
+        self.phases = {}
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def mark(self, phase):
+        """End the current phase, named `phase`, and start the next one."""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def finish(self, exit_code=0, role=None):
+        """Append this call's record to the metrics file; `role` overrides the start role."""
+        import json
+        from datetime import datetime
+
+        total = (time.perf_counter() - self.started) * 1000 + self.phases.get('startup', 0.0)
+        record = {
+            'timestamp': datetime.now().isoformat(),
+            'hook': self.hook,
+            'role': role or self.role,
+            'via': self.via,
+            'pid': os.getpid(),
+            'exit_code': exit_code,
+            'phases': {name: round(ms, 3) for name, ms in self.phases.items()},
+            'total_ms': round(total, 3),
+        }
+        line = (json.dumps(record) + '\n').encode()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # One O_APPEND write per record, so concurrent hooks don't interleave
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+def start(hook, role, via='process', enabled=None, path=METRICS_PATH):
+    """
+    Begin tracing one hook call, or return NO_TRACE if tracing is off.
+
+    `enabled` defaults to the COMPANY_HOOK_TRACE environment variable. For
+    calls in a fresh process (via='process') the CPU time used so far is
+    recorded as the startup phase.
+    """
+    if enabled is None:
+        enabled = bool(os.environ.get(TRACE_ENV))
+    if not enabled:
+        return NO_TRACE
+    trace = Trace(hook, role, via, path)
+    if via != 'daemon':
+        trace.phases['startup'] = time.process_time() * 1000
+    return trace
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+def summarize(records, by_role=False):
+    """
+    Group records by hook and path (and role), returning rows of
+    (group, count, {phase: {p50, p95, p99}}) with 'total' as a phase.
+    """
+    groups = {}
+    for record in records:
+        key = (record.get('hook'), record.get('via'))
+        if by_role:
+            key += (record.get('role'),)
+        samples = groups.setdefault(key, {'total': []})
+        samples['total'].append(record.get('total_ms', 0.0))
+        for phase, ms in record.get('phases', {}).items():
+            samples.setdefault(phase, []).append(ms)
+
+    rows = []
+    for key in sorted(groups, key=lambda k: tuple(str(part) for part in k)):
+        stats = {}
+        for phase, values in groups[key].items():
+            values.sort()
+            stats[phase] = {f'p{pct}': percentile(values, pct) for pct in PERCENTILES}
+        rows.append((key, len(groups[key]['total']), stats))
+    return rows
+
+def read_records(path=METRICS_PATH):
+    """Yield the records in a metrics file, skipping a partially written last line."""
+    import json
+
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        return
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Summarize hook latency traces.')
+    parser.add_argument('command', choices=['summary'])
+    parser.add_argument('--by', choices=['hook', 'role'], default='hook',
+                        help='group by hook (default) or by hook and role')
+    parser.add_argument('--file', default=METRICS_PATH, help=f'metrics file (default: {METRICS_PATH})')
+    args = parser.parse_args()
+
+    rows = summarize(read_records(args.file), by_role=args.by == 'role')
+    if not rows:
+        print(f"No hook metrics in {args.file} (set {TRACE_ENV}=1 to record them)")
+        return
+
+    for key, count, stats in rows:
+        print(f"{' / '.join(str(part) for part in key)}  ({count} calls)")
+        phases = ['total'] + sorted(p for p in stats if p != 'total')
+        for phase in phases:
+            values = '  '.join(f"{name} {ms:9.2f} ms" for name, ms in stats[phase].items())
+            print(f"  {phase:<14} {values}")
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Role inbox storage.
+
+Two storage modes, chosen with the COMPANY_INBOX_STORAGE environment
+variable or company.inbox.storage in .company/config.json:
+
+- files (default): one JSON file per notification, as the role skills
+  expect, named {epoch_seconds}-{type}.json and never overwritten.
+- log: notifications are appended to rotating JSONL segments under
+  .company/inboxes/{role}/log/. Each message gets a monotonic
+  "{segment}-{offset}" id, and a per-role cursor records the last
+  acknowledged id, so readers only touch messages newer than that.
+
+Skills and the CEO also drop JSON files straight into inboxes in either
+mode, so role skills read their inbox through `inbox.py read`, which
+covers both.
+
+Usage:
+    inbox.py read <role> [--all] [--ack]   Print unread (or all) messages as JSONL
+    inbox.py count <role>                  Print the number of unread messages
+    inbox.py ack <role> <message-id>       Acknowledge log messages up to an id
+
+read prints every JSON message file first, then the log messages newer
+than the cursor. --ack moves the printed files to the inbox's archive/
+directory and advances the cursor past the printed log messages.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+import atomic_write
+from company_files import FileLock, config_setting
+
+INBOX_ROOT = '.company/inboxes'
+
+# Segments rotate once they reach this size
+SEGMENT_BYTES = 1024 * 1024
+
+SEGMENT_SUFFIX = '.jsonl'
+
+# Per-role record of the last acknowledged message id; deliberately not a
+# .json file, so shell readers globbing *.json never pick it up
+CURSOR_NAME = 'cursor'
+
+def storage_mode():
+    """Return 'files' or 'log' from the environment or company config."""
+    mode = config_setting('COMPANY_INBOX_STORAGE', 'inbox', 'storage')
+    return 'log' if mode == 'log' else 'files'
+
+def _log_dir(role):
+    return os.path.join(INBOX_ROOT, role, 'log')
+
+def _segments(log_dir):
+    """Return segment numbers present in `log_dir`, oldest first."""
+    try:
+        names = os.listdir(log_dir)
+    except OSError:
+        return []
+    return sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in names
+                  if name.endswith(SEGMENT_SUFFIX) and name[:-len(SEGMENT_SUFFIX)].isdigit())
+
+def _segment_path(log_dir, segment):
+    return os.path.join(log_dir, f'{segment:06d}{SEGMENT_SUFFIX}')
+
+def format_id(segment, offset):
+    """Build a message id; ids sort in the order messages were appended."""
+    return f'{segment:06d}-{offset:012d}'
+
+def parse_id(message_id):
+    """Split a message id into (segment, offset)."""
+    segment, offset = message_id.split('-')
+    return int(segment), int(offset)
+
+def append_message(role, notification):
+    """
+    Append a notification to a role's log inbox.
+
+    Appends are serialized with a lock file, and the id is the segment
+    number and byte offset the record starts at, so ids are unique and
+    increase monotonically. Returns the message id.
+    """
+    log_dir = _log_dir(role)
+    os.makedirs(log_dir, exist_ok=True)
+
+    with FileLock(os.path.join(log_dir, '.lock')):
+        segments = _segments(log_dir)
+        segment = segments[-1] if segments else 1
+        path = _segment_path(log_dir, segment)
+        try:
+            offset = os.stat(path).st_size
+        except FileNotFoundError:
+            offset = 0
+        if offset >= SEGMENT_BYTES:
+            segment += 1
+            path = _segment_path(log_dir, segment)
+            offset = 0
+
+        message_id = format_id(segment, offset)
+        record = {'id': message_id}
+        record.update((k, v) for k, v in notification.items() if k != 'id')
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with open(path, 'ab') as f:
+            f.write(line.encode())
+    return message_id
+
+def write_file_message(role, notification):
+    """
+    Write a notification as its own JSON file in a role's inbox.
+
+    Files are named {epoch_seconds}-{type}.json; a numeric suffix is added
+    when that name is taken, so notifications in the same second don't
+    overwrite each other. Returns the file path.
+    """
+    inbox_path = os.path.join(INBOX_ROOT, role)
+    os.makedirs(inbox_path, exist_ok=True)
+
+    timestamp = int(datetime.now().timestamp())
+    notif_type = notification.get('type', 'update')
+    content = json.dumps(notification, indent=2)
+
+    suffix = 0
+    while True:
+        name = f'{timestamp}-{notif_type}' + (f'-{suffix}' if suffix else '') + '.json'
+        notif_file = os.path.join(inbox_path, name)
+        try:
+            with open(notif_file, 'x') as f:
+                f.write(content)
+            return notif_file
+        except FileExistsError:
+            suffix += 1
+
+def deliver(role, notification):
+    """Store a notification using the configured mode. Returns where it went."""
+    if storage_mode() == 'log':
+        message_id = append_message(role, notification)
+        return f'{_log_dir(role)}#{message_id}'
+    return write_file_message(role, notification)
+
+def read_cursor(role):
+    """Return the last acknowledged message id for a role, or None."""
+    try:
+        with open(os.path.join(_log_dir(role), CURSOR_NAME)) as f:
+            return json.load(f).get('acked')
+    except (OSError, ValueError):
+        return None
+
+def ack(role, message_id):
+    """Acknowledge every message up to and including `message_id`."""
+    parse_id(message_id)  # Reject malformed ids before storing them
+    current = read_cursor(role)
+    if current and current >= message_id:
+        return
+    atomic_write.write_json(os.path.join(_log_dir(role), CURSOR_NAME), {'acked': message_id})
+
+def read_messages(role, after=None):
+    """
+    Yield messages in a role's log inbox newer than id `after`.
+
+    Seeks straight to the acknowledged record, so cost depends only on the
+    number of new messages, not on the inbox's history.
+    """
+    log_dir = _log_dir(role)
+    start_segment, start_offset = parse_id(after) if after else (0, -1)
+
+    for segment in _segments(log_dir):
+        if segment < start_segment:
+            continue
+        with open(_segment_path(log_dir, segment), 'rb') as f:
+            if segment == start_segment:
+                f.seek(start_offset)
+                f.readline()  # The acknowledged record itself
+            for line in f:
+                if not line.endswith(b'\n'):
+                    return  # Still being appended
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+def read_files(role):
+    """Yield (path, message) for the JSON files in a role's inbox, oldest first."""
+    try:
+        with os.scandir(os.path.join(INBOX_ROOT, role)) as entries:
+            files = [(entry.stat().st_mtime_ns, entry.path) for entry in entries
+                     if entry.name.endswith('.json') and entry.is_file()]
+    except OSError:
+        return
+    for _, path in sorted(files):
+        try:
+            with open(path) as f:
+                yield path, json.load(f)
+        except (OSError, ValueError):
+            continue
+
+def archive_files(role, paths):
+    """Move handled message files into the role's archive/ directory."""
+    archive_dir = os.path.join(INBOX_ROOT, role, 'archive')
+    os.makedirs(archive_dir, exist_ok=True)
+    for path in paths:
+        try:
+            os.replace(path, os.path.join(archive_dir, os.path.basename(path)))
+        except OSError:
+            continue
+
+def read_new(role):
+    """Yield messages newer than the role's cursor."""
+    return read_messages(role, read_cursor(role))
+
+def read_log(role, everything=False):
+    """Yield the log messages of a role that read shows; none in files mode."""
+    if storage_mode() == 'files':
+        return iter(())
+    return read_messages(role) if everything else read_new(role)
+
+def main():
+    args = sys.argv[1:]
+    if len(args) >= 2 and args[0] == 'read':
+        role = args[1]
+        files = []
+        for path, message in read_files(role):
+            print(json.dumps(message))
+            files.append(path)
+
+        last_id = None
+        count = len(files)
+        for message in read_log(role, '--all' in args):
+            print(json.dumps(message))
+            last_id = message.get('id')
+            count += 1
+        if count == 0:
+            print("No messages")
+        elif '--ack' in args:
+            archive_files(role, files)
+            if last_id:
+                ack(role, last_id)
+    elif len(args) == 2 and args[0] == 'count':
+        role = args[1]
+        print(sum(1 for _ in read_files(role)) + sum(1 for _ in read_log(role)))
+    elif len(args) == 3 and args[0] == 'ack':
+        ack(args[1], args[2])
+    else:
+        print("Usage: inbox.py read <role> [--all] [--ack] | count <role> | ack <role> <message-id>")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
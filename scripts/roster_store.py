@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Indexed access to .company/roster.json.
+
+RosterStore keeps the roster indexed by specialist id and by expertise
+(case-insensitive), so membership and "who knows X" are dict lookups
+however many specialists a company has hired. The roster file stays the
+source of truth, and the skills keep reading and editing it directly; the
+store reloads whenever the file's mtime or size changes.
+
+Adding specialists doesn't reserialize the existing entries: when the file
+is laid out the way json.dumps(indent=2) writes it, the new entries are
+spliced in after the last one and only the small keys that follow
+(roles, stats) are re-encoded. Any other layout gets a full rewrite.
+
+Usage:
+    roster_store.py has <specialist-id>    Print the entry; exit 1 if not hired
+    roster_store.py expertise <name>       Print the ids of specialists with that expertise
+"""
+
+import json
+import sys
+
+import atomic_write
+from company_files import stat_key
+
+ROSTER_PATH = '.company/roster.json'
+
+# How json.dumps(roster, indent=2) opens and closes the specialists list
+_LIST_OPEN = '{\n  "specialists": ['
+_LIST_CLOSE = '\n  ]'
+
+def empty_roster():
+    return {'specialists': [], 'roles': {}, 'stats': {}}
+
+def _indent(text, spaces):
+    """Indent every line of a json.dumps() block but the first."""
+    return text.replace('\n', '\n' + ' ' * spaces)
+
+class RosterStore:
+    """The roster, with id and expertise indexes."""
+
+    def __init__(self, path=ROSTER_PATH):
+        self.path = path
+        self.roster = None
+        self._key = None
+        self._text = None
+        self._list_end = None  # Offset of _LIST_CLOSE in _text, if it can be spliced
+        self._by_id = {}
+        self._by_expertise = {}
+        self.refresh()
+
+    def refresh(self):
+        """
+        Reload the roster if the file changed since it was last read or
+        written. Raises OSError or ValueError if it can't be read, leaving
+        the roster loaded before in place.
+        """
+        key = stat_key(self.path)
+        if self.roster is not None and key == self._key:
+            return
+        if key is None:
+            self.roster, self._text = empty_roster(), None
+        else:
+            with open(self.path) as f:
+                text = f.read()
+            roster = json.loads(text)
+            roster.setdefault('specialists', [])
+            self.roster, self._text = roster, text
+        self._key = key
+        self._list_end = self._find_list_end()
+        self._by_id = {}
+        self._by_expertise = {}
+        for entry in self.roster['specialists']:
+            self._index(entry)
+
+    def _index(self, entry):
+        self._by_id[entry['id']] = entry
+        for name in entry.get('expertise', []):
+            self._by_expertise.setdefault(name.lower(), []).append(entry['id'])
+
+    def _find_list_end(self):
+        """
+        Return where the specialists list closes in the file text, or None if
+        the file isn't in the json.dumps(indent=2) layout.
+        """
+        text = self._text
+        if not text or not self.roster['specialists'] or not text.startswith(_LIST_OPEN):
+            return None
+        # Deeper lines are indented further, so this only matches a top-level close
+        end = text.find(_LIST_CLOSE, len(_LIST_OPEN))
+        if end < 0:
+            return None
+        # What follows must be exactly the roster's other keys
+        rest = text[end + len(_LIST_CLOSE):].strip()
+        rest = '{' + rest[1:] if rest.startswith(',') else '{' + rest
+        try:
+            others = json.loads(rest)
+        except ValueError:
+            return None
+        if others != {k: v for k, v in self.roster.items() if k != 'specialists'}:
+            return None
+        return end
+
+    def __contains__(self, specialist_id):
+        return specialist_id in self._by_id
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def get(self, specialist_id):
+        """Return the roster entry for a specialist, or None."""
+        return self._by_id.get(specialist_id)
+
+    def ids(self):
+        """Specialist ids in roster order."""
+        return list(self._by_id)
+
+    def with_expertise(self, name):
+        """Ids of the specialists listing `name` (any case) as expertise."""
+        return list(self._by_expertise.get(name.lower(), ()))
+
+    def add(self, entries):
+        """
+        Append roster entries and write the roster, counting them in
+        stats.total_specialists_created. Entries whose id is already on the
+        roster are skipped. Returns the ids that were added.
+        """
+        self.refresh()
+        new = []
+        for entry in entries:
+            if entry['id'] not in self._by_id:
+                self._index(entry)
+                new.append(entry)
+        if not new:
+            return []
+
+        self.roster['specialists'].extend(new)
+        stats = self.roster.setdefault('stats', {})
+        stats['total_specialists_created'] = stats.get('total_specialists_created', 0) + len(new)
+
+        if self._list_end is None:
+            self._text = json.dumps(self.roster, indent=2)
+            self._list_end = self._find_list_end()
+        else:
+            head = self._text[:self._list_end] + ''.join(
+                ',\n    ' + _indent(json.dumps(entry, indent=2), 4) for entry in new)
+            tail = ''.join(
+                f',\n  {json.dumps(key)}: {_indent(json.dumps(value, indent=2), 2)}'
+                for key, value in self.roster.items() if key != 'specialists')
+            self._text = head + _LIST_CLOSE + tail + '\n}'
+            self._list_end = len(head)
+        atomic_write.write_text(self.path, self._text)
+        self._key = stat_key(self.path)
+        return [entry['id'] for entry in new]
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ('has', 'expertise'):
+        print("Usage: roster_store.py has <specialist-id> | expertise <name>")
+        sys.exit(1)
+
+    command, arg = sys.argv[1], sys.argv[2]
+    store = RosterStore()
+    if command == 'has':
+        entry = store.get(arg)
+        if entry is None:
+            sys.exit(1)
+        print(json.dumps(entry, indent=2))
+    else:
+        for specialist_id in store.with_expertise(arg):
+            print(specialist_id)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Per-file scan result caches for evaluate_expertise.py.
+
+A working-tree cache maps each path to its hits and the (mtime, size) it
+had when scanned; the --rev cache maps blob SHAs to hits. Each cache file
+records a fingerprint of what produced its hits (the patterns and scan
+limits), and is ignored when that no longer matches.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import atomic_write
+
+# Per-file scan results, reused while a file's mtime and size are unchanged
+PATH = Path('.company/cache/scan-cache.json')
+FULL_PATH = Path('.company/cache/scan-cache-full.json')
+VERSION = 1
+
+# Scan results for --rev, keyed by blob SHA and shared by every revision
+BLOB_PATH = Path('.company/cache/blob-scan-cache.json')
+FULL_BLOB_PATH = Path('.company/cache/blob-scan-cache-full.json')
+
+# Beyond this many blobs, the cache keeps only those of the latest scan
+BLOB_MAX_ENTRIES = 200000
+
+# A conservative rate for parsing or writing a cache file, used to tell
+# whether it fits in what is left of a time budget
+CACHE_BYTES_PER_MS = 20000
+
+def file_digest(path):
+    """Return the SHA-1 of a file's contents."""
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+def load(cache_path, fingerprint):
+    """Load cached entries, or {} if missing, corrupt or made with another fingerprint."""
+    try:
+        cache = json.loads(Path(cache_path).read_text())
+        if cache.get('version') == VERSION and cache.get('fingerprint') == fingerprint:
+            return cache['files']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+def save(entries, cache_path, fingerprint):
+    """Atomically write cached entries."""
+    cache = {
+        'version': VERSION,
+        'fingerprint': fingerprint,
+        'files': entries
+    }
+    atomic_write.write_json(cache_path, cache, separators=(',', ':'))
+
+def is_fresh(entry, path, stat, verify_hash):
+    """
+    Check whether a cache entry still describes the file at `path`.
+
+    Entries match on (mtime, size). With verify_hash, a file whose mtime
+    changed but whose size didn't is hashed, so touched-but-identical files
+    are not rescanned.
+    """
+    if not entry or entry.get('size') != stat.st_size:
+        return False
+    if entry.get('mtime_ns') == stat.st_mtime_ns:
+        return True
+    if verify_hash and entry.get('sha1'):
+        try:
+            return file_digest(path) == entry['sha1']
+        except OSError:
+            return False
+    return False
+
+class FileCache:
+    """
+    The working-tree cache as used by one scan.
+
+    lookup() stats a file and returns its cached hits while they are
+    fresh, store() records the hits of a file just scanned, and save()
+    writes the cache back without the entries of files that no longer
+    exist. The cache file is only read on the first lookup(), and with
+    `enabled` False it is never read or written.
+
+    With a `deadline` (a time.monotonic() value), a cache file too big to
+    read before it is skipped for this scan, and save() is skipped when
+    the write would end past it; the next scan that has time saves.
+    """
+
+    def __init__(self, cache_path, fingerprint, verify_hash=False, enabled=True, deadline=None):
+        self.cache_path = cache_path
+        self.fingerprint = fingerprint
+        self.verify_hash = verify_hash
+        self.enabled = enabled
+        self.deadline = deadline
+        self._entries = None
+        self._size = 0
+        self.stats = {}
+        self.changed = False
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = {}
+            if self.enabled:
+                try:
+                    self._size = os.path.getsize(self.cache_path)
+                except OSError:
+                    self._size = 0
+                if self._fits(self.io_seconds()):
+                    self._entries = load(self.cache_path, self.fingerprint)
+                else:
+                    # A partial cache must not replace the real one
+                    self.enabled = False
+        return self._entries
+
+    def io_seconds(self):
+        """Roughly how long reading or writing the cache file takes."""
+        return self._size / CACHE_BYTES_PER_MS / 1000 if self.enabled else 0.0
+
+    def _fits(self, seconds):
+        return self.deadline is None or time.monotonic() + seconds < self.deadline
+
+    def lookup(self, path):
+        """Return the cached hits for `path`, or None if it needs scanning. Raises OSError if it can't be stat'ed."""
+        stat = self.stats[path] = os.stat(path)
+        entry = self.entries.get(path)
+        return entry['hits'] if is_fresh(entry, path, stat, self.verify_hash) else None
+
+    def store(self, path, hits):
+        """Record the hits of `path`, which lookup() has already stat'ed."""
+        stat = self.stats[path]
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'hits': hits}
+        if self.verify_hash:
+            try:
+                entry['sha1'] = file_digest(path)
+            except OSError:
+                pass
+        self.entries[path] = entry
+        self.changed = True
+
+    def save(self):
+        """
+        Drop entries for deleted files and write the cache if anything
+        changed. With a deadline, the check for deleted files stops in
+        time to leave room for the write, which is skipped if it wouldn't
+        finish before the deadline.
+        """
+        if not self.enabled or self._entries is None:
+            return
+        deleted = []
+        for path in self._entries:
+            if not self._fits(self.io_seconds()):
+                break
+            if path not in self.stats and not os.path.exists(path):
+                deleted.append(path)
+        for path in deleted:
+            del self._entries[path]
+        if (self.changed or deleted) and self._fits(self.io_seconds()):
+            try:
+                save(self._entries, self.cache_path, self.fingerprint)
+            except OSError:
+                pass
@@ -0,0 +1,110 @@
+"""
+Stratified sampling for time-budgeted codebase scans.
+
+StratifiedSample keeps a fixed-size reservoir of files per stratum (a
+top-level directory and extension), so a huge vendored or generated
+directory can't crowd the rest of the codebase out of the sample, and
+files keep being considered however many the walk turns up.
+estimate() turns the hits of whichever sampled files were scanned before
+the deadline into per-file domain averages, weighted by stratum size, and
+a per-domain confidence that grows with how much was sampled.
+"""
+
+import math
+import random
+
+class StratifiedSample:
+    """Reservoir samples (Algorithm R) of up to `per_stratum` items per stratum."""
+
+    def __init__(self, per_stratum, seed=0):
+        self.per_stratum = per_stratum
+        self.seen = {}
+        self.reservoirs = {}
+        # Fixed seed: the same tree gives the same sample, and the same assessment
+        self._random = random.Random(seed)
+
+    def add(self, stratum, item, accept=None):
+        """
+        Offer `item` to the reservoir of `stratum`, returning whether it was kept.
+
+        `accept` is only asked about items that would take a slot, so a
+        costly check runs on the sample rather than on everything offered;
+        an item it rejects is dropped as if it had never been offered.
+        """
+        seen = self.seen.get(stratum, 0) + 1
+        reservoir = self.reservoirs.get(stratum, [])
+        slot = len(reservoir) if len(reservoir) < self.per_stratum else self._random.randrange(seen)
+        if slot >= self.per_stratum:
+            self.seen[stratum] = seen
+            return False
+        if accept is not None and not accept(item):
+            return False
+        self.seen[stratum] = seen
+        if slot == len(reservoir):
+            self.reservoirs[stratum] = reservoir
+            reservoir.append(item)
+        else:
+            reservoir[slot] = item
+        return True
+
+    def interleaved(self):
+        """Yield the sampled items round-robin across strata, so any prefix stays stratified."""
+        reservoirs = [self.reservoirs[stratum] for stratum in sorted(self.reservoirs)]
+        for i in range(self.per_stratum):
+            for reservoir in reservoirs:
+                if i < len(reservoir):
+                    yield reservoir[i]
+
+def estimate(sample, hits, complete):
+    """
+    Estimate per-file domain hits from the scanned part of `sample`.
+
+    `hits` is {item: {domain: hits}} for the items scanned; `complete` says
+    whether the walk saw every file, which lets fully scanned strata count
+    as exact. Returns ({domain: mean hits per file}, {domain: confidence}).
+
+    Confidence is 1 minus the relative standard error of the estimated
+    share of files using the domain (stratified, with a finite population
+    correction), scaled by the share of files in strata that were scanned
+    at all.
+    """
+    strata = []
+    for stratum, reservoir in sample.reservoirs.items():
+        scanned = [hits[item] for item in reservoir if item in hits]
+        if scanned:
+            strata.append((sample.seen[stratum], scanned))
+    total = sum(sample.seen.values())
+    covered = sum(size for size, _ in strata)
+    if not covered:
+        return {}, {}
+
+    tallies = []
+    means, shares = {}, {}
+    for size, scanned in strata:
+        weight = size / covered
+        n = len(scanned)
+        counts, present = {}, {}
+        for file_hits in scanned:
+            for domain, count in file_hits.items():
+                counts[domain] = counts.get(domain, 0) + count
+                present[domain] = present.get(domain, 0) + 1
+        for domain in counts:
+            means[domain] = means.get(domain, 0.0) + weight * counts[domain] / n
+            shares[domain] = shares.get(domain, 0.0) + weight * present[domain] / n
+        correction = 1 - n / size if complete else 1.0
+        tallies.append((weight, n, present, correction))
+
+    # Every stratum adds to a domain's variance, hits or not; the share is
+    # smoothed so a stratum with one scanned file doesn't claim certainty
+    variances = dict.fromkeys(shares, 0.0)
+    for weight, n, present, correction in tallies:
+        for domain in variances:
+            p = (present.get(domain, 0) + 0.5) / (n + 1)
+            variances[domain] += weight ** 2 * p * (1 - p) / n * correction
+
+    coverage = covered / total
+    confidence = {}
+    for domain, share in shares.items():
+        relative_error = math.sqrt(variances[domain]) / share
+        confidence[domain] = round(max(0.0, 1 - relative_error) * coverage, 2)
+    return means, confidence
@@ -0,0 +1,289 @@
+"""
+Source file discovery for evaluate_expertise.py.
+
+iter_source_files() walks the working tree with os.scandir, pruning
+IGNORED_DIRS, virtualenvs and whatever .gitignore files exclude, and
+iter_tree_files() applies the same rules to a git tree listing.
+sample_source_files() keeps the first FILES_PER_EXTENSION files of each
+extension, which is what a sampled scan reads.
+"""
+
+import os
+import re
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+# Source files sampled per extension when scanning the codebase
+SOURCE_EXTENSIONS = ['ts', 'tsx', 'js', 'jsx', 'py', 'go', 'rs']
+FILES_PER_EXTENSION = 50
+
+# Directories never worth scanning: VCS metadata, dependencies, build output
+IGNORED_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', 'bower_components', 'vendor',
+    'dist', 'build', 'out', 'target', 'coverage', '.next', '.nuxt',
+    '.venv', 'venv', '__pycache__', '.tox', '.nox', '.mypy_cache',
+    '.pytest_cache', '.company', '.claude'
+})
+
+# Files larger than this are generated or vendored, not hand-written source
+MAX_SOURCE_BYTES = 1024 * 1024
+
+# Size limit when streaming whole files (--full), which stays memory-bounded
+MAX_STREAM_BYTES = 64 * 1024 * 1024
+
+# Bytes inspected to tell binary files from text
+SNIFF_BYTES = 1024
+
+def _glob_to_regex(pattern):
+    """Translate a .gitignore glob into a regex over '/'-separated paths."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+            continue
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            close = pattern.find(']', i + 2)
+            if close == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1:close]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = close
+        elif char == '\\' and i + 1 < len(pattern):
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return ''.join(parts)
+
+def parse_gitignore(text, base):
+    """
+    Parse .gitignore `text` found in directory `base` into rules.
+
+    Each rule is (regex, negate, dir_only, base); supports comments,
+    negation, trailing-slash directory rules, anchoring and '**'.
+    """
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+        if '/' in line:
+            regex = _glob_to_regex(line.lstrip('/'))
+        else:
+            regex = '(?:.*/)?' + _glob_to_regex(line)
+        rules.append((re.compile(regex), negate, dir_only, base))
+    return rules
+
+def is_ignored(rel_path, is_dir, rules):
+    """Apply gitignore `rules` to `rel_path`; the last matching rule wins."""
+    ignored = False
+    for regex, negate, dir_only, base in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel_path.startswith(base + '/'):
+                continue
+            candidate = rel_path[len(base) + 1:]
+        else:
+            candidate = rel_path
+        if regex.fullmatch(candidate):
+            ignored = not negate
+    return ignored
+
+def _is_binary(path):
+    """Check the first bytes of a file for NULs, which text never contains."""
+    try:
+        with open(path, 'rb') as f:
+            return b'\0' in f.read(SNIFF_BYTES)
+    except OSError:
+        return True
+
+def is_source_file(path, max_bytes=MAX_SOURCE_BYTES):
+    """Whether `path` is a regular text file no larger than `max_bytes`."""
+    try:
+        if os.stat(path).st_size > max_bytes:
+            return False
+    except OSError:
+        return False
+    return not _is_binary(path)
+
+def is_source_blob(sha, reader):
+    """
+    is_source_file() for a blob read through `reader`, a git_objects.BlobReader.
+    Its size is already checked by iter_tree_files().
+    """
+    data = reader.read(sha)
+    return data is not None and b'\0' not in data[:SNIFF_BYTES]
+
+def iter_source_files(root='.', extensions=SOURCE_EXTENSIONS, max_bytes=MAX_SOURCE_BYTES, match=None,
+                      breadth_first=False, deadline=None, check_files=True):
+    """
+    Lazily yield source files under `root` with one of `extensions`, or
+    whose name satisfies `match` when it is given.
+
+    A single os.scandir walk that prunes IGNORED_DIRS, virtualenvs and
+    anything matched by .gitignore files along the way, and skips
+    oversized and binary files (unless `check_files` is False, leaving
+    is_source_file() to the caller). Paths are relative to `root`, visited in
+    sorted order so results are stable across runs. Directories are
+    visited depth-first unless `breadth_first` is set, and the walk stops
+    early once time.monotonic() reaches `deadline`, even partway through a
+    directory.
+    """
+    suffixes = tuple(f'.{ext}' for ext in extensions)
+    if match is None:
+        def match(name):
+            return name.endswith(suffixes)
+    pending = deque([('', [])])
+    while pending:
+        if deadline is not None and time.monotonic() >= deadline:
+            return
+        rel_dir, rules = pending.popleft() if breadth_first else pending.pop()
+        dir_path = os.path.join(root, rel_dir) if rel_dir else root
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        names = {entry.name for entry in entries}
+        if 'pyvenv.cfg' in names:
+            continue
+        if '.gitignore' in names:
+            try:
+                gitignore = Path(dir_path, '.gitignore').read_text()
+                rules = rules + parse_gitignore(gitignore, rel_dir)
+            except (OSError, UnicodeDecodeError):
+                pass
+
+        subdirs = []
+        for entry in entries:
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS and not is_ignored(rel_path, True, rules):
+                        subdirs.append(rel_path)
+                    continue
+                if not match(entry.name) or not entry.is_file():
+                    continue
+                if check_files and entry.stat().st_size > max_bytes:
+                    continue
+            except OSError:
+                continue
+            if is_ignored(rel_path, False, rules) or (check_files and _is_binary(entry.path)):
+                continue
+            yield rel_path
+
+        pending.extend((subdir, rules) for subdir in (subdirs if breadth_first else reversed(subdirs)))
+
+def iter_tree_files(tree, reader, extensions=SOURCE_EXTENSIONS, max_bytes=MAX_SOURCE_BYTES, match=None):
+    """
+    iter_source_files() for a git tree from git_objects.list_tree().
+
+    Prunes and orders the tree's paths the same way, reading .gitignore
+    files through `reader`, a git_objects.BlobReader. Binary files can't be
+    told apart without their contents; pass is_source_blob() as the
+    `accept` of sample_source_files() to skip them.
+    """
+    suffixes = tuple(f'.{ext}' for ext in extensions)
+    if match is None:
+        def match(name):
+            return name.endswith(suffixes)
+
+    dirs = defaultdict(lambda: ([], set()))  # rel_dir -> (file names, subdir names)
+    for path in tree:
+        parent, _, name = path.rpartition('/')
+        dirs[parent][0].append(name)
+        while parent:
+            grandparent, _, dirname = parent.rpartition('/')
+            if dirname in dirs[grandparent][1]:
+                break
+            dirs[grandparent][1].add(dirname)
+            parent = grandparent
+
+    stack = [('', [])]
+    while stack:
+        rel_dir, rules = stack.pop()
+        files, subdirs = dirs[rel_dir]
+        if 'pyvenv.cfg' in files:
+            continue
+        if '.gitignore' in files:
+            gitignore_path = f'{rel_dir}/.gitignore' if rel_dir else '.gitignore'
+            data = reader.read(tree[gitignore_path][0])
+            try:
+                rules = rules + parse_gitignore(data.decode(), rel_dir)
+            except (AttributeError, UnicodeDecodeError):
+                pass
+
+        for name in sorted(files):
+            rel_path = f'{rel_dir}/{name}' if rel_dir else name
+            if (match(name) and tree[rel_path][1] <= max_bytes
+                    and not is_ignored(rel_path, False, rules)):
+                yield rel_path
+
+        kept = []
+        for name in sorted(subdirs):
+            rel_path = f'{rel_dir}/{name}' if rel_dir else name
+            if name not in IGNORED_DIRS and not is_ignored(rel_path, True, rules):
+                kept.append(rel_path)
+        stack.extend((subdir, rules) for subdir in reversed(kept))
+
+def sample_source_files(paths, per_extension=FILES_PER_EXTENSION, accept=None):
+    """
+    Keep the first `per_extension` of `paths` with each extension (all of
+    them if None), grouped by extension. Stops consuming `paths` as soon
+    as every extension is full.
+
+    `accept`, when given, is only asked about paths that would fill a free
+    slot, so costly per-file checks stay proportional to the sample.
+    """
+    by_ext = {ext: [] for ext in SOURCE_EXTENSIONS}
+    if per_extension is None:
+        for path in paths:
+            if accept is None or accept(path):
+                by_ext[path.rsplit('.', 1)[1]].append(path)
+        return [path for bucket in by_ext.values() for path in bucket]
+
+    remaining = len(by_ext)
+    for path in paths:
+        bucket = by_ext[path.rsplit('.', 1)[1]]
+        if len(bucket) < per_extension and (accept is None or accept(path)):  # Limit scanning
+            bucket.append(path)
+            if len(bucket) == per_extension:
+                remaining -= 1
+                if remaining == 0:
+                    break
+    return [path for bucket in by_ext.values() for path in bucket]
+
+def list_source_files(root='.', max_bytes=MAX_SOURCE_BYTES, per_extension=FILES_PER_EXTENSION):
+    """List the source files that scan_codebase samples from the working tree."""
+    def accept(path):
+        return is_source_file(os.path.join(root, path), max_bytes)
+
+    return sample_source_files(iter_source_files(root, max_bytes=max_bytes, check_files=False),
+                               per_extension, accept)
@@ -0,0 +1,123 @@
+"""
+Domain definitions for generate_specialist.py: titles, expertise lists and
+best-practice text for each known specialist.
+
+Kept in their own module so they are only loaded (from cached bytecode)
+when a specialist is generated.
+"""
+
+# Domain definitions with expertise details
+DOMAINS = {
+    'frontend-react': {
+        'title': 'React Frontend',
+        'description': 'React specialist - components, hooks, state management, and Next.js',
+        'expertise': ['React', 'TypeScript', 'Hooks', 'Redux/Zustand', 'Next.js', 'React Testing Library'],
+        'file_patterns': 'src/**/*.tsx',
+        'lint_command': 'npm run lint --silent 2>/dev/null || true',
+        'best_practices': '''
+### Component Design
+- Use functional components with hooks
+- Keep components focused (single responsibility)
+- Extract custom hooks for reusable logic
+- Use TypeScript for type safety
+
+### State Management
+- Use local state for UI-only state
+- Use context for shared state
+- Use Zustand/Redux for complex app state
+- Avoid prop drilling
+
+### Performance
+- Use React.memo for expensive components
+- Use useMemo/useCallback appropriately
+- Lazy load routes and heavy components
+- Profile with React DevTools
+''',
+        'testing': '''
+### Unit Tests
+- Test component rendering
+- Test user interactions
+- Test hooks in isolation
+- Mock external dependencies
+
+### Integration Tests
+- Test component interactions
+- Test with React Testing Library
+- Test accessibility
+'''
+    },
+    'backend-node': {
+        'title': 'Node.js Backend',
+        'description': 'Node.js specialist - Express/Fastify, APIs, and server-side development',
+        'expertise': ['Node.js', 'Express', 'Fastify', 'TypeScript', 'REST APIs', 'Middleware'],
+        'file_patterns': 'src/**/*.ts',
+        'lint_command': 'npm run lint --silent 2>/dev/null || true',
+        'best_practices': '''
+### API Design
+- Use RESTful conventions
+- Validate all inputs
+- Return consistent error formats
+- Use proper HTTP status codes
+
+### Code Structure
+- Separate routes, controllers, services
+- Use dependency injection
+- Handle errors with middleware
+- Log appropriately
+
+### Security
+- Never trust user input
+- Use parameterized queries
+- Implement rate limiting
+- Secure headers with helmet
+''',
+        'testing': '''
+### Unit Tests
+- Test services in isolation
+- Mock database and external services
+- Test edge cases
+
+### Integration Tests
+- Test API endpoints with supertest
+- Test with real database (test instance)
+- Test authentication flows
+'''
+    },
+    'testing-e2e': {
+        'title': 'E2E Testing',
+        'description': 'E2E testing specialist - Playwright, Puppeteer, and browser automation',
+        'expertise': ['Playwright', 'Puppeteer', 'Cypress', 'Browser Automation', 'Visual Testing'],
+        'file_patterns': 'tests/**/*.spec.ts',
+        'lint_command': 'npm run lint --silent 2>/dev/null || true',
+        'best_practices': '''
+### Test Design
+- Use Page Object Model
+- Keep tests independent
+- Use stable selectors (data-testid)
+- Test user journeys, not implementation
+
+### Reliability
+- Wait for elements properly
+- Handle flaky tests
+- Use retry mechanisms
+- Run tests in CI
+
+### Maintenance
+- Keep page objects updated
+- Remove duplicate tests
+- Organize by feature
+''',
+        'testing': '''
+### E2E Test Patterns
+- Happy path tests for critical flows
+- Error case handling
+- Cross-browser testing
+- Mobile viewport testing
+
+### Visual Regression
+- Baseline screenshots
+- Comparison thresholds
+- Update baselines intentionally
+'''
+    }
+}
@@ -10,40 +10,17 @@ This script:
 4. Updates sync state
 """
 
-import json
 import os
-import sys
-from pathlib import Path
 from datetime import datetime
 
-def load_sync_state():
-    """Load current sync state."""
-    state_path = Path('.company/sync-state.json')
-    if state_path.exists():
-        return json.loads(state_path.read_text())
-    return {
-        'last_updated': None,
-        'task_versions': {},
-        'pending_notifications': []
-    }
-
-def save_sync_state(state):
-    """Save sync state."""
-    state_path = Path('.company/sync-state.json')
-    state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state, indent=2))
+import hook_metrics
+import inbox
+import sync_state
+from task_index import load_task_index
 
 def write_notification(role, notification):
-    """Write notification to role's inbox."""
-    inbox_path = Path(f'.company/inboxes/{role}')
-    inbox_path.mkdir(parents=True, exist_ok=True)
-
-    timestamp = int(datetime.now().timestamp())
-    notif_type = notification.get('type', 'update')
-    notif_file = inbox_path / f'{timestamp}-{notif_type}.json'
-
-    notif_file.write_text(json.dumps(notification, indent=2))
-    return str(notif_file)
+    """Write notification to role's inbox (a JSON file or the role's log)."""
+    return inbox.deliver(role, notification)
 
 def determine_notifications(task_id, new_status, updated_by):
     """
@@ -62,8 +39,18 @@ def determine_notifications(task_id, new_status, updated_by):
             'timestamp': datetime.now().isoformat()
         }))
 
-        # Would also notify roles blocked by this task
-        # (requires querying task dependencies)
+        # Notify owners of tasks this completion unblocks
+        index = load_task_index()
+        if index is not None:
+            for task in index.unblocked_by(task_id):
+                if task['owner']:
+                    notifications.append((task['owner'], {
+                        'type': 'task_unblocked',
+                        'task_id': task['id'],
+                        'subject': task['subject'],
+                        'unblocked_by': task_id,
+                        'timestamp': datetime.now().isoformat()
+                    }))
 
     elif new_status == 'in_progress':
         # Notify orchestrator of task start
@@ -76,36 +63,50 @@ def determine_notifications(task_id, new_status, updated_by):
 
     return notifications
 
-def main():
-    # Get update info from environment
-    task_id = os.environ.get('TASK_ID')
-    new_status = os.environ.get('NEW_STATUS')
-    updated_by = os.environ.get('CURRENT_ROLE', 'unknown')
+def run(task_id, new_status, updated_by, backend=None, trace=hook_metrics.NO_TRACE):
+    """
+    Record one TaskUpdate: bump its version and notify roles.
+
+    `backend` lets the hook daemon pass its already-open sync state backend
+    instead of opening the configured one. Returns the lines to print.
+    """
+    output = []
 
     if not task_id:
         # No task ID, nothing to do
-        sys.exit(0)
+        return output
 
-    # Load sync state
-    state = load_sync_state()
+    if backend is None:
+        backend = sync_state.open_backend()
+    trace.mark('json_load')
 
     # Update task version
-    current_version = state['task_versions'].get(task_id, 0)
-    state['task_versions'][task_id] = current_version + 1
-    state['last_updated'] = datetime.now().isoformat()
+    version = backend.bump(task_id)
+    trace.mark('write')
 
     # Determine notifications
     notifications = determine_notifications(task_id, new_status, updated_by)
+    trace.mark('decision')
 
     # Write notifications
     for role, notification in notifications:
         notif_file = write_notification(role, notification)
-        print(f"Notified {role}: {notif_file}")
+        output.append(f"Notified {role}: {notif_file}")
+    trace.mark('write')
 
-    # Save sync state
-    save_sync_state(state)
+    output.append(f"Sync complete: task {task_id} version {version}")
+    return output
+
+def main():
+    # Get update info from environment
+    task_id = os.environ.get('TASK_ID')
+    new_status = os.environ.get('NEW_STATUS')
+    updated_by = os.environ.get('CURRENT_ROLE', 'unknown')
+    trace = hook_metrics.start('sync_notify', updated_by)
 
-    print(f"Sync complete: task {task_id} version {state['task_versions'][task_id]}")
+    for line in run(task_id, new_status, updated_by, trace=trace):
+        print(line)
+    trace.finish()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Sync state storage backends.
+
+Sync state tracks a version number per task, bumped on every TaskUpdate.
+The backend is chosen with the COMPANY_SYNC_BACKEND environment variable
+or company.sync.backend in .company/config.json:
+
+- json (default): .company/sync-state.json, rewritten under a file lock
+  so parallel hooks don't lose bumps.
+- sqlite: .company/sync-state.db in WAL mode. Each bump is a single
+  atomic upsert, so cost doesn't grow with the number of tasks and
+  several hook processes can write at once. A one-shot bump doesn't
+  touch sync-state.json, since rewriting it would bring back the
+  per-update cost of the whole file. The hook daemon exports it at most
+  once per EXPORT_INTERVAL seconds (and once more after a burst ends);
+  otherwise `sync_state.py export` writes it and `sync_state.py show`
+  prints the current state from either backend.
+
+Usage:
+    sync_state.py show            Print the current sync state as JSON
+    sync_state.py export [path]   Write the JSON view (default: .company/sync-state.json)
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import atomic_write
+from company_files import FileLock, config_setting, stat_key
+
+STATE_PATH = '.company/sync-state.json'
+DB_PATH = '.company/sync-state.db'
+
+# Minimum seconds between JSON exports from a long-lived sqlite backend
+EXPORT_INTERVAL = 2.0
+
+def empty_state():
+    return {
+        'last_updated': None,
+        'task_versions': {},
+        'pending_notifications': []
+    }
+
+def load_sync_state(state_path=STATE_PATH):
+    """Load current sync state."""
+    try:
+        with open(state_path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return empty_state()
+
+def save_sync_state(state, state_path=STATE_PATH):
+    """Atomically save sync state."""
+    atomic_write.write_json(state_path, state, indent=2)
+
+def backend_name():
+    """Return 'json' or 'sqlite' from the environment or company config."""
+    name = config_setting('COMPANY_SYNC_BACKEND', 'sync', 'backend')
+    return 'sqlite' if name == 'sqlite' else 'json'
+
+class JsonSyncState:
+    """
+    Sync state kept in sync-state.json.
+
+    The parsed state is kept in memory and only re-read when the file
+    changes, so a long-lived owner (the hook daemon) parses it once.
+    """
+
+    def __init__(self, state_path=STATE_PATH):
+        self.state_path = str(state_path)
+        self._state = None
+        self._key = None
+
+    def _current(self):
+        key = stat_key(self.state_path)
+        if self._state is None or key != self._key:
+            self._state = load_sync_state(self.state_path)
+            self._key = key
+        return self._state
+
+    def bump(self, task_id):
+        """Increment a task's version under the file lock. Returns the new version."""
+        with FileLock(f'{self.state_path}.lock'):
+            state = self._current()
+            state['task_versions'][task_id] = state['task_versions'].get(task_id, 0) + 1
+            state['last_updated'] = datetime.now().isoformat()
+            save_sync_state(state, self.state_path)
+            self._key = stat_key(self.state_path)
+            return state['task_versions'][task_id]
+
+    def export(self):
+        """Return the sync state as a dict."""
+        return self._current()
+
+    def flush(self, force=False):
+        """Nothing to do: every bump already rewrote sync-state.json."""
+        return False
+
+class SqliteSyncState:
+    """Sync state in a WAL-mode SQLite database with O(1) atomic bumps."""
+
+    def __init__(self, db_path=DB_PATH, state_path=STATE_PATH, export_interval=None):
+        """
+        `export_interval` is the minimum number of seconds between JSON
+        exports; owners that set it must call flush() periodically so the
+        last bumps of a burst still reach sync-state.json. With None, the
+        JSON view is only written by flush(force=True).
+        """
+        import sqlite3
+
+        self.db_path = str(db_path)
+        self.state_path = str(state_path)
+        self.export_interval = export_interval
+        self._exported_at = None
+        self._pending = False
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        is_new = not os.path.exists(self.db_path)
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS task_versions '
+                          '(task_id TEXT PRIMARY KEY, version INTEGER NOT NULL)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta '
+                          '(key TEXT PRIMARY KEY, value TEXT)')
+        if is_new:
+            self._import_json()
+
+    def _import_json(self):
+        """Seed a new database from an existing sync-state.json."""
+        try:
+            state = load_sync_state(self.state_path)
+        except ValueError:
+            return
+        self.conn.execute('BEGIN IMMEDIATE')
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO task_versions (task_id, version) VALUES (?, ?)',
+            state.get('task_versions', {}).items())
+        if state.get('last_updated'):
+            self._set_meta('last_updated', state['last_updated'])
+        self.conn.execute('COMMIT')
+
+    def _set_meta(self, key, value):
+        self.conn.execute('INSERT INTO meta (key, value) VALUES (?, ?) '
+                          'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                          (key, value))
+
+    def bump(self, task_id):
+        """Atomically increment a task's version. Returns the new version."""
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.conn.execute('INSERT INTO task_versions (task_id, version) VALUES (?, 1) '
+                              'ON CONFLICT(task_id) DO UPDATE SET version = version + 1',
+                              (task_id,))
+            version = self.conn.execute('SELECT version FROM task_versions WHERE task_id = ?',
+                                        (task_id,)).fetchone()[0]
+            self._set_meta('last_updated', datetime.now().isoformat())
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self._pending = True
+        self.flush()
+        return version
+
+    def export(self):
+        """Return the sync state in the sync-state.json layout."""
+        state = empty_state()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'last_updated'").fetchone()
+        state['last_updated'] = row[0] if row else None
+        state['task_versions'] = dict(self.conn.execute(
+            'SELECT task_id, version FROM task_versions ORDER BY rowid'))
+        return state
+
+    def flush(self, force=False):
+        """
+        Write the JSON view if this backend has bumps it hasn't exported
+        and the last export is export_interval old, or if `force`.
+        Returns True if it wrote. Without an export_interval, only a
+        forced flush writes.
+
+        The database is read under the state file's lock, so concurrent
+        exports can't leave an older snapshot on disk than a newer one.
+        """
+        if not self._pending:
+            return False
+        now = time.monotonic()
+        if not force and (self.export_interval is None or (
+                self._exported_at is not None and now - self._exported_at < self.export_interval)):
+            return False
+        with FileLock(f'{self.state_path}.lock'):
+            save_sync_state(self.export(), self.state_path)
+        self._pending = False
+        self._exported_at = now
+        return True
+
+def open_backend(export_interval=None):
+    """
+    Open the configured sync state backend. `export_interval` is passed to
+    the sqlite backend; see SqliteSyncState.
+    """
+    if backend_name() == 'sqlite':
+        return SqliteSyncState(export_interval=export_interval)
+    return JsonSyncState()
+
+def main():
+    command = sys.argv[1] if len(sys.argv) >= 2 else None
+    if command == 'show':
+        print(json.dumps(open_backend().export(), indent=2))
+    elif command == 'export':
+        output_path = sys.argv[2] if len(sys.argv) > 2 else STATE_PATH
+        save_sync_state(open_backend().export(), output_path)
+        print(f"Sync state written to: {output_path}")
+    else:
+        print("Usage: sync_state.py show | export [path]")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Index over the MCP task server's store (.company/tasks/task-{id}.json).
+
+Keeps each task's status, owner and dependency edges in a SQLite cache at
+.company/cache/tasks.db, so dependency questions are answered by indexed
+lookups instead of opening every task file. The store rewrites index.json
+on every create, update and delete; when its mtime or size changes the
+task files are stat-ed and only the ones that changed are re-read.
+
+Dependencies may be recorded on either side (a task's `blocks`, or the
+dependent's `blockedBy`); the index merges both.
+
+Usage:
+    task_index.py dependents <task_id>   Print tasks blocked by a task
+    task_index.py unblocked <task_id>    Print tasks unblocked if it completes
+"""
+
+import json
+import os
+import sys
+
+from company_files import stat_key
+
+TASKS_DIR = '.company/tasks'
+DB_PATH = '.company/cache/tasks.db'
+SCHEMA_VERSION = '1'
+
+# Statuses that no longer block dependents
+RESOLVED_STATUSES = ('completed', 'deleted')
+
+class TaskIndex:
+    """Cached task records and a two-way dependency map."""
+
+    def __init__(self, tasks_dir=TASKS_DIR, db_path=DB_PATH):
+        # Imported here so validate_task_update only pays for it on lookups
+        import sqlite3
+
+        self.tasks_dir = str(tasks_dir)
+        self.index_file = os.path.join(self.tasks_dir, 'index.json')
+        os.makedirs(os.path.dirname(str(db_path)) or '.', exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_schema()
+
+        # task_id -> (file_key, record), for long-lived processes
+        self._memo = {}
+
+    def _create_schema(self):
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row and row[0] == SCHEMA_VERSION:
+            return
+        self.conn.executescript('''
+            BEGIN IMMEDIATE;
+            DROP TABLE IF EXISTS tasks;
+            DROP TABLE IF EXISTS edges;
+            DELETE FROM meta;
+            CREATE TABLE tasks (
+                id TEXT PRIMARY KEY,
+                file_key TEXT NOT NULL,
+                subject TEXT,
+                status TEXT,
+                owner TEXT,
+                metadata TEXT
+            );
+            CREATE TABLE edges (source TEXT NOT NULL, blocker TEXT NOT NULL, blocked TEXT NOT NULL);
+            CREATE INDEX edges_source ON edges (source);
+            CREATE INDEX edges_blocker ON edges (blocker);
+            CREATE INDEX edges_blocked ON edges (blocked);
+            INSERT INTO meta (key, value) VALUES ('schema', '%s');
+            COMMIT;
+        ''' % SCHEMA_VERSION)
+
+    def _get_meta(self, key):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.conn.execute('INSERT INTO meta (key, value) VALUES (?, ?) '
+                          'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                          (key, value))
+
+    def task_path(self, task_id):
+        return os.path.join(self.tasks_dir, f'task-{task_id}.json')
+
+    def _store_task(self, task_id, file_key):
+        """
+        Re-read one task file into the index.
+
+        Returns False if the file is missing or mid-write (not valid JSON);
+        the task's cached entry is left for the next refresh to fix.
+        """
+        try:
+            with open(self.task_path(task_id)) as f:
+                task = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        self.conn.execute(
+            'INSERT OR REPLACE INTO tasks (id, file_key, subject, status, owner, metadata) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (task_id, file_key, task.get('subject'), task.get('status'), task.get('owner'),
+             json.dumps(task.get('metadata') or {})))
+        self.conn.execute('DELETE FROM edges WHERE source = ?', (task_id,))
+        self.conn.executemany(
+            'INSERT INTO edges (source, blocker, blocked) VALUES (?, ?, ?)',
+            [(task_id, task_id, str(other)) for other in task.get('blocks') or []] +
+            [(task_id, str(other), task_id) for other in task.get('blockedBy') or []])
+        return True
+
+    def _remove_task(self, task_id):
+        self.conn.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
+        self.conn.execute('DELETE FROM edges WHERE source = ?', (task_id,))
+
+    def refresh(self):
+        """
+        Bring the index up to date with the task store.
+
+        Does nothing unless index.json changed; otherwise re-reads only the
+        task files whose mtime or size differ from the cached entry.
+        """
+        store_key = stat_key(self.index_file)
+        if store_key is not None and store_key == self._get_meta('store_key'):
+            return
+
+        on_disk = {}
+        try:
+            with os.scandir(self.tasks_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('task-') and name.endswith('.json'):
+                        file_key = stat_key(entry)
+                        if file_key is not None:
+                            on_disk[name[5:-5]] = file_key
+        except OSError:
+            pass
+
+        cached = dict(self.conn.execute('SELECT id, file_key FROM tasks'))
+
+        complete = True
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            for task_id in cached.keys() - on_disk.keys():
+                self._remove_task(task_id)
+            for task_id, file_key in on_disk.items():
+                if cached.get(task_id) != file_key:
+                    complete = self._store_task(task_id, file_key) and complete
+            # Retry next time if a task file was caught mid-write
+            self._set_meta('store_key', store_key if complete else None)
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+
+    def task(self, task_id):
+        """Return the cached record for a task as a dict, or None."""
+        row = self.conn.execute('SELECT * FROM tasks WHERE id = ?', (str(task_id),)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        record['metadata'] = json.loads(record['metadata'] or '{}')
+        return record
+
+    def lookup(self, task_id):
+        """
+        Return the current record for one task, or None if it doesn't exist.
+
+        Costs one stat of the task file plus a primary-key lookup, however
+        many tasks the store holds; only this task's file is re-read, and
+        only if it changed. Doesn't need refresh().
+        """
+        task_id = str(task_id)
+        file_key = stat_key(self.task_path(task_id))
+        if file_key is None:
+            self._memo.pop(task_id, None)
+            return None
+
+        memo = self._memo.get(task_id)
+        if memo and memo[0] == file_key:
+            return memo[1]
+
+        record = self.task(task_id)
+        if record is None or record['file_key'] != file_key:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                stored = self._store_task(task_id, file_key)
+                self.conn.execute('COMMIT')
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+            if not stored:
+                return None
+            record = self.task(task_id)
+
+        self._memo[task_id] = (file_key, record)
+        return record
+
+    def dependents(self, task_id):
+        """Return the ids of tasks blocked by `task_id`."""
+        return {row[0] for row in self.conn.execute(
+            'SELECT blocked FROM edges WHERE blocker = ?', (str(task_id),))}
+
+    def blockers(self, task_id):
+        """Return the ids of tasks blocking `task_id`."""
+        return {row[0] for row in self.conn.execute(
+            'SELECT blocker FROM edges WHERE blocked = ?', (str(task_id),))}
+
+    def is_resolved(self, task_id):
+        """True if a task no longer blocks anything (completed, deleted or gone)."""
+        task = self.task(task_id)
+        return task is None or task['status'] in RESOLVED_STATUSES
+
+    def unblocked_by(self, task_id):
+        """
+        Return open tasks that `task_id` completing leaves with no open blockers.
+
+        `task_id` itself counts as completed, even if the store hasn't caught up.
+        """
+        task_id = str(task_id)
+        unblocked = []
+        for dependent_id in sorted(self.dependents(task_id), key=_id_order):
+            dependent = self.task(dependent_id)
+            if dependent is None or dependent['status'] in RESOLVED_STATUSES:
+                continue
+            if all(blocker == task_id or self.is_resolved(blocker)
+                   for blocker in self.blockers(dependent_id)):
+                unblocked.append(dependent)
+        return unblocked
+
+def _id_order(task_id):
+    """Sort numeric ids numerically, anything else after them."""
+    return (0, int(task_id), '') if task_id.isdigit() else (1, 0, task_id)
+
+def load_task_index(tasks_dir=TASKS_DIR, db_path=DB_PATH, refresh=True):
+    """
+    Return a TaskIndex, or None if there is no task store.
+
+    Pass refresh=False when only lookup() is needed, to skip the store scan.
+    """
+    if not os.path.isdir(tasks_dir):
+        return None
+    index = TaskIndex(tasks_dir, db_path)
+    if refresh:
+        index.refresh()
+    return index
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ('dependents', 'unblocked'):
+        print("Usage: task_index.py <dependents|unblocked> <task_id>")
+        sys.exit(1)
+
+    index = load_task_index()
+    if index is None:
+        print(f"No task store at {TASKS_DIR}")
+        sys.exit(1)
+
+    command, task_id = sys.argv[1], sys.argv[2]
+    if command == 'dependents':
+        tasks = [index.task(t) or {'id': t} for t in sorted(index.dependents(task_id), key=_id_order)]
+    else:
+        tasks = index.unblocked_by(task_id)
+    for task in tasks:
+        print(json.dumps({k: task.get(k) for k in ('id', 'subject', 'status', 'owner')}))
+
+if __name__ == '__main__':
+    main()
@@ -4,69 +4,125 @@ Validates handoff documents between roles.
 Ensures handoffs meet the required schema and quality standards.
 """
 
-import json
+import mmap
 import sys
+from bisect import bisect_left
 from pathlib import Path
 
-def load_governance_matrix():
-    """Load the governance matrix configuration."""
-    matrix_path = Path('.company/governance-matrix.json')
-    if matrix_path.exists():
-        return json.loads(matrix_path.read_text())
-    return None
+import hook_metrics
+from governance import load_governance
 
-def validate_handoff(handoff_path, from_role, to_role):
-    """
-    Validate a handoff document.
+# Section headings, as matched by the checks below (anywhere in a line)
+HEADING_MARKER = b'## '
 
-    Returns: (valid: bool, errors: list, warnings: list)
+class SectionIndex:
     """
-    errors = []
-    warnings = []
-
-    handoff_file = Path(handoff_path)
+    Offsets of every '## ' marker in a handoff document, found in one pass.
 
-    # Check file exists
-    if not handoff_file.exists():
-        return False, [f"Handoff file not found: {handoff_path}"], []
-
-    content = handoff_file.read_text()
+    Checks run against the index and search the underlying buffer in place,
+    so large handoffs (pasted logs, diffs) are never split or copied.
+    """
 
+    def __init__(self, buf):
+        self.buf = buf
+        self.offsets = []
+        offset = buf.find(HEADING_MARKER)
+        while offset != -1:
+            self.offsets.append(offset)
+            offset = buf.find(HEADING_MARKER, offset + len(HEADING_MARKER))
+
+    def find_heading(self, title):
+        """Return the offset of the first '## <title>', or -1."""
+        title = title.encode()
+        start = len(HEADING_MARKER)
+        for offset in self.offsets:
+            if self.buf[offset + start:offset + start + len(title)] == title:
+                return offset
+        return -1
+
+    def has_heading(self, title):
+        return self.find_heading(title) != -1
+
+    def section_bounds(self, title):
+        """
+        Return (start, end) of the text after '## <title>' up to the next
+        '## ' marker, or None if there is no such heading.
+        """
+        offset = self.find_heading(title)
+        if offset == -1:
+            return None
+        start = offset + len(HEADING_MARKER) + len(title.encode())
+        following = bisect_left(self.offsets, start)
+        end = self.offsets[following] if following < len(self.offsets) else len(self.buf)
+        return start, end
+
+    def contains(self, text, start=0, end=None):
+        """Check whether `text` occurs in buf[start:end]."""
+        end = len(self.buf) if end is None else end
+        return self.buf.find(text.encode(), start, end) != -1
+
+def _map_file(f):
+    """Memory-map an open file read-only; empty files can't be mapped."""
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return b''
+
+def check_content(index, from_role, to_role, errors, warnings):
+    """Run the section, checkbox and permission checks against a SectionIndex."""
     # Required sections
     required_sections = [
-        '## Deliverables',
-        '## Acceptance Criteria',
+        'Deliverables',
+        'Acceptance Criteria',
     ]
 
     for section in required_sections:
-        if section not in content:
-            errors.append(f"Missing required section: {section}")
+        if not index.has_heading(section):
+            errors.append(f"Missing required section: ## {section}")
 
     # Check for verification commands/section
-    if '## Verification' not in content and '```bash' not in content:
+    if not index.has_heading('Verification') and not index.contains('```bash'):
         warnings.append("No verification commands found")
 
     # Check acceptance criteria format (should have checkboxes)
-    if '## Acceptance Criteria' in content:
-        ac_section = content.split('## Acceptance Criteria')[1]
-        if '## ' in ac_section:
-            ac_section = ac_section.split('## ')[0]
-
-        if '- [ ]' not in ac_section and '- [x]' not in ac_section:
+    bounds = index.section_bounds('Acceptance Criteria')
+    if bounds:
+        if not index.contains('- [ ]', *bounds) and not index.contains('- [x]', *bounds):
             errors.append("Acceptance criteria should use checkbox format (- [ ] or - [x])")
 
     # Check handoff permissions
-    matrix = load_governance_matrix()
-    if matrix:
-        allowed = matrix.get('handoff_allowed', {})
-        allowed_targets = allowed.get(from_role, [])
-        if to_role not in allowed_targets:
+    governance = load_governance()
+    if governance:
+        if not governance.can_handoff(from_role, to_role):
             errors.append(f"Handoff not allowed: {from_role} -> {to_role}")
 
     # Check for context/summary
-    if '## Context' not in content and '## Summary' not in content:
+    if not index.has_heading('Context') and not index.has_heading('Summary'):
         warnings.append("Consider adding a Context or Summary section")
 
+def validate_handoff(handoff_path, from_role, to_role):
+    """
+    Validate a handoff document.
+
+    Returns: (valid: bool, errors: list, warnings: list)
+    """
+    errors = []
+    warnings = []
+
+    handoff_file = Path(handoff_path)
+
+    # Check file exists
+    if not handoff_file.exists():
+        return False, [f"Handoff file not found: {handoff_path}"], []
+
+    with open(handoff_file, 'rb') as f:
+        buf = _map_file(f)
+        try:
+            check_content(SectionIndex(buf), from_role, to_role, errors, warnings)
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
     valid = len(errors) == 0
     return valid, errors, warnings
 
@@ -78,8 +134,11 @@ def main():
     handoff_path = sys.argv[1]
     from_role = sys.argv[2]
     to_role = sys.argv[3]
+    trace = hook_metrics.start('validate_handoff', from_role)
 
     valid, errors, warnings = validate_handoff(handoff_path, from_role, to_role)
+    trace.mark('decision')
+    trace.finish(0 if valid else 1)
 
     if warnings:
         for warning in warnings:
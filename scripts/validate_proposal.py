@@ -2,19 +2,31 @@
 """
 Validates proposals against governance rules.
 Called by hooks or orchestrator to check if a proposal can be auto-approved.
+
+Batch and watch modes load governance and config once, decide every
+proposal not seen before, print one JSON decision per line, and add
+proposals needing a human to a priority-ordered review queue.
 """
 
+import argparse
+import hashlib
 import json
+import os
+import select
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
 
-def load_governance_matrix():
-    """Load the governance matrix configuration."""
-    matrix_path = Path('.company/governance-matrix.json')
-    if matrix_path.exists():
-        return json.loads(matrix_path.read_text())
-    return None
+import atomic_write
+import hook_metrics
+from governance import load_governance
+
+PENDING_DIR = Path('.company/proposals/pending')
+QUEUE_PATH = Path('.company/proposals/queue.json')
+SEEN_PATH = Path('.company/cache/proposals-seen.json')
+
+# Review queue order: CEO decisions first, then other reviews
+QUEUE_PRIORITY = {'CEO_REQUIRED': 0, 'REVIEW_REQUIRED': 1}
 
 def load_config():
     """Load company configuration."""
@@ -23,7 +35,7 @@ def load_config():
         return json.loads(config_path.read_text())
     return None
 
-def can_auto_approve(proposal, matrix, config):
+def can_auto_approve(proposal, governance, config):
     """
     Determine if a proposal can be auto-approved.
 
@@ -33,12 +45,8 @@ def can_auto_approve(proposal, matrix, config):
     from_role = proposal.get('from_role')
     target_role = proposal.get('target_role', proposal.get('payload', {}).get('target_role'))
 
-    auto_approve_rules = matrix.get('proposal_auto_approve', {})
-    needs_review = matrix.get('proposal_needs_review', {})
-    needs_ceo = matrix.get('proposal_needs_ceo', {})
-
     # Check if requires CEO
-    if proposal_type in needs_ceo and needs_ceo[proposal_type]:
+    if governance.needs_ceo(proposal_type):
         return False, f"Proposal type '{proposal_type}' requires CEO approval"
 
     if proposal.get('requires_ceo_approval'):
@@ -47,22 +55,19 @@ def can_auto_approve(proposal, matrix, config):
     # Check auto-approve rules
     if proposal_type == 'create_task':
         # Check task creation permissions
-        key = f"{from_role}_create_{target_role}_task"
-        if auto_approve_rules.get('developer_create_qa_task') and from_role == 'developer' and target_role == 'qa':
+        if governance.auto_approves('developer_create_qa_task') and from_role == 'developer' and target_role == 'qa':
             return True, "Developer can create QA tasks"
-        if auto_approve_rules.get('tech_lead_create_developer_task') and from_role == 'tech-lead' and target_role == 'developer':
+        if governance.auto_approves('tech_lead_create_developer_task') and from_role == 'tech-lead' and target_role == 'developer':
             return True, "Tech Lead can create Developer tasks"
 
         # Check task permissions matrix
-        task_perms = matrix.get('task_permissions', {}).get('create_task', {})
-        allowed_targets = task_perms.get(from_role, [])
-        if target_role in allowed_targets:
+        if governance.can_create_task(from_role, target_role):
             return True, f"{from_role} can create tasks for {target_role}"
 
         return False, f"{from_role} cannot auto-create tasks for {target_role}"
 
     if proposal_type == 'escalate':
-        if auto_approve_rules.get('escalate_up'):
+        if governance.auto_approves('escalate_up'):
             return True, "Escalations are auto-approved for routing"
         return False, "Escalation requires review"
 
@@ -71,7 +76,7 @@ def can_auto_approve(proposal, matrix, config):
         return True, "Expertise requests are auto-approved for evaluation"
 
     if proposal_type == 'reject_handoff':
-        if needs_review.get('reject_handoff'):
+        if governance.needs_review('reject_handoff'):
             return False, "Handoff rejections require review"
         return True, "Handoff rejection approved"
 
@@ -91,22 +96,295 @@ def validate_proposal_schema(proposal):
 
     return True, "Schema valid"
 
+def requires_ceo(proposal, governance):
+    """Check whether a proposal that can't be auto-approved needs the CEO."""
+    proposal_type = proposal.get('proposal_type')
+    return (governance.needs_ceo(proposal_type)
+            or bool(proposal.get('requires_ceo_approval'))
+            or proposal_type == 'scope_change')
+
+def decide_proposal(proposal, governance, config):
+    """
+    Decide one proposal for batch processing.
+
+    Returns: (decision, reason) where decision is AUTO_APPROVE,
+    REVIEW_REQUIRED, CEO_REQUIRED or INVALID.
+    """
+    valid, reason = validate_proposal_schema(proposal)
+    if not valid:
+        return 'INVALID', reason
+
+    if not governance:
+        return 'REVIEW_REQUIRED', "No governance matrix"
+
+    can_approve, reason = can_auto_approve(proposal, governance, config)
+    if can_approve:
+        return 'AUTO_APPROVE', reason
+    if requires_ceo(proposal, governance):
+        return 'CEO_REQUIRED', reason
+    return 'REVIEW_REQUIRED', reason
+
+def _read_json(path, default):
+    """Read a JSON file, or return `default` if it is missing or corrupt."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return default
+
+def _write_json(path, data):
+    """Atomically write `data` as JSON, skipping the write if it's unchanged."""
+    atomic_write.write_json(path, data, indent=2)
+
+def _parse_proposal(text):
+    """Parse proposal JSON. Returns (proposal, error)."""
+    try:
+        proposal = json.loads(text)
+    except json.JSONDecodeError as e:
+        return None, f"Invalid JSON in proposal: {e}"
+    if not isinstance(proposal, dict):
+        return None, "Proposal is not a JSON object"
+    return proposal, None
+
+def _stream_key(proposal, line):
+    """Identify a JSONL proposal by its id, or by its content if it has none."""
+    proposal_id = (proposal or {}).get('id') or (proposal or {}).get('proposal_id')
+    if proposal_id:
+        return f'id:{proposal_id}'
+    return 'sha1:' + hashlib.sha1(line.encode()).hexdigest()
+
+class StreamTail:
+    """
+    Reads JSONL from an open stream (stdin) across polls without closing it.
+
+    Each read_lines() returns the complete lines that arrived since the
+    last call; an unterminated last line is held back until its newline or
+    the end of the stream. Where the stream can't be polled (select() on
+    Windows only takes sockets), a poll blocks until the next line instead.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = b''
+        self.eof = False
+        self.pollable = True
+
+    def _ready(self, fd):
+        """Whether `fd` has data (or its end) to read, without blocking."""
+        try:
+            return bool(select.select([fd], [], [], 0)[0])
+        except (OSError, ValueError):
+            self.pollable = False
+            return False
+
+    def read_lines(self, wait):
+        """Read until the end of the stream if `wait`, else only what's already there."""
+        fd = self.stream.fileno()
+        while not self.eof and self.pollable and (wait or self._ready(fd)):
+            chunk = os.read(fd, 64 * 1024)
+            if chunk:
+                self.buffer += chunk
+            else:
+                self.eof = True
+        if not self.eof and not self.pollable:
+            chunk = self.stream.read() if wait else self.stream.readline()
+            self.buffer += chunk
+            self.eof = wait or not chunk
+        if self.eof:
+            data, self.buffer = self.buffer, b''
+        else:
+            end = self.buffer.rfind(b'\n') + 1
+            data, self.buffer = self.buffer[:end], self.buffer[end:]
+        return data.decode('utf-8', 'replace').splitlines()
+
+def _tail_file(path, seen, follow):
+    """
+    Return the lines appended to a JSONL file since the offset in `seen`.
+
+    `seen[path]` is [inode, offset]; a replaced or truncated file is read
+    from the start again. With `follow`, an unterminated last line is left
+    for the next poll, since it may still be being written.
+    """
+    key = str(path)
+    stat = os.stat(path)
+    inode, offset = seen.get(key) or [stat.st_ino, 0]
+    if inode != stat.st_ino or stat.st_size < offset:
+        offset = 0
+    if stat.st_size == offset:
+        seen[key] = [stat.st_ino, offset]
+        return []
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    if follow:
+        data = data[:data.rfind(b'\n') + 1]
+    seen[key] = [stat.st_ino, offset + len(data)]
+    return data.decode('utf-8', 'replace').splitlines()
+
+def iter_unseen_proposals(source, seen, follow=False):
+    """
+    Yield (source_key, proposal, error) for proposals not in `seen`.
+
+    `source` is a directory of *.json proposals, a JSONL file, or a
+    StreamTail over stdin. Files count as seen while their mtime and size
+    are unchanged, and keys of files that have left a watched directory
+    are dropped from `seen`. A JSONL file is tailed from the byte offset
+    reached last time, so each line is decided once. `follow` is set when
+    polling, so partial lines are left for the next poll.
+    """
+    if isinstance(source, StreamTail) or not Path(source).is_dir():
+        if isinstance(source, StreamTail):
+            lines = source.read_lines(wait=not follow)
+        else:
+            lines = _tail_file(source, seen, follow)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            proposal, error = _parse_proposal(line)
+            yield _stream_key(proposal, line), proposal, error
+        return
+
+    if source != '-' and Path(source).is_dir():
+        present = set()
+        for path in sorted(Path(source).glob('*.json')):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            key = str(path)
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            present.add(key)
+            if seen.get(key) == stamp:
+                continue
+            seen[key] = stamp
+            try:
+                proposal, error = _parse_proposal(path.read_text())
+            except OSError as e:
+                proposal, error = None, str(e)
+            yield key, proposal, error
+
+        prefix = str(Path(source)) + os.sep
+        for key in [k for k in seen if k.startswith(prefix) and k not in present]:
+            del seen[key]
+
+def process_proposals(source, governance, config, seen, follow=False):
+    """
+    Decide every unseen proposal in `source`, printing one JSON line each.
+
+    A proposal that can't be decided (say, a payload that isn't an object)
+    is reported as INVALID and still marked seen, so it can't stop the rest
+    of the batch or fail every later run. Returns the decisions that need
+    review, for the queue.
+    """
+    needs_review = []
+    for key, proposal, error in iter_unseen_proposals(source, seen, follow):
+        if error:
+            decision, reason = 'INVALID', error
+        else:
+            try:
+                decision, reason = decide_proposal(proposal, governance, config)
+            except Exception as e:
+                decision, reason = 'INVALID', f"Could not decide proposal: {type(e).__name__}: {e}"
+
+        record = {
+            'source': key,
+            'decision': decision,
+            'reason': reason,
+            'proposal_type': (proposal or {}).get('proposal_type'),
+            'from_role': (proposal or {}).get('from_role'),
+            'timestamp': (proposal or {}).get('timestamp')
+        }
+        print(json.dumps(record), flush=True)
+        if decision in QUEUE_PRIORITY:
+            needs_review.append(record)
+    return needs_review
+
+def _is_resolved(item):
+    """Check whether a queued proposal file has left the pending directory."""
+    source = item['source']
+    return not source.startswith(('id:', 'sha1:')) and not os.path.exists(source)
+
+def update_review_queue(records, queue_path=QUEUE_PATH):
+    """
+    Merge `records` into the review queue, ordered by priority then timestamp.
+
+    Queued proposal files that have since been moved out of the pending
+    directory (approved or rejected) are dropped.
+    """
+    existing = _read_json(queue_path, [])
+    queue = {item['source']: item for item in existing if not _is_resolved(item)}
+    for record in records:
+        queue[record['source']] = {**record, 'priority': QUEUE_PRIORITY[record['decision']]}
+    ordered = sorted(queue.values(),
+                     key=lambda item: (item['priority'], str(item.get('timestamp') or '')))
+    if ordered != existing:
+        _write_json(queue_path, ordered)
+
+def run_batch(source, watch=False, interval=2.0):
+    """Process `source` once, or keep polling it for new proposals if `watch`."""
+    governance = load_governance()
+    config = load_config()
+    # Drop per-line keys that older versions kept for every JSONL proposal
+    seen = {key: stamp for key, stamp in _read_json(SEEN_PATH, {}).items()
+            if not key.startswith(('id:', 'sha1:'))}
+    if source == '-':
+        source = StreamTail(sys.stdin.buffer)
+
+    while True:
+        seen_before = dict(seen)
+        update_review_queue(process_proposals(source, governance, config, seen, follow=watch))
+        if seen != seen_before:
+            _write_json(SEEN_PATH, seen)
+        if not watch or (isinstance(source, StreamTail) and source.eof):
+            return
+        time.sleep(interval)
+        # Pick up governance edits without re-parsing an unchanged matrix
+        governance = load_governance()
+
+def parse_args(argv):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        usage='validate_proposal.py <proposal_file> | --batch <dir|file.jsonl|-> | --watch [dir]',
+        description='Check proposals against governance rules.')
+    parser.add_argument('proposal_file', nargs='?', help='single proposal to validate')
+    parser.add_argument('--batch', metavar='SOURCE',
+                        help='decide every unseen proposal in a directory, JSONL file, or - for stdin')
+    parser.add_argument('--watch', nargs='?', const=str(PENDING_DIR), metavar='DIR',
+                        help=f'keep processing new proposals in DIR (default: {PENDING_DIR})')
+    parser.add_argument('--interval', type=float, default=2.0, metavar='SECONDS',
+                        help='polling interval for --watch')
+    return parser.parse_args(argv)
+
 def main():
-    if len(sys.argv) < 2:
+    args = parse_args(sys.argv[1:])
+
+    if args.batch or args.watch:
+        try:
+            run_batch(args.watch or args.batch, watch=bool(args.watch), interval=args.interval)
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    if not args.proposal_file:
         print("Usage: validate_proposal.py <proposal_file>")
         sys.exit(1)
 
-    proposal_path = Path(sys.argv[1])
+    proposal_path = Path(args.proposal_file)
 
     if not proposal_path.exists():
         print(f"ERROR: Proposal file not found: {proposal_path}")
         sys.exit(1)
 
+    trace = hook_metrics.start('validate_proposal', 'unknown')
     try:
         proposal = json.loads(proposal_path.read_text())
     except json.JSONDecodeError as e:
         print(f"ERROR: Invalid JSON in proposal: {e}")
         sys.exit(1)
+    trace.mark('json_load')
 
     # Validate schema
     valid, reason = validate_proposal_schema(proposal)
@@ -115,16 +393,19 @@ def main():
         sys.exit(1)
 
     # Load governance rules
-    matrix = load_governance_matrix()
+    governance = load_governance()
     config = load_config()
+    trace.mark('matrix_parse')
 
-    if not matrix:
+    if not governance:
         print("WARNING: No governance matrix found, defaulting to require review")
         print("REVIEW_REQUIRED: No governance matrix")
         sys.exit(0)
 
     # Check auto-approve
-    can_approve, reason = can_auto_approve(proposal, matrix, config)
+    can_approve, reason = can_auto_approve(proposal, governance, config)
+    trace.mark('decision')
+    trace.finish(role=proposal.get('from_role'))
 
     if can_approve:
         print(f"AUTO_APPROVE: {reason}")
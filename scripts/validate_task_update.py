@@ -11,34 +11,59 @@ Environment variables expected:
 import json
 import os
 import sys
-from pathlib import Path
 
-def load_governance_matrix():
-    """Load the governance matrix configuration."""
-    matrix_path = Path('.company/governance-matrix.json')
-    if matrix_path.exists():
-        return json.loads(matrix_path.read_text())
-    return None
+import hook_metrics
+from governance import load_governance
+from task_index import load_task_index
+
+# Per-task rules used unless the task's metadata has a 'governance' entry.
+# 'owner' stands for the task's owner.
+DEFAULT_TASK_GOVERNANCE = {
+    'can_update': ['owner', 'tech-lead', 'senior-dev'],
+    'can_complete': ['owner', 'tech-lead'],
+}
+
+# Roles that may reassign and edit any task
+REASSIGN_ROLES = ['tech-lead', 'orchestrator']
+
+_task_index = None
 
 def get_task_metadata(task_id):
     """
-    Get task metadata. In practice, this would query the task system.
-    For now, we'll check if there's a metadata file.
+    Get a task's owner, status and governance rules from the task store.
+
+    Looked up through the task index (an on-disk cache plus an in-process
+    memo, both keyed by the task file's mtime), so this costs one stat
+    however many tasks exist. Unknown tasks have owner None.
     """
-    # This is a simplified implementation
-    # In practice, would need to integrate with actual task system
-    return {
-        'owner': None,  # Unknown without task system query
-        'governance': {
-            'can_update': ['owner', 'tech-lead', 'senior-dev'],
-            'can_complete': ['owner', 'tech-lead'],
+    global _task_index
+    if _task_index is None:
+        _task_index = load_task_index(refresh=False)
+
+    task = _task_index.lookup(task_id) if _task_index else None
+    if task is None:
+        return {
+            'owner': None,
+            'status': None,
+            'governance': DEFAULT_TASK_GOVERNANCE,
         }
+
+    rules = dict(DEFAULT_TASK_GOVERNANCE)
+    if isinstance(task['metadata'].get('governance'), dict):
+        rules.update(task['metadata']['governance'])
+    return {
+        'owner': task['owner'],
+        'status': task['status'],
+        'governance': rules,
     }
 
-def validate_update(tool_input, current_role, matrix):
+def validate_update(tool_input, current_role, governance, task=None):
     """
     Validate if the current role can perform this task update.
 
+    `task` is the task's metadata; looked up with get_task_metadata() if
+    not given. Unowned tasks can be acted on by any role as their owner.
+
     Returns: (allowed: bool, reason: str)
     """
     task_id = tool_input.get('taskId')
@@ -47,61 +72,85 @@ def validate_update(tool_input, current_role, matrix):
     if not task_id:
         return True, "No task ID, allowing"
 
-    # Get task permissions from governance
-    task_perms = matrix.get('task_permissions', {})
+    if task is None:
+        task = get_task_metadata(task_id)
+    owner = task['owner']
+    is_owner = owner is None or current_role == owner
+
+    def permitted(roles):
+        return current_role in roles or (is_owner and 'owner' in roles)
 
     # Check status update permissions
     if new_status == 'completed':
-        allowed_roles = task_perms.get('complete_task', ['owner', 'senior-dev', 'tech-lead'])
-        if current_role in allowed_roles or 'owner' in allowed_roles:
-            return True, f"Role {current_role} can complete tasks"
-        return False, f"Role {current_role} cannot complete tasks"
+        if permitted(governance.complete_roles) or permitted(task['governance']['can_complete']):
+            return True, f"Role {current_role} can complete task {task_id}"
+        return False, f"Role {current_role} cannot complete task {task_id} (owner: {owner})"
 
     if new_status == 'in_progress':
-        # Generally allowed for claiming tasks
-        return True, "Starting task is allowed"
+        # Generally allowed for claiming tasks, but not someone else's
+        if permitted(task['governance']['can_update']):
+            return True, "Starting task is allowed"
+        return False, f"Role {current_role} cannot start task {task_id} owned by {owner}"
 
     if new_status == 'deleted':
-        allowed_roles = task_perms.get('delete_task', ['tech-lead', 'architect', 'cto'])
-        if current_role in allowed_roles:
+        if governance.can_delete(current_role):
             return True, f"Role {current_role} can delete tasks"
         return False, f"Role {current_role} cannot delete tasks"
 
+    if current_role in REASSIGN_ROLES:
+        return True, "Update allowed"
+
     # Check if modifying another's task
-    if tool_input.get('owner') and current_role not in ['tech-lead', 'orchestrator']:
-        return False, "Only tech-lead or orchestrator can reassign tasks"
+    new_owner = tool_input.get('owner')
+    if new_owner:
+        # Claiming an unowned task for yourself is fine
+        if not (owner is None and new_owner == current_role):
+            return False, "Only tech-lead or orchestrator can reassign tasks"
+
+    if not permitted(task['governance']['can_update']):
+        return False, f"Role {current_role} cannot update task {task_id} owned by {owner}"
 
     return True, "Update allowed"
 
-def main():
-    # Get tool input from environment or stdin
-    tool_input_str = os.environ.get('TOOL_INPUT', '{}')
-    current_role = os.environ.get('CURRENT_ROLE', 'unknown')
+def run(tool_input_str, current_role, loader=load_governance, trace=hook_metrics.NO_TRACE):
+    """
+    Decide one TaskUpdate hook call.
 
+    Shared by main() and the hook daemon. Returns: (exit_code: int, message: str)
+    """
     try:
         tool_input = json.loads(tool_input_str)
     except json.JSONDecodeError:
         # If no valid input, allow (hook might be called differently)
-        print("ALLOWED: No parseable input")
-        sys.exit(0)
+        return 0, "ALLOWED: No parseable input"
+    trace.mark('json_load')
 
     # Load governance
-    matrix = load_governance_matrix()
+    governance = loader()
+    trace.mark('matrix_parse')
 
-    if not matrix:
+    if not governance:
         # No governance, allow all
-        print("ALLOWED: No governance matrix")
-        sys.exit(0)
+        return 0, "ALLOWED: No governance matrix"
 
     # Validate
-    allowed, reason = validate_update(tool_input, current_role, matrix)
+    allowed, reason = validate_update(tool_input, current_role, governance)
+    trace.mark('decision')
 
     if allowed:
-        print(f"ALLOWED: {reason}")
-        sys.exit(0)
-    else:
-        print(f"BLOCKED: {reason}")
-        sys.exit(1)
+        return 0, f"ALLOWED: {reason}"
+    return 1, f"BLOCKED: {reason}"
+
+def main():
+    # Get tool input from environment or stdin
+    tool_input_str = os.environ.get('TOOL_INPUT', '{}')
+    current_role = os.environ.get('CURRENT_ROLE', 'unknown')
+    trace = hook_metrics.start('validate_task_update', current_role)
+
+    exit_code, message = run(tool_input_str, current_role, trace=trace)
+    print(message)
+    trace.finish(exit_code)
+    sys.exit(exit_code)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,51 @@
+const { execFileSync } = require('child_process');
+const path = require('path');
+const fs = require('fs');
+const os = require('os');
+
+const SCRIPTS_DIR = path.join(__dirname, '..', 'scripts');
+const PYTHON = process.env.PYTHON || (process.platform === 'win32' ? 'python' : 'python3');
+
+function runScript(script, args, input, cwd) {
+  return execFileSync(PYTHON, [path.join(SCRIPTS_DIR, script), ...args], {
+    cwd,
+    input,
+    encoding: 'utf8',
+    timeout: 30000
+  });
+}
+
+describe('evaluate_expertise.py --batch', () => {
+  let tempDir;
+
+  beforeEach(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'cvc-batch-'));
+  });
+
+  afterEach(() => {
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  test('goals with colliding ids never share an assessment file', () => {
+    const goals = [
+      { id: 'a/b', goal: 'Build a React dashboard' },
+      { id: 'a-b', goal: 'Add a Go service' },
+      { id: 'a-b', goal: 'Add a Redis cache' }
+    ].map(goal => JSON.stringify(goal)).join('\n');
+
+    const records = runScript('evaluate_expertise.py', ['--batch', '-'], goals, tempDir)
+      .trim().split('\n').map(line => JSON.parse(line));
+
+    expect(records).toHaveLength(3);
+    const [slashed, dashed, duplicate] = records;
+    expect(slashed.assessment).toBeDefined();
+    expect(dashed.assessment).toBeDefined();
+    expect(slashed.assessment).not.toBe(dashed.assessment);
+    expect(duplicate.assessment).toBeUndefined();
+    expect(duplicate.error).toContain('Duplicate goal id');
+
+    const written = JSON.parse(fs.readFileSync(path.join(tempDir, dashed.assessment), 'utf8'));
+    expect(written.gaps.map(gap => gap.domain)).toEqual(dashed.gaps);
+    expect(dashed.gaps).not.toEqual(slashed.gaps);
+  });
+});